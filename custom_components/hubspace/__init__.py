@@ -17,6 +17,7 @@ from .const import (
     POLLING_TIME_STR,
 )
 from .services import async_register_services
+from .snapshot import DeviceSnapshotStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -147,3 +148,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if len(hass.data[DOMAIN]) == 0:
         hass.data.pop(DOMAIN)
     return unload_success
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the device snapshot of a config entry."""
+    await DeviceSnapshotStore(hass, entry.entry_id).async_remove()
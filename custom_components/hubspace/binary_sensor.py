@@ -2,19 +2,19 @@
 
 import logging
 
-from aioafero import EventType
 from aioafero.v1 import AferoController, AferoModelResource
-from aioafero.v1.models import AferoBinarySensor
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .bridge import HubspaceBridge
 from .const import BINARY_SENSORS, DOMAIN
+from .discovery import DiscoveredEntity
 from .entity import HubspaceBaseEntity
 
 LOGGER = logging.getLogger(__name__)
@@ -49,11 +49,11 @@ class AferoBinarySensorEntity(HubspaceBaseEntity, BinarySensorEntity):
 
 
 def get_sensors(
-    bridge: HubspaceBridge, controller: AferoController, resource: AferoModelResource
+    bridge: HubspaceBridge, entities: list[DiscoveredEntity]
 ) -> list[AferoBinarySensorEntity]:
-    """Get all binary sensors for a given resource."""
+    """Get all known binary sensors of the discovered entities."""
     sensor_entities = []
-    for sensor in resource.binary_sensors:
+    for controller, resource, sensor in entities:
         if sensor not in BINARY_SENSORS:
             LOGGER.warning(
                 "Unknown sensor %s found in %s %s. Please open a bug report",
@@ -76,44 +76,17 @@ async def async_setup_entry(
     """Set up entities."""
     bridge: HubspaceBridge = hass.data[DOMAIN][config_entry.entry_id]
 
-    # add all current items in controller
-    sensor_entities = []
-    for controller in bridge.api.controllers:
-        # Listen for new devices
-        config_entry.async_on_unload(
-            controller.subscribe(
-                await generate_callback(bridge, controller, async_add_entities),
-                event_filter=EventType.RESOURCE_ADDED,
-            )
-        )
-        # Add any currently tracked entities
-        for resource in controller:
-            if not hasattr(resource, "binary_sensors"):
-                continue
-            if sensors := get_sensors(bridge, controller, resource):
-                async_add_entities(sensors)
-
-    async_add_entities(sensor_entities)
-
-
-async def generate_callback(bridge, controller, async_add_entities: callback):
-    """Generate a callback function for handling new binary sensor entities.
-
-    Args:
-        bridge: HubspaceBridge instance for managing device communication
-        controller: AferoController instance managing the device
-        async_add_entities: Callback function to register new entities
-
-    Returns:
-        Callback function that adds new binary sensor entities when resources are added
-
-    """
-
-    async def add_entity_controller(
-        event_type: EventType, resource: AferoBinarySensor
-    ) -> None:
-        """Add an entity."""
-        if sensors := get_sensors(bridge, controller, resource):
+    @callback
+    def async_add_entity(platform: Platform, entities: list[DiscoveredEntity]) -> None:
+        """Add the binary sensors of a new resource."""
+        if sensors := get_sensors(bridge, entities):
             async_add_entities(sensors)
 
-    return add_entity_controller
+    # Add any currently tracked entities
+    async_add_entities(
+        get_sensors(bridge, bridge.discovery.entities(Platform.BINARY_SENSOR))
+    )
+    # Listen for new devices
+    config_entry.async_on_unload(
+        bridge.discovery.async_add_listener(async_add_entity, Platform.BINARY_SENSOR)
+    )
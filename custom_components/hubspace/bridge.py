@@ -1,9 +1,12 @@
 """Bridge knows how to interact with aioafero to update data."""
 
 import asyncio
+import contextlib
+from functools import partial
 import logging
 from pathlib import Path
-from typing import Any, Callable
+import time
+from typing import Any, Awaitable, Callable
 
 from aioafero import EventType, InvalidAuth, InvalidResponse
 from aioafero.v1 import AferoBridgeV1
@@ -11,12 +14,57 @@ import aiohttp
 from aiohttp import client_exceptions
 from homeassistant import core
 from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_TIMEOUT, CONF_TOKEN, CONF_USERNAME
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_TIMEOUT,
+    CONF_TOKEN,
+    CONF_USERNAME,
+    EVENT_HOMEASSISTANT_CLOSE,
+    EVENT_HOMEASSISTANT_STOP,
+)
 from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
 from homeassistant.helpers import aiohttp_client
-
-from .const import DOMAIN, PLATFORMS, POLLING_TIME_STR
-from .device import async_setup_devices
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util import ssl as ssl_util
+
+from .coalescer import StateWriteCoalescer
+from .commands import CommandScheduler, is_batchable
+from .const import (
+    AUTH_REFRESH_ATTEMPTS,
+    AUTH_REFRESH_RETRY_MAX_SEC,
+    AUTH_REFRESH_RETRY_MIN_SEC,
+    CONNECT_RETRY_MAX_SEC,
+    CONNECT_RETRY_MIN_SEC,
+    DEDICATED_SESSION_STR,
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_POLLING_MAX_SEC,
+    DEFAULT_POLLING_MIN_SEC,
+    DEFAULT_POLLING_MODE,
+    DEFAULT_REQUESTS_PER_SECOND,
+    DOMAIN,
+    MAX_IN_FLIGHT_STR,
+    OPTIMISTIC_STATE_TIMEOUT_POLLS,
+    POLLING_MAX_STR,
+    POLLING_MIN_STR,
+    POLLING_MODE_ADAPTIVE,
+    POLLING_MODE_STR,
+    POLLING_TIME_STR,
+    REQUESTS_PER_SECOND_STR,
+    SESSION_DNS_CACHE_TTL_SEC,
+    SESSION_KEEPALIVE_SEC,
+)
+from .coordinator import async_get_poll_coordinator
+from .delta import DeviceDeltaFilter
+from .device import DeviceContext, async_setup_devices
+from .discovery import EntityDiscovery
+from .limiter import PRIORITY_COMMAND, PRIORITY_POLL, RequestLimiter
+from .metrics import BridgeMetrics
+from .optimistic import OptimisticStateTracker
+from .platforms import PlatformLoader
+from .polling import AdaptivePollingScheduler
+from .profiler import PollProfiler
+from .router import EventRouter
+from .snapshot import DeviceSnapshotStore
 
 
 def mock_get_data(filename: str) -> dict:
@@ -53,71 +101,463 @@ class HubspaceBridge:
         self.reset_jobs: list[core.CALLBACK_TYPE] = []
         # self.sensor_manager: SensorManager | None = None
         self.logger = logging.getLogger(__name__)
-        polling_interval = int(self.config_entry.options[POLLING_TIME_STR])
+        self.polling_interval = int(self.config_entry.options[POLLING_TIME_STR])
+        max_in_flight = int(
+            self.config_entry.options.get(MAX_IN_FLIGHT_STR, DEFAULT_MAX_IN_FLIGHT)
+        )
+        # Keep the connections of the account apart from other integrations
+        self.session: aiohttp.ClientSession | None = None
+        self._session_close_unsub: core.CALLBACK_TYPE | None = None
+        if self.config_entry.options.get(DEDICATED_SESSION_STR, False):
+            self.session = create_session(max_in_flight)
+            # Close the connections even if the entry is never unloaded
+            self._session_close_unsub = hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_CLOSE, self._async_close_session_on_shutdown
+            )
         # store actual api connection to bridge as api
         self.api = AferoBridgeV1(
             self.config_entry.data[CONF_USERNAME],
             self.config_entry.data[CONF_PASSWORD],
             refresh_token=self.config_entry.data[CONF_TOKEN],
-            session=aiohttp_client.async_get_clientsession(hass),
-            polling_interval=polling_interval,
+            session=self.session or aiohttp_client.async_get_clientsession(hass),
+            polling_interval=self.polling_interval,
         )
+        # Group state writes from a single poll together
+        self.write_coalescer = StateWriteCoalescer(hass)
+        self.optimistic_tracker = OptimisticStateTracker(hass)
+        self.metrics = BridgeMetrics()
+        # Every request to the API waits on the limits of the account
+        self.limiter = RequestLimiter(
+            hass,
+            max_in_flight,
+            float(
+                self.config_entry.options.get(
+                    REQUESTS_PER_SECOND_STR, DEFAULT_REQUESTS_PER_SECOND
+                )
+            ),
+            self.metrics.async_queue_waited,
+        )
+        # Polls are spread with the other accounts
+        self.poll_coordinator = async_get_poll_coordinator(hass)
+        # Merge commands sent to the same device
+        self.command_scheduler = CommandScheduler(hass, limiter=self.limiter)
+        # Skip devices that did not change since the previous poll
+        self.delta_filter = DeviceDeltaFilter()
+        # Duration of the latest fetch from the API in milliseconds
+        self._fetch_duration: float = 0
+        # Fetches the devices without staggering, replaced once polls are hooked
+        self._fetch_data: Callable[[], Awaitable[list[dict]]] = self.api.fetch_data
+        self.profiler: PollProfiler | None = None
+        # Devices from the previous run to start without waiting on the cloud
+        self.snapshot = DeviceSnapshotStore(hass, config_entry.entry_id)
+        # Devices were restored from the snapshot and the cloud did not respond yet
+        self.awaiting_cloud = False
+        self._connect_task: asyncio.Task | None = None
+        self._auth_refresh_task: asyncio.Task | None = None
+        # Config entry as applied to the bridge, to tell apart token updates
+        self.entry_data: dict[str, Any] = dict(config_entry.data)
+        self.entry_options: dict[str, Any] = dict(config_entry.options)
+        # Attributes shared by the entities of each device, by parent_id
+        self.device_contexts: dict[str, DeviceContext] = {}
+        # Send resource updates to their entities
+        self.router = EventRouter()
+        # Entities provided by the resources, grouped by platform
+        self.discovery = EntityDiscovery(self.api)
+        # Only platforms with resources are set up
+        self.platforms = PlatformLoader(hass, config_entry, self.discovery)
+        self.adaptive_polling: AdaptivePollingScheduler | None = None
+        self._adaptive_polling_unsub: core.CALLBACK_TYPE | None = None
+        if (
+            self.config_entry.options.get(POLLING_MODE_STR, DEFAULT_POLLING_MODE)
+            == POLLING_MODE_ADAPTIVE
+        ):
+            self.adaptive_polling = AdaptivePollingScheduler(
+                hass,
+                self.api.set_polling_interval,
+                self._async_poll,
+                *self._polling_bounds,
+            )
         # store (this) bridge object in hass data
         hass.data.setdefault(DOMAIN, {})[self.config_entry.entry_id] = self
 
     async def async_initialize_bridge(self) -> bool:
         """Initialize Connection with the Hubspace API."""
-
-        def reauth(*args, **kwargs) -> None:
-            self.config_entry.async_start_reauth(self.hass)
-
         setup_ok = False
 
         # Dev mocking
         # self.api.fetch_data = mock_get_data("portable-ac-raw.json")
 
-        try:
-            async with asyncio.timeout(self.config_entry.options[CONF_TIMEOUT]):
-                await self.api.initialize()
-            setup_ok = True
-        except (InvalidAuth, InvalidResponse):
-            # Credentials have changed. Force a re-login
-            reauth()
-            return False
-        except (
-            TimeoutError,
-            client_exceptions.ClientOSError,
-            client_exceptions.ServerDisconnectedError,
-            client_exceptions.ContentTypeError,
-        ) as err:
-            raise ConfigEntryNotReady(
-                f"Error connecting to the Hubspace API: {err}"
-            ) from err
-        except Exception:
-            self.logger.exception("Unknown error connecting to the Hubspace API")
-            return False
-        finally:
-            if not setup_ok:
-                await self.api.close()
+        if snapshot := await self.snapshot.async_load():
+            # Connect in the background so a slow cloud does not delay startup
+            await self._async_restore_snapshot(snapshot)
+        else:
+            try:
+                async with asyncio.timeout(self.config_entry.options[CONF_TIMEOUT]):
+                    await self.api.initialize()
+                setup_ok = True
+            except (InvalidAuth, InvalidResponse):
+                # Credentials have changed. Force a re-login
+                self._async_start_reauth()
+                return False
+            except (
+                TimeoutError,
+                client_exceptions.ClientOSError,
+                client_exceptions.ServerDisconnectedError,
+                client_exceptions.ContentTypeError,
+            ) as err:
+                raise ConfigEntryNotReady(
+                    f"Error connecting to the Hubspace API: {err}"
+                ) from err
+            except Exception:
+                self.logger.exception("Unknown error connecting to the Hubspace API")
+                return False
+            finally:
+                if not setup_ok:
+                    await self.api.close()
+                    await self.async_close_session()
 
+        self.config_entry.async_on_unload(
+            self.delta_filter.async_attach(self.api.events)
+        )
         # Subscribe to invalid_auth events
         self.config_entry.async_on_unload(
-            self.api.events.subscribe(reauth, event_filter=EventType.INVALID_AUTH)
+            self.api.events.subscribe(
+                self._async_auth_failed, event_filter=EventType.INVALID_AUTH
+            )
+        )
+        # Stop waiting on the cloud once Home Assistant is stopping
+        self.config_entry.async_on_unload(
+            self.hass.bus.async_listen(
+                EVENT_HOMEASSISTANT_STOP, self._async_cancel_pending
+            )
+        )
+        self.config_entry.async_on_unload(
+            self.poll_coordinator.async_register(self.config_entry.entry_id)
         )
+        self._async_hook_polls()
+        if self.adaptive_polling:
+            self._async_setup_adaptive_polling()
+        self.config_entry.async_on_unload(self._async_stop_adaptive_polling)
+        if self.awaiting_cloud:
+            self._connect_task = self.hass.async_create_background_task(
+                self._async_connect(), "hubspace-connect"
+            )
         # Init devices
         await async_setup_devices(self)
-        await self.hass.config_entries.async_forward_entry_setups(
-            self.config_entry, PLATFORMS
-        )
+        for unsubscribe in self.discovery.async_setup():
+            self.config_entry.async_on_unload(unsubscribe)
+        self.config_entry.async_on_unload(self.router.async_clear)
+        await self.platforms.async_setup()
         # add listener for config entry updates.
         self.reset_jobs.append(self.config_entry.add_update_listener(_update_listener))
         self.authorized = True
         return True
 
+    async def _async_restore_snapshot(self, snapshot: list[dict]) -> None:
+        """Create the resources from the devices of the previous run.
+
+        Entities are unavailable until the cloud confirms their state.
+        """
+        self.logger.debug("Restoring %s devices from the snapshot", len(snapshot))
+        for controller in self.api.controllers:
+            if not controller.initialized:
+                await controller.initialize()
+        await self.api.events.generate_events_from_data(snapshot)
+        self.awaiting_cloud = True
+
+    async def _async_connect(self) -> None:
+        """Connect to the Hubspace API until it succeeds."""
+        retry = CONNECT_RETRY_MIN_SEC
+        while True:
+            try:
+                async with asyncio.timeout(self.config_entry.options[CONF_TIMEOUT]):
+                    await self.api.initialize()
+            except (InvalidAuth, InvalidResponse):
+                # Credentials have changed. Force a re-login
+                self._async_start_reauth()
+                return
+            except (
+                TimeoutError,
+                client_exceptions.ClientOSError,
+                client_exceptions.ServerDisconnectedError,
+                client_exceptions.ContentTypeError,
+            ) as err:
+                self.logger.warning(
+                    "Error connecting to the Hubspace API, retrying in %s seconds: %s",
+                    retry,
+                    err,
+                )
+            except Exception:
+                self.logger.exception(
+                    "Unknown error connecting to the Hubspace API, retrying in %s seconds",
+                    retry,
+                )
+            else:
+                self._connect_task = None
+                return
+            await asyncio.sleep(retry)
+            self.metrics.async_retry()
+            retry = min(retry * 2, CONNECT_RETRY_MAX_SEC)
+
+    @core.callback
+    def _async_start_reauth(self) -> None:
+        """Ask the user to log in again."""
+        self.metrics.async_reauth()
+        self.config_entry.async_start_reauth(self.hass)
+
+    @core.callback
+    def _async_auth_failed(self, *args, **kwargs) -> None:
+        """Refresh the token in the background while the entities stay loaded."""
+        if self._auth_refresh_task is not None:
+            return
+        self.logger.debug("Authentication failed, refreshing the token")
+        self._auth_refresh_task = self.hass.async_create_background_task(
+            self._async_refresh_auth(), "hubspace-refresh-auth"
+        )
+
+    async def _async_refresh_auth(self) -> None:
+        """Poll with the stored token until the API accepts it again.
+
+        Only repeated authentication failures start a reauth of the config
+        entry. Connection errors are retried without counting as a failure.
+        """
+        retry = AUTH_REFRESH_RETRY_MIN_SEC
+        failures = 0
+        try:
+            while True:
+                await asyncio.sleep(retry)
+                self.metrics.async_retry()
+                try:
+                    async with asyncio.timeout(
+                        self.config_entry.options[CONF_TIMEOUT]
+                    ):
+                        await self._async_poll()
+                except (InvalidAuth, InvalidResponse):
+                    failures += 1
+                    if failures >= AUTH_REFRESH_ATTEMPTS:
+                        self.logger.warning(
+                            "Unable to refresh the token after %s attempts", failures
+                        )
+                        self._async_start_reauth()
+                        return
+                except (TimeoutError, aiohttp.ClientError) as err:
+                    self.logger.debug("Error refreshing the token: %s", err)
+                except Exception:
+                    self.logger.exception(
+                        "Unknown error refreshing the token, retrying in %s seconds",
+                        retry,
+                    )
+                else:
+                    self._async_store_token()
+                    return
+                retry = min(retry * 2, AUTH_REFRESH_RETRY_MAX_SEC)
+        finally:
+            self._auth_refresh_task = None
+
+    @core.callback
+    def _async_store_token(self) -> None:
+        """Store the refresh token if it was rotated."""
+        token = self.api.refresh_token
+        if not token or token == self.config_entry.data[CONF_TOKEN]:
+            return
+        self.logger.debug("Storing the refreshed token")
+        self.entry_data = {**self.config_entry.data, CONF_TOKEN: token}
+        self.hass.config_entries.async_update_entry(
+            self.config_entry, data=self.entry_data
+        )
+
+    @core.callback
+    def _async_hook_polls(self) -> None:
+        """Process every poll of the API before its events are generated."""
+        fetch_data = self.api.fetch_data
+        generate_events = self.api.events.generate_events_from_data
+
+        async def timed_fetch_data(*args, stagger: bool = False, **kwargs) -> Any:
+            interval = self.current_polling_interval
+            async with (
+                self.poll_coordinator.async_poll(interval, stagger) as delay,
+                self.limiter.async_slot(PRIORITY_POLL),
+            ):
+                self.metrics.async_poll_delayed(delay)
+                start = time.perf_counter()
+                try:
+                    return await fetch_data(*args, **kwargs)
+                finally:
+                    self._fetch_duration = (time.perf_counter() - start) * 1000
+
+        async def generate_events_from_data(data: list[dict], *args, **kwargs) -> Any:
+            start = time.perf_counter()
+            self._async_poll_received(data)
+            self.metrics.async_poll_started(len(data))
+            if self.profiler:
+                self.profiler.async_poll_started()
+            try:
+                return await generate_events(data, *args, **kwargs)
+            finally:
+                if self.profiler:
+                    self.profiler.async_poll_completed()
+                if self.adaptive_polling:
+                    self.adaptive_polling.async_poll_completed()
+                self.metrics.async_poll_completed(
+                    self._fetch_duration + (time.perf_counter() - start) * 1000
+                )
+                self._fetch_duration = 0
+                if self.metrics.measure_payload:
+                    self.hass.async_create_background_task(
+                        self._async_measure_payload(data), "hubspace-payload-size"
+                    )
+
+        self._fetch_data = timed_fetch_data
+        # Only the polling loop of aioafero calls api.fetch_data
+        self.api.fetch_data = partial(timed_fetch_data, stagger=True)
+        self.api.events.generate_events_from_data = generate_events_from_data
+        self.config_entry.async_on_unload(
+            self.api.events.subscribe(
+                self.metrics.async_event_emitted,
+                event_filter=(
+                    EventType.RESOURCE_ADDED,
+                    EventType.RESOURCE_UPDATED,
+                    EventType.RESOURCE_DELETED,
+                ),
+            )
+        )
+
+    @core.callback
+    def _async_poll_received(self, data: list[dict]) -> None:
+        """Store the poll and confirm the devices restored from the snapshot."""
+        if self.awaiting_cloud:
+            self.logger.debug("Received the first poll from the Hubspace API")
+            self.awaiting_cloud = False
+            # Every entity must be updated to become available
+            self.delta_filter.reset()
+        self.snapshot.async_schedule_save(data)
+
+    async def _async_measure_payload(self, data: list[dict]) -> None:
+        """Measure the size of the poll outside the event loop.
+
+        Only called once the events of the poll are generated, so the poll is
+        no longer used by the event loop.
+        """
+        self.metrics.async_payload_measured(
+            await self.hass.async_add_executor_job(payload_size, data)
+        )
+
+    @property
+    def _polling_bounds(self) -> tuple[int, int]:
+        """Minimum and maximum interval of the adaptive polling."""
+        options = self.config_entry.options
+        return (
+            int(options.get(POLLING_MIN_STR, DEFAULT_POLLING_MIN_SEC)),
+            int(options.get(POLLING_MAX_STR, DEFAULT_POLLING_MAX_SEC)),
+        )
+
+    @core.callback
+    def _async_setup_adaptive_polling(self) -> None:
+        """Track the changes of every poll and start the first burst."""
+        self._adaptive_polling_unsub = self.api.events.subscribe(
+            self.adaptive_polling.async_change_detected,
+            event_filter=(
+                EventType.RESOURCE_ADDED,
+                EventType.RESOURCE_UPDATED,
+                EventType.RESOURCE_DELETED,
+            ),
+        )
+        self.adaptive_polling.async_start()
+
+    @core.callback
+    def _async_stop_adaptive_polling(self) -> None:
+        """Stop adjusting the polling interval."""
+        if self._adaptive_polling_unsub is not None:
+            self._adaptive_polling_unsub()
+            self._adaptive_polling_unsub = None
+        if self.adaptive_polling:
+            self.adaptive_polling.async_cancel()
+            self.adaptive_polling = None
+
+    @core.callback
+    def async_apply_options(self) -> bool:
+        """Apply the options of the config entry to the running bridge.
+
+        The timeout and the debug options are read when used, the polling
+        and the request limits are updated in place. The connection pool of
+        the dedicated session is sized when the session is created, so a
+        change of the requests in flight reloads the entry while it is used.
+
+        :return: False if the options can only be applied by a reload
+        """
+        options = self.config_entry.options
+        previous, self.entry_options = self.entry_options, dict(options)
+        if self.entry_options == previous:
+            # Only the data of the entry was updated, such as a rotated token
+            return True
+        dedicated_session = options.get(DEDICATED_SESSION_STR, False)
+        if dedicated_session != previous.get(DEDICATED_SESSION_STR, False) or (
+            dedicated_session
+            and options.get(MAX_IN_FLIGHT_STR) != previous.get(MAX_IN_FLIGHT_STR)
+        ):
+            return False
+        self.logger.debug("Applying the updated options")
+        self.polling_interval = int(options[POLLING_TIME_STR])
+        self.limiter.async_configure(
+            int(options.get(MAX_IN_FLIGHT_STR, DEFAULT_MAX_IN_FLIGHT)),
+            float(options.get(REQUESTS_PER_SECOND_STR, DEFAULT_REQUESTS_PER_SECOND)),
+        )
+        if options.get(POLLING_MODE_STR, DEFAULT_POLLING_MODE) != POLLING_MODE_ADAPTIVE:
+            self._async_stop_adaptive_polling()
+            self.api.set_polling_interval(self.polling_interval)
+        elif self.adaptive_polling:
+            self.adaptive_polling.async_set_bounds(*self._polling_bounds)
+        else:
+            self.adaptive_polling = AdaptivePollingScheduler(
+                self.hass,
+                self.api.set_polling_interval,
+                self._async_poll,
+                *self._polling_bounds,
+            )
+            self._async_setup_adaptive_polling()
+        return True
+
+    async def async_fetch_data(self) -> list[dict]:
+        """Fetch the devices outside the polling loop.
+
+        The request is not staggered with the polls of the other accounts.
+        """
+        return await self._fetch_data()
+
+    async def _async_poll(self) -> None:
+        """Poll the API outside the polling loop."""
+        await self.api.events.generate_events_from_data(await self.async_fetch_data())
+
+    @property
+    def current_polling_interval(self) -> int:
+        """Seconds the polling loop currently waits between polls."""
+        if self.adaptive_polling:
+            return self.adaptive_polling.interval
+        return self.polling_interval
+
+    @property
+    def optimistic_state_timeout(self) -> int:
+        """Seconds to wait for the cloud to confirm an optimistic state."""
+        if self.adaptive_polling:
+            return self.adaptive_polling.min_interval * OPTIMISTIC_STATE_TIMEOUT_POLLS
+        return self.polling_interval * OPTIMISTIC_STATE_TIMEOUT_POLLS
+
     async def async_request_call(self, task: Callable, *args, **kwargs) -> Any:
-        """Send request to the bridge."""
+        """Send request to the bridge.
+
+        Controller set_state calls go through the command scheduler so writes
+        to a device with a request in flight are merged. Every request waits
+        on the limiter ahead of the polls. With adaptive polling, a successful
+        request starts a burst of fast polls.
+        """
+        device_id = kwargs.get("device_id")
+        start = time.perf_counter()
         try:
-            return await task(*args, **kwargs)
+            if is_batchable(task, args, kwargs, self.api.controllers):
+                result = await self.command_scheduler.async_set_state(task, **kwargs)
+            else:
+                async with self.limiter.async_slot(PRIORITY_COMMAND):
+                    result = await task(*args, **kwargs)
         except aiohttp.ClientError as err:
             raise HomeAssistantError(
                 f"Request failed due connection error: {err}"
@@ -125,6 +565,69 @@ class HubspaceBridge:
         except Exception as err:
             msg = f"Request failed: {err}"
             raise HomeAssistantError(msg) from err
+        finally:
+            # The controller may have updated the device locally
+            if device_id:
+                self.delta_filter.async_invalidate(
+                    device_id,
+                    split_identifier(task, device_id, self.api.controllers),
+                )
+            self.metrics.async_command_completed(
+                (time.perf_counter() - start) * 1000
+            )
+        if self.adaptive_polling:
+            self.adaptive_polling.async_activity()
+        return result
+
+    @core.callback
+    def async_start_profile(self, polls: int) -> Path:
+        """Profile the next polls and write the stats next to the debug dumps.
+
+        :param polls: Number of polls to profile
+        :return: Path of the stats file
+        """
+        if self.profiler:
+            raise HomeAssistantError("A profile is already being captured")
+
+        @core.callback
+        def profile_done() -> None:
+            self.profiler = None
+
+        path = Path(__file__).parent / "_profile.pstats"
+        self.profiler = PollProfiler(self.hass, polls, path, profile_done)
+        return path
+
+    @core.callback
+    def _async_cancel_pending(self, *args) -> None:
+        """Cancel any pending state writes, optimistic timeouts and commands."""
+        self.write_coalescer.async_cancel()
+        self.optimistic_tracker.async_cancel()
+        self.command_scheduler.async_cancel()
+        self.limiter.async_cancel()
+        if self.adaptive_polling:
+            self.adaptive_polling.async_cancel()
+        if self._connect_task is not None:
+            self._connect_task.cancel()
+            self._connect_task = None
+        if self._auth_refresh_task is not None:
+            self._auth_refresh_task.cancel()
+            self._auth_refresh_task = None
+        if self.profiler:
+            self.profiler.async_cancel()
+
+    async def _async_close_session_on_shutdown(self, event: core.Event) -> None:
+        """Close the dedicated session once Home Assistant shuts down."""
+        self._session_close_unsub = None
+        await self.async_close_session()
+
+    async def async_close_session(self) -> None:
+        """Close the dedicated session and its connections."""
+        if self._session_close_unsub is not None:
+            self._session_close_unsub()
+            self._session_close_unsub = None
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
 
     async def async_reset(self) -> bool:
         """Reset this bridge to default state.
@@ -139,20 +642,67 @@ class HubspaceBridge:
 
         while self.reset_jobs:
             self.reset_jobs.pop()()
+        self._async_cancel_pending()
+        await self.snapshot.async_flush()
 
         # Unload platforms
-        unload_success = await self.hass.config_entries.async_unload_platforms(
-            self.config_entry, PLATFORMS
-        )
+        unload_success = await self.platforms.async_unload()
 
         if unload_success:
             self.hass.data[DOMAIN].pop(self.config_entry.entry_id)
+            await self.async_close_session()
 
         return unload_success
 
 
+def create_session(pool_size: int) -> aiohttp.ClientSession:
+    """Create a session that keeps its connections to the Hubspace API.
+
+    The pool matches the requests allowed in flight so a burst of commands
+    reuses the open connections, and DNS lookups are cached between polls.
+
+    :param pool_size: Maximum number of connections
+    """
+    connector = aiohttp.TCPConnector(
+        limit=pool_size,
+        limit_per_host=pool_size,
+        ttl_dns_cache=SESSION_DNS_CACHE_TTL_SEC,
+        keepalive_timeout=SESSION_KEEPALIVE_SEC,
+        ssl=ssl_util.get_default_context(),
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+def split_identifier(
+    task: Callable, device_id: str, controllers: list
+) -> str | None:
+    """Get the split identifier of the resource targeted by a controller task."""
+    controller = getattr(task, "__self__", None)
+    if not any(controller is known for known in controllers):
+        return None
+    with contextlib.suppress(KeyError):
+        return getattr(controller[device_id], "split_identifier", None)
+    return None
+
+
+def payload_size(data: list[dict]) -> int:
+    """Size of the poll when serialized as JSON."""
+    return len(json_bytes(data))
+
+
 async def _update_listener(hass: core.HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle ConfigEntry options update."""
+    """Handle ConfigEntry options update.
+
+    Options are applied to the running bridge and a refreshed token is
+    already in use, so only a change of credentials reloads the entry.
+    """
+    bridge: HubspaceBridge | None = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if (
+        bridge is not None
+        and bridge.entry_data == dict(entry.data)
+        and bridge.async_apply_options()
+    ):
+        return
     await hass.config_entries.async_reload(entry.entry_id)
 
 
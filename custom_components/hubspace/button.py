@@ -1,13 +1,17 @@
 """Home Assistant entity for interacting with Afero buttons."""
 
+from collections.abc import Iterable, Iterator
 from enum import Enum
+import gzip
 import json
 import os
 from pathlib import Path
+import textwrap
+from typing import Any
+import uuid
 
 from aioafero import EventType, anonymize_devices, get_afero_device
 from aioafero.v1 import AferoBridgeV1
-import aiofiles
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_USERNAME
@@ -16,7 +20,7 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .bridge import HubspaceBridge
-from .const import DOMAIN
+from .const import DEBUG_COMPRESS_STR, DOMAIN
 
 
 class DebugButtonEnum(Enum):
@@ -57,23 +61,78 @@ class DebugButton(ButtonEntity):
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        data = await self.bridge.api.fetch_data()
+        data = await self.bridge.async_fetch_data()
         current_path: Path = Path(__file__.rsplit(os.sep, 1)[0])
+        compress = self.bridge.config_entry.options.get(DEBUG_COMPRESS_STR, False)
         if self.instance == DebugButtonEnum.ANON:
-            dev_dump = current_path / "_dump_hs_devices.json"
+            dev_dump = dump_path(current_path / "_dump_hs_devices.json", compress)
             self.logger.debug("Writing out anonymized device data to %s", dev_dump)
-            devs = [get_afero_device(dev) for dev in data]
-            async with aiofiles.open(dev_dump, "w") as fh:
-                await fh.write(json.dumps(anonymize_devices(devs), indent=4))
+            await self.hass.async_add_executor_job(
+                write_anonymized_dump, dev_dump, data, compress
+            )
         elif self.instance == DebugButtonEnum.RAW:
-            data_dump = current_path / "_dump_raw.json"
+            data_dump = dump_path(current_path / "_dump_raw.json", compress)
             self.logger.debug("Writing out raw data to %s", data_dump)
-            async with aiofiles.open(data_dump, "w") as fh:
-                await fh.write(json.dumps(data, indent=4))
+            await self.hass.async_add_executor_job(
+                write_dump, data_dump, data, compress
+            )
         elif self.instance == DebugButtonEnum.REAUTH:
             self.api.events.emit(EventType.INVALID_AUTH)
 
 
+def dump_path(path: Path, compress: bool) -> Path:
+    """Get the path of a dump, adding the gzip suffix when compressed."""
+    return path.with_name(f"{path.name}.gz") if compress else path
+
+
+def write_dump(path: Path, devices: Iterable[Any], compress: bool) -> None:
+    """Write the devices as a JSON list, one device at a time.
+
+    The output matches ``json.dumps(devices, indent=4)`` while only a
+    single device is serialized in memory. Must be run in an executor.
+    """
+    opener = gzip.open if compress else open
+    with opener(path, "wt") as fh:
+        separator = "[\n"
+        for device in devices:
+            fh.write(separator)
+            fh.write(textwrap.indent(json.dumps(device, indent=4), "    "))
+            separator = ",\n"
+        fh.write("[]" if separator == "[\n" else "\n]")
+
+
+def write_anonymized_dump(path: Path, data: list[dict], compress: bool) -> None:
+    """Anonymize the devices and write them, one device at a time.
+
+    Only a single anonymized device is kept in memory. Must be run in an
+    executor.
+    """
+    write_dump(path, anonymize_each_device(data), compress)
+
+
+def anonymize_each_device(data: list[dict]) -> Iterator[dict]:
+    """Anonymize the devices of the account one at a time.
+
+    Each device is anonymized on its own, so the IDs are replaced from a
+    map built over the whole account first. That keeps the relationship
+    between parents and children.
+    """
+    id_map: dict[str, str] = {}
+    for raw in data:
+        device = get_afero_device(raw)
+        for device_id in (device.id, device.device_id, *device.children):
+            if device_id and device_id not in id_map:
+                id_map[device_id] = str(uuid.uuid4())
+    for index, raw in enumerate(data):
+        device = get_afero_device(raw)
+        anonymized = anonymize_devices([device])[0]
+        anonymized["id"] = id_map[device.id]
+        anonymized["device_id"] = id_map.get(device.device_id)
+        anonymized["children"] = [id_map[child] for child in device.children]
+        anonymized["friendly_name"] = f"friendly-device-{index}"
+        yield anonymized
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -1,6 +1,7 @@
 """Home Assistant entity for interacting with Afero climate."""
 
-from functools import partial
+from dataclasses import dataclass
+from functools import lru_cache, partial
 
 from aioafero.v1 import (
     AferoBridgeV1,
@@ -31,6 +32,74 @@ from .bridge import HubspaceBridge
 from .const import DOMAIN
 from .entity import HubspaceBaseEntity, update_decorator
 
+HUBSPACE_TO_HVAC_MODE: dict[str, HVACMode] = {
+    "cool": HVACMode.COOL,
+    "heat": HVACMode.HEAT,
+    "fan": HVACMode.FAN_ONLY,
+    "off": HVACMode.OFF,
+    "auto": HVACMode.HEAT_COOL,
+    "dehumidify": HVACMode.DRY,
+    "auto-cool": HVACMode.AUTO,
+}
+HVAC_MODE_TO_HUBSPACE: dict[HVACMode, str] = {
+    hvac_mode: mode for mode, hvac_mode in HUBSPACE_TO_HVAC_MODE.items()
+}
+HUBSPACE_TO_HVAC_ACTION: dict[str, HVACAction] = {
+    "cooling": HVACAction.COOLING,
+    "heating": HVACAction.HEATING,
+    "off": HVACAction.OFF,
+}
+HUBSPACE_TO_FAN_MODE: dict[str, str] = {
+    "on": FAN_ON,
+    "off": FAN_OFF,
+}
+FAN_MODE_TO_HUBSPACE: dict[str, str] = {
+    fan_mode: mode for mode, fan_mode in HUBSPACE_TO_FAN_MODE.items()
+}
+
+
+@dataclass(frozen=True)
+class ThermostatProfile:
+    """Capabilities of a thermostat model.
+
+    Profiles are shared between entities so the modes are immutable.
+    """
+
+    hvac_modes: tuple[HVACMode, ...]
+    fan_modes: tuple[str, ...]
+    min_temp: float | None
+    max_temp: float | None
+    target_temperature_step: float | None
+
+
+@lru_cache(maxsize=32)
+def get_profile(
+    hvac_modes: frozenset[str],
+    fan_modes: tuple[str, ...],
+    min_temp: float | None,
+    max_temp: float | None,
+    target_temperature_step: float | None,
+) -> ThermostatProfile:
+    """Get the profile shared by thermostats with the same capabilities.
+
+    :param hvac_modes: Hubspace modes supported by the thermostat
+    :param fan_modes: Fan modes supported by the thermostat
+    :param min_temp: Minimum temperature of the current mode
+    :param max_temp: Maximum temperature of the current mode
+    :param target_temperature_step: Increment of the target temperature
+    """
+    return ThermostatProfile(
+        hvac_modes=tuple(
+            hvac_mode
+            for mode, hvac_mode in HUBSPACE_TO_HVAC_MODE.items()
+            if mode in hvac_modes
+        ),
+        fan_modes=fan_modes,
+        min_temp=min_temp,
+        max_temp=max_temp,
+        target_temperature_step=target_temperature_step,
+    )
+
 
 class HubspaceThermostat(HubspaceBaseEntity, ClimateEntity):
     """Representation of an Afero climate."""
@@ -52,6 +121,19 @@ class HubspaceThermostat(HubspaceBaseEntity, ClimateEntity):
             self._supported_features |= ClimateEntityFeature.FAN_MODE
         if self.resource.supports_temperature_range:
             self._supported_features |= ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
+        self._profile: ThermostatProfile
+        self.on_update()
+
+    @callback
+    def on_update(self) -> None:
+        """Refresh the profile if the capabilities of the resource changed."""
+        self._profile = get_profile(
+            frozenset(self.resource.hvac_mode.supported_modes),
+            tuple(self.resource.fan_mode.modes) if self.resource.fan_mode else (),
+            self.resource.target_temperature_min,
+            self.resource.target_temperature_max,
+            self.resource.target_temperature_step,
+        )
 
     @property
     def extra_state_attributes(self):
@@ -66,28 +148,20 @@ class HubspaceThermostat(HubspaceBaseEntity, ClimateEntity):
     @property
     def fan_mode(self) -> str | None:
         """Returns the currently selected fan mode."""
-        if self.resource.fan_mode.mode == "on":
-            return FAN_ON
-        if self.resource.fan_mode.mode == "off":
-            return FAN_OFF
-        return self.resource.fan_mode.mode
+        mode = self.resource.fan_mode.mode
+        return self.optimistic("fan_mode", HUBSPACE_TO_FAN_MODE.get(mode, mode))
 
     @property
     def fan_modes(self) -> list[str] | None:
         """Returns all available fan modes."""
-        return list(self.resource.fan_mode.modes)
+        return list(self._profile.fan_modes)
 
     @property
     def hvac_action(self) -> HVACAction | None:
         """Returns the current state of hvac operation."""
         if not hasattr(self.resource, "hvac_action"):
             return None
-        mapping = {
-            "cooling": HVACAction.COOLING,
-            "heating": HVACAction.HEATING,
-            "off": HVACAction.OFF,
-        }
-        mapped = mapping.get(self.resource.hvac_action)
+        mapped = HUBSPACE_TO_HVAC_ACTION.get(self.resource.hvac_action)
         if mapped:
             return mapped
         if self.resource.hvac_mode.mode == "fan":
@@ -97,48 +171,25 @@ class HubspaceThermostat(HubspaceBaseEntity, ClimateEntity):
     @property
     def hvac_mode(self) -> HVACMode | None:
         """Returns the current hvac mode."""
-        mapping = {
-            "cool": HVACMode.COOL,
-            "heat": HVACMode.HEAT,
-            "fan": HVACMode.FAN_ONLY,
-            "off": HVACMode.OFF,
-            "auto": HVACMode.HEAT_COOL,
-            "dehumidify": HVACMode.DRY,
-            "auto-cool": HVACMode.AUTO,
-        }
-        mapped = mapping.get(self.resource.hvac_mode.mode)
+        mapped = HUBSPACE_TO_HVAC_MODE.get(self.resource.hvac_mode.mode)
         if not mapped:
             self.logger.warning("Unknown hvac mode: %s", self.resource.hvac_mode.mode)
-            return None
-        return mapped
+        return self.optimistic("hvac_mode", mapped)
 
     @property
     def hvac_modes(self) -> list[HVACMode]:
         """Returns all available hvac modes."""
-        mapping = {
-            "cool": HVACMode.COOL,
-            "heat": HVACMode.HEAT,
-            "fan": HVACMode.FAN_ONLY,
-            "off": HVACMode.OFF,
-            "auto": HVACMode.HEAT_COOL,
-            "dehumidify": HVACMode.DRY,
-            "auto-cool": HVACMode.AUTO,
-        }
-        return [
-            val
-            for key, val in mapping.items()
-            if key in self.resource.hvac_mode.supported_modes
-        ]
+        return list(self._profile.hvac_modes)
 
     @property
     def max_temp(self) -> float | None:
         """Returns the maximum allowed temperature for the current mode."""
-        return self.resource.target_temperature_max
+        return self._profile.max_temp
 
     @property
     def min_temp(self) -> float | None:
         """Returns the minimum allowed temperature for the current mode."""
-        return self.resource.target_temperature_min
+        return self._profile.min_temp
 
     @property
     def supported_features(self) -> ClimateEntityFeature:
@@ -148,22 +199,26 @@ class HubspaceThermostat(HubspaceBaseEntity, ClimateEntity):
     @property
     def target_temperature(self) -> float | None:
         """Returns the temperature that we are trying to reach."""
-        return self.resource.target_temperature
+        return self.optimistic("target_temperature", self.resource.target_temperature)
 
     @property
     def target_temperature_high(self) -> float | None:
         """Returns the upper bound (cool) temperature when set to auto."""
-        return self.resource.target_temperature_range[1]
+        return self.optimistic(
+            "target_temperature_high", self.resource.target_temperature_range[1]
+        )
 
     @property
     def target_temperature_low(self) -> float | None:
         """Returns the lower bound (heat) temperature when set to auto."""
-        return self.resource.target_temperature_range[0]
+        return self.optimistic(
+            "target_temperature_low", self.resource.target_temperature_range[0]
+        )
 
     @property
     def target_temperature_step(self) -> float | None:
         """Returns the amount the thermostat can increment."""
-        return self.resource.target_temperature_step
+        return self._profile.target_temperature_step
 
     @property
     def temperature_unit(self) -> str:
@@ -174,24 +229,15 @@ class HubspaceThermostat(HubspaceBaseEntity, ClimateEntity):
             else UnitOfTemperature.CELSIUS
         )
 
-    @update_decorator
-    async def translate_hvac_mode_to_hubspace(self, hvac_mode) -> str | None:
+    def translate_hvac_mode_to_hubspace(self, hvac_mode) -> str | None:
         """Convert HomeAssistant -> Hubspace."""
-        tracked_modes = {
-            HVACMode.OFF: "off",
-            HVACMode.HEAT: "heat",
-            HVACMode.COOL: "cool",
-            HVACMode.FAN_ONLY: "fan",
-            HVACMode.HEAT_COOL: "auto",
-            HVACMode.AUTO: "auto-cool",
-            HVACMode.DRY: "dehumidify",
-        }
-        return tracked_modes.get(hvac_mode)
+        return HVAC_MODE_TO_HUBSPACE.get(hvac_mode)
 
     @update_decorator
     async def async_set_hvac_mode(self, hvac_mode: str) -> None:
         """Set new hvac mode."""
-        mode = await self.translate_hvac_mode_to_hubspace(hvac_mode)
+        mode = self.translate_hvac_mode_to_hubspace(hvac_mode)
+        self.async_set_optimistic_state(hvac_mode=hvac_mode)
         await self.bridge.async_request_call(
             self.controller.set_state, device_id=self.resource.id, hvac_mode=mode
         )
@@ -199,28 +245,36 @@ class HubspaceThermostat(HubspaceBaseEntity, ClimateEntity):
     @update_decorator
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new fan mode."""
-        tracked_modes = {
-            FAN_ON: "on",
-            FAN_OFF: "off",
-        }
+        self.async_set_optimistic_state(fan_mode=fan_mode)
         await self.bridge.async_request_call(
             self.controller.set_state,
             device_id=self.resource.id,
-            fan_mode=tracked_modes.get(fan_mode, fan_mode),
+            fan_mode=FAN_MODE_TO_HUBSPACE.get(fan_mode, fan_mode),
         )
 
     @update_decorator
     async def async_set_temperature(self, **kwargs):
         """Set new target temperature."""
+        optimistic_attrs = {
+            "target_temperature": ATTR_TEMPERATURE,
+            "target_temperature_high": ATTR_TARGET_TEMP_HIGH,
+            "target_temperature_low": ATTR_TARGET_TEMP_LOW,
+            "hvac_mode": ATTR_HVAC_MODE,
+        }
+        self.async_set_optimistic_state(
+            **{
+                attr: kwargs[key]
+                for attr, key in optimistic_attrs.items()
+                if kwargs.get(key) is not None
+            }
+        )
         await self.bridge.async_request_call(
             self.controller.set_state,
             device_id=self.resource.id,
             target_temperature=kwargs.get(ATTR_TEMPERATURE),
             target_temperature_auto_cooling=kwargs.get(ATTR_TARGET_TEMP_HIGH),
             target_temperature_auto_heating=kwargs.get(ATTR_TARGET_TEMP_LOW),
-            hvac_mode=await self.translate_hvac_mode_to_hubspace(
-                kwargs.get(ATTR_HVAC_MODE)
-            ),
+            hvac_mode=self.translate_hvac_mode_to_hubspace(kwargs.get(ATTR_HVAC_MODE)),
         )
 
 
@@ -0,0 +1,66 @@
+"""Coalesce Home Assistant state writes for Hubspace entities."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+
+if TYPE_CHECKING:
+    from homeassistant.helpers.entity import Entity
+
+
+class StateWriteCoalescer:
+    """Batch state writes for every entity of a single bridge.
+
+    A poll generates one update event per device, and a device can back
+    many entities. Instead of writing the state on every event, entities
+    are marked as dirty and written once on the next iteration of the
+    event loop, after the whole batch of events has been processed. Home
+    Assistant skips writes that do not change the state.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the coalescer."""
+        self._hass = hass
+        # dict is used as an ordered set so entities are flushed in the
+        # order they were first marked as dirty
+        self._pending: dict[Entity, None] = {}
+        self._flush_handle: asyncio.Handle | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of entities waiting to be written."""
+        return len(self._pending)
+
+    @callback
+    def async_schedule(self, entity: Entity) -> None:
+        """Mark the entity as dirty and schedule a flush."""
+        self._pending[entity] = None
+        if self._flush_handle is None:
+            self._flush_handle = self._hass.loop.call_soon(self.async_flush)
+
+    @callback
+    def async_discard(self, entity: Entity) -> None:
+        """Remove the entity from the pending writes."""
+        self._pending.pop(entity, None)
+
+    @callback
+    def async_flush(self) -> None:
+        """Write the state of every dirty entity."""
+        self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        for entity in pending:
+            # The entity may have been removed after it was marked as dirty
+            if entity.hass is None:
+                continue
+            entity.async_write_ha_state()
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel any scheduled flush and drop all pending writes."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending.clear()
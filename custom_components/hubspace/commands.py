@@ -0,0 +1,142 @@
+"""Batch commands sent to the Hubspace API."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+from aioafero.v1 import AferoController
+from homeassistant.core import HomeAssistant, callback
+
+from .const import COMMAND_MAX_CONCURRENCY
+from .limiter import PRIORITY_COMMAND, RequestLimiter
+
+
+@dataclass
+class PendingCommand:
+    """A set_state call for a single device that has not been sent yet."""
+
+    task: Callable
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    futures: list[asyncio.Future] = field(default_factory=list)
+
+    def merge(self, kwargs: dict[str, Any]) -> None:
+        """Merge the arguments of another call into this command.
+
+        Later values override earlier ones and values of None are ignored
+        as set_state treats them as "do not change". Mappings, such as
+        numbers and selects, are merged by key.
+        """
+        for key, value in kwargs.items():
+            if value is None:
+                self.kwargs.setdefault(key, None)
+            elif isinstance(value, dict) and isinstance(self.kwargs.get(key), dict):
+                self.kwargs[key] = self.kwargs[key] | value
+            else:
+                self.kwargs[key] = value
+
+
+def is_batchable(
+    task: Callable,
+    args: tuple,
+    kwargs: dict[str, Any],
+    controllers: Iterable[AferoController],
+) -> bool:
+    """Determine if the call is a controller set_state that can be batched.
+
+    :param task: Callable passed to the bridge
+    :param args: Positional arguments of the call
+    :param kwargs: Keyword arguments of the call
+    :param controllers: Controllers of the API
+    """
+    return (
+        not args
+        and "device_id" in kwargs
+        and any(task == controller.set_state for controller in controllers)
+    )
+
+
+class CommandScheduler:
+    """Merge set_state calls sent to a device while it has a request in flight.
+
+    A call is sent right away unless a request for the same controller,
+    device and instance is in flight. In that case it waits for the request
+    to complete and is merged with the other calls that arrived meanwhile.
+    Requests are sent with a bounded concurrency and every caller receives
+    the result of the request its call was merged into.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_concurrency: int = COMMAND_MAX_CONCURRENCY,
+        limiter: RequestLimiter | None = None,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._limiter = limiter
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # Commands waiting on the request in flight for their key
+        self._pending: dict[tuple, PendingCommand] = {}
+        self._in_flight: set[tuple] = set()
+
+    @property
+    def pending(self) -> int:
+        """Number of merged commands waiting to be sent."""
+        return len(self._pending)
+
+    async def async_set_state(self, task: Callable, **kwargs: Any) -> Any:
+        """Send the set_state call, or queue it behind the request in flight."""
+        key = (task, kwargs["device_id"], kwargs.get("instance"))
+        send = False
+        if (command := self._pending.get(key)) is None:
+            command = PendingCommand(task)
+            if key in self._in_flight:
+                self._pending[key] = command
+            else:
+                send = True
+        command.merge(kwargs)
+        future = self._hass.loop.create_future()
+        command.futures.append(future)
+        if send:
+            self._async_start(key, command)
+        return await future
+
+    @callback
+    def _async_start(self, key: tuple, command: PendingCommand) -> None:
+        """Send the command in the background."""
+        self._in_flight.add(key)
+        self._hass.async_create_task(
+            self._async_send(key, command), "hubspace-send-command"
+        )
+
+    async def _async_send(self, key: tuple, command: PendingCommand) -> None:
+        """Send the command and resolve the futures of every caller."""
+        try:
+            async with self._semaphore:
+                if self._limiter:
+                    async with self._limiter.async_slot(PRIORITY_COMMAND):
+                        result = await command.task(**command.kwargs)
+                else:
+                    result = await command.task(**command.kwargs)
+        except Exception as err:  # noqa: BLE001
+            for future in command.futures:
+                if not future.done():
+                    future.set_exception(err)
+        else:
+            for future in command.futures:
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._in_flight.discard(key)
+            if (queued := self._pending.pop(key, None)) is not None:
+                self._async_start(key, queued)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel all commands that have not been sent."""
+        for command in self._pending.values():
+            for future in command.futures:
+                future.cancel()
+        self._pending.clear()
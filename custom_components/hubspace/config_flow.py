@@ -15,10 +15,23 @@ from homeassistant.core import callback
 import voluptuous as vol
 
 from .const import (
+    DEBUG_COMPRESS_STR,
+    DEDICATED_SESSION_STR,
+    DEFAULT_MAX_IN_FLIGHT,
     DEFAULT_POLLING_INTERVAL_SEC,
+    DEFAULT_POLLING_MAX_SEC,
+    DEFAULT_POLLING_MIN_SEC,
+    DEFAULT_POLLING_MODE,
+    DEFAULT_REQUESTS_PER_SECOND,
     DEFAULT_TIMEOUT,
     DOMAIN,
+    MAX_IN_FLIGHT_STR,
+    POLLING_MAX_STR,
+    POLLING_MIN_STR,
+    POLLING_MODE_STR,
+    POLLING_MODES,
     POLLING_TIME_STR,
+    REQUESTS_PER_SECOND_STR,
     VERSION_MAJOR as const_maj,
     VERSION_MINOR as const_min,
 )
@@ -196,19 +209,85 @@ class HubspaceOptionsFlowHandler(config_entries.OptionsFlow):
                 user_input[POLLING_TIME_STR] = DEFAULT_POLLING_INTERVAL_SEC
             if user_input[POLLING_TIME_STR] < 2:
                 errors["base"] = "polling_too_short"
+            elif user_input.get(POLLING_MIN_STR, DEFAULT_POLLING_MIN_SEC) < 2:
+                errors["base"] = "polling_too_short"
+            elif user_input.get(
+                POLLING_MIN_STR, DEFAULT_POLLING_MIN_SEC
+            ) > user_input.get(POLLING_MAX_STR, DEFAULT_POLLING_MAX_SEC):
+                errors["base"] = "polling_bounds_invalid"
+            elif (
+                user_input.get(MAX_IN_FLIGHT_STR, DEFAULT_MAX_IN_FLIGHT) < 1
+                or user_input.get(
+                    REQUESTS_PER_SECOND_STR, DEFAULT_REQUESTS_PER_SECOND
+                )
+                <= 0
+            ):
+                errors["base"] = "request_limit_invalid"
             if not errors:
                 return self.async_create_entry(data=user_input)
-            errors["base"] = "polling_too_short"
-        poll_time = self.config_entry.options.get(
-            POLLING_TIME_STR, DEFAULT_POLLING_INTERVAL_SEC
-        )
-        tmout = self.config_entry.options.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
+        options = self.config_entry.options
+        poll_time = options.get(POLLING_TIME_STR, DEFAULT_POLLING_INTERVAL_SEC)
+        tmout = options.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
                 {
                     vol.Optional(CONF_TIMEOUT, default=tmout): int,
                     vol.Optional(POLLING_TIME_STR, default=poll_time): int,
+                    vol.Optional(
+                        POLLING_MODE_STR,
+                        description={
+                            "suggested_value": options.get(
+                                POLLING_MODE_STR, DEFAULT_POLLING_MODE
+                            )
+                        },
+                    ): vol.In(POLLING_MODES),
+                    vol.Optional(
+                        POLLING_MIN_STR,
+                        description={
+                            "suggested_value": options.get(
+                                POLLING_MIN_STR, DEFAULT_POLLING_MIN_SEC
+                            )
+                        },
+                    ): int,
+                    vol.Optional(
+                        POLLING_MAX_STR,
+                        description={
+                            "suggested_value": options.get(
+                                POLLING_MAX_STR, DEFAULT_POLLING_MAX_SEC
+                            )
+                        },
+                    ): int,
+                    vol.Optional(
+                        MAX_IN_FLIGHT_STR,
+                        description={
+                            "suggested_value": options.get(
+                                MAX_IN_FLIGHT_STR, DEFAULT_MAX_IN_FLIGHT
+                            )
+                        },
+                    ): int,
+                    vol.Optional(
+                        REQUESTS_PER_SECOND_STR,
+                        description={
+                            "suggested_value": options.get(
+                                REQUESTS_PER_SECOND_STR, DEFAULT_REQUESTS_PER_SECOND
+                            )
+                        },
+                    ): vol.Coerce(float),
+                    vol.Optional(
+                        DEDICATED_SESSION_STR,
+                        description={
+                            "suggested_value": options.get(
+                                DEDICATED_SESSION_STR, False
+                            )
+                        },
+                    ): bool,
+                    vol.Optional(
+                        DEBUG_COMPRESS_STR,
+                        description={
+                            "suggested_value": options.get(DEBUG_COMPRESS_STR, False)
+                        },
+                    ): bool,
                 },
             ),
             errors=errors,
@@ -30,6 +30,78 @@ HUB_IDENTIFIER: Final[str] = "hubspace_debug"
 DEFAULT_TIMEOUT: Final[int] = 10000
 DEFAULT_POLLING_INTERVAL_SEC: Final[int] = 30
 POLLING_TIME_STR: Final[str] = "polling_time"
+DEBUG_COMPRESS_STR: Final[str] = "debug_compress"
+POLLING_MODE_STR: Final[str] = "polling_mode"
+POLLING_MIN_STR: Final[str] = "polling_min"
+POLLING_MAX_STR: Final[str] = "polling_max"
+POLLING_MODE_FIXED: Final[str] = "fixed"
+POLLING_MODE_ADAPTIVE: Final[str] = "adaptive"
+POLLING_MODES: Final[list[str]] = [POLLING_MODE_FIXED, POLLING_MODE_ADAPTIVE]
+DEFAULT_POLLING_MODE: Final[str] = POLLING_MODE_FIXED
+DEFAULT_POLLING_MIN_SEC: Final[int] = 5
+DEFAULT_POLLING_MAX_SEC: Final[int] = 300
+MAX_IN_FLIGHT_STR: Final[str] = "max_in_flight"
+REQUESTS_PER_SECOND_STR: Final[str] = "requests_per_second"
+DEFAULT_MAX_IN_FLIGHT: Final[int] = 4
+DEFAULT_REQUESTS_PER_SECOND: Final[int] = 5
+DEDICATED_SESSION_STR: Final[str] = "dedicated_session"
+# Connections of a dedicated session
+SESSION_DNS_CACHE_TTL_SEC: Final[int] = 300
+SESSION_KEEPALIVE_SEC: Final[int] = 60
+# Number of fast polls after a command or a detected change
+ADAPTIVE_POLLING_BURST_POLLS: Final[int] = 3
+# Number of polls to wait for the cloud to confirm a command
+OPTIMISTIC_STATE_TIMEOUT_POLLS: Final[int] = 2
+EVENT_OPTIMISTIC_STATE_REVERTED: Final[str] = f"{DOMAIN}_optimistic_state_reverted"
+# Entities of every account, used by the services
+DATA_ENTITY_INDEX: Final[str] = f"{DOMAIN}_entity_index"
+# Spreads the polls of every account
+DATA_POLL_COORDINATOR: Final[str] = f"{DOMAIN}_poll_coordinator"
+# set_state requests of an account sent at once
+COMMAND_MAX_CONCURRENCY: Final[int] = 10
+# Default number of devices a send_command call sends to at once
+SEND_COMMAND_MAX_CONCURRENCY: Final[int] = 10
+SNAPSHOT_STORAGE_VERSION: Final[int] = 1
+# Delay to group the writes of the device snapshot
+SNAPSHOT_SAVE_DELAY_SEC: Final[int] = 60
+# Backoff when connecting in the background after restoring the snapshot
+CONNECT_RETRY_MIN_SEC: Final[int] = 10
+CONNECT_RETRY_MAX_SEC: Final[int] = 300
+# Token refreshes attempted in the background before asking the user to log in
+AUTH_REFRESH_ATTEMPTS: Final[int] = 5
+AUTH_REFRESH_RETRY_MIN_SEC: Final[int] = 5
+AUTH_REFRESH_RETRY_MAX_SEC: Final[int] = 300
+# Upper bounds of the latency histogram buckets
+METRICS_LATENCY_BUCKETS_MS: Final[tuple[int, ...]] = (
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+    30000,
+)
+# Upper bounds of the queue wait histogram buckets
+METRICS_QUEUE_WAIT_BUCKETS_MS: Final[tuple[int, ...]] = (
+    0,
+    10,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+)
+# Polls of every account sent at once
+POLL_MAX_CONCURRENCY: Final[int] = 2
+# Longest delay to spread the poll of an account from the others
+POLL_STAGGER_MAX_SEC: Final[float] = 5
+# Number of samples used for percentiles
+METRICS_WINDOW: Final[int] = 100
 
 VERSION_MAJOR: Final[int] = 4
 VERSION_MINOR: Final[int] = 0
@@ -0,0 +1,101 @@
+"""Spread the polls of every Hubspace account."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DATA_POLL_COORDINATOR, POLL_MAX_CONCURRENCY, POLL_STAGGER_MAX_SEC
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PollCoordinator:
+    """Stagger the polls of the accounts and bound how many run at once.
+
+    Every account polls on its own loop, so accounts set up together wake
+    at the same time. Each poll of a loop reserves the next start time,
+    spaced by the polling interval divided by the number of accounts, which
+    spreads the accounts over the interval after their first polls. A
+    single account and the polls sent outside the loops are not delayed.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_concurrent: int = POLL_MAX_CONCURRENCY,
+        max_delay: float = POLL_STAGGER_MAX_SEC,
+    ) -> None:
+        """Initialize the coordinator.
+
+        :param hass: Home Assistant instance
+        :param max_concurrent: Maximum number of polls sent at once
+        :param max_delay: Longest delay of a poll to spread it
+        """
+        self._hass = hass
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._max_delay = max_delay
+        self._accounts: set[str] = set()
+        # Earliest time the next poll may start
+        self._next_start: float = 0
+
+    @property
+    def accounts(self) -> int:
+        """Number of accounts that poll."""
+        return len(self._accounts)
+
+    @callback
+    def async_register(self, entry_id: str) -> CALLBACK_TYPE:
+        """Include the polls of an account.
+
+        :param entry_id: ID of the config entry of the account
+        :return: Callback that removes the account
+        """
+        self._accounts.add(entry_id)
+
+        @callback
+        def unregister() -> None:
+            self._accounts.discard(entry_id)
+            # Drop the coordinator with the last account
+            hass_data = self._hass.data
+            if not self._accounts and hass_data.get(DATA_POLL_COORDINATOR) is self:
+                del hass_data[DATA_POLL_COORDINATOR]
+
+        return unregister
+
+    @asynccontextmanager
+    async def async_poll(
+        self, interval: float, stagger: bool = False
+    ) -> AsyncIterator[float]:
+        """Wait for the turn of the poll and a free slot.
+
+        :param interval: Polling interval of the account in seconds
+        :param stagger: True if the poll is sent by the polling loop
+        :return: Time in milliseconds the poll was delayed
+        """
+        loop = self._hass.loop
+        now = loop.time()
+        if stagger and len(self._accounts) > 1:
+            start = max(now, self._next_start)
+            if start - now > self._max_delay:
+                start = now + self._max_delay
+            self._next_start = start + min(
+                interval / len(self._accounts), self._max_delay
+            )
+            if start > now:
+                _LOGGER.debug("Delaying the poll by %.2f seconds", start - now)
+                await asyncio.sleep(start - now)
+        async with self._semaphore:
+            yield (loop.time() - now) * 1000
+
+
+@callback
+def async_get_poll_coordinator(hass: HomeAssistant) -> PollCoordinator:
+    """Get the coordinator shared by every account."""
+    if (coordinator := hass.data.get(DATA_POLL_COORDINATOR)) is None:
+        coordinator = hass.data[DATA_POLL_COORDINATOR] = PollCoordinator(hass)
+    return coordinator
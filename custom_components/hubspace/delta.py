@@ -0,0 +1,103 @@
+"""Drop update events for devices whose states did not change."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from aioafero import AferoDevice, EventType
+from homeassistant.core import CALLBACK_TYPE, callback
+
+
+def device_fingerprint(device: AferoDevice) -> int:
+    """Generate a cheap fingerprint of the states of a device.
+
+    The last update time is ignored as the cloud refreshes it without
+    the value changing.
+    """
+    return hash(
+        tuple(
+            (state.functionClass, state.functionInstance, repr(state.value))
+            for state in device.states
+        )
+    )
+
+
+class DeviceDeltaFilter:
+    """Forward only the devices that changed since the previous poll.
+
+    Every poll emits a RESOURCE_UPDATED event for each device of the
+    account. The states of each device are fingerprinted and the event
+    is dropped before reaching the controllers if the fingerprint
+    matches the one of the previous poll.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the filter."""
+        self._fingerprints: dict[str, int] = {}
+        self.forwarded: int = 0
+        self.suppressed: int = 0
+
+    @callback
+    def async_attach(self, events: Any) -> CALLBACK_TYPE:
+        """Filter the events emitted by the event stream.
+
+        :param events: EventStream of the aioafero bridge
+        :return: Callback that removes the filter
+        """
+        emit = events.emit
+
+        def filtered_emit(event_type: EventType, data: dict | None = None) -> None:
+            if self.should_forward(event_type, data):
+                emit(event_type, data)
+
+        events.emit = filtered_emit
+
+        @callback
+        def detach() -> None:
+            events.emit = emit
+            self.reset()
+
+        return detach
+
+    def should_forward(self, event_type: EventType, data: dict | None) -> bool:
+        """Determine if the event must be sent to the controllers."""
+        device = data.get("device") if data else None
+        if not isinstance(device, AferoDevice):
+            return True
+        if event_type == EventType.RESOURCE_DELETED:
+            self._fingerprints.pop(device.id, None)
+            return True
+        fingerprint = device_fingerprint(device)
+        previous = self._fingerprints.get(device.id)
+        self._fingerprints[device.id] = fingerprint
+        if event_type == EventType.RESOURCE_UPDATED and previous == fingerprint:
+            self.suppressed += 1
+            return False
+        self.forwarded += 1
+        return True
+
+    @callback
+    def async_invalidate(
+        self, resource_id: str, split_identifier: str | None = None
+    ) -> None:
+        """Forward the next update of the device.
+
+        Commands update the controllers locally, so the next poll must be
+        forwarded even if the cloud reports the states of the previous
+        poll.
+
+        :param resource_id: ID of the resource that received the command
+        :param split_identifier: Identifier of a resource split from its
+            device, whose ID is ``<device id>-<split identifier>-<instance>``
+        """
+        device_id = (
+            resource_id.rsplit(f"-{split_identifier}-", 1)[0]
+            if split_identifier
+            else resource_id
+        )
+        self._fingerprints.pop(device_id, None)
+
+    @callback
+    def reset(self) -> None:
+        """Forget every fingerprint."""
+        self._fingerprints.clear()
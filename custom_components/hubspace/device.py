@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import contextlib
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+import sys
+from typing import TYPE_CHECKING, Any
 
 from aioafero import EventType
-from aioafero.v1 import AferoBridgeV1, DeviceController
+from aioafero.v1 import AferoBridgeV1, AferoModelResource, DeviceController
 from aioafero.v1.models import Device
 from homeassistant.const import CONF_USERNAME
 from homeassistant.core import callback
@@ -18,8 +20,84 @@ if TYPE_CHECKING:
     from .bridge import HubspaceBridge
 
 
+@dataclass(frozen=True)
+class DeviceContext:
+    """Attributes shared by every entity of a Hubspace device."""
+
+    parent_id: str
+    device_info: dr.DeviceInfo
+    # Name of the device that prefixes the names of its entities
+    name: str | None
+
+    @property
+    def identifiers(self) -> set[tuple[str, str]]:
+        """Identifiers of the device in the device registry."""
+        return self.device_info["identifiers"]
+
+
+@callback
+def async_get_device_context(
+    bridge: HubspaceBridge, resource: AferoModelResource
+) -> DeviceContext:
+    """Get the context of the device that contains the resource.
+
+    The context is created once per device and shared by its entities.
+    """
+    parent_id = resource.device_information.parent_id
+    if (context := bridge.device_contexts.get(parent_id)) is None:
+        parent_id = sys.intern(parent_id)
+        name = resource.device_information.name
+        context = bridge.device_contexts[parent_id] = DeviceContext(
+            parent_id=parent_id,
+            device_info=dr.DeviceInfo(identifiers={(DOMAIN, parent_id)}),
+            name=sys.intern(name) if name else None,
+        )
+    return context
+
+
+def device_registration(hs_device: Device) -> dict[str, Any]:
+    """Get the device registry attributes of a Hubspace device."""
+    connections = set()
+    if hs_device.device_information.wifi_mac:
+        connections.add(
+            (
+                dr.CONNECTION_NETWORK_MAC,
+                dr.format_mac(hs_device.device_information.wifi_mac),
+            )
+        )
+    if hs_device.device_information.ble_mac:
+        connections.add(
+            (dr.CONNECTION_BLUETOOTH, hs_device.device_information.ble_mac)
+        )
+    return {
+        "identifiers": {(DOMAIN, hs_device.device_information.parent_id)},
+        "name": hs_device.device_information.name,
+        "model": hs_device.device_information.model
+        or hs_device.device_information.default_name,
+        "manufacturer": hs_device.device_information.manufacturer,
+        "connections": connections,
+    }
+
+
+def registration_changed(
+    device: dr.DeviceEntry, entry_id: str, registration: dict[str, Any]
+) -> bool:
+    """Determine if the registry entry differs from the registration."""
+    return (
+        entry_id not in device.config_entries
+        or device.name != registration["name"]
+        or device.model != registration["model"]
+        or device.manufacturer != registration["manufacturer"]
+        or not registration.get("connections", set()) <= device.connections
+    )
+
+
 async def async_setup_devices(bridge: HubspaceBridge):
-    """Manage setup of devices."""
+    """Manage setup of devices.
+
+    The registry is reconciled with the current devices by their parent_id,
+    so only devices that were added or changed are written.
+    """
     entry = bridge.config_entry
     hass = bridge.hass
     api: AferoBridgeV1 = bridge.api  # to satisfy typing
@@ -27,25 +105,10 @@ async def async_setup_devices(bridge: HubspaceBridge):
     dev_controller: DeviceController = api.devices
 
     @callback
-    def add_device(hs_device: Device) -> dr.DeviceEntry:
+    def add_device(registration: dict[str, Any]) -> dr.DeviceEntry:
         """Register a Hubspace device in device registry."""
-        connections = []
-        if hs_device.device_information.wifi_mac:
-            connections.append(
-                (dr.CONNECTION_NETWORK_MAC, hs_device.device_information.wifi_mac)
-            )
-        if hs_device.device_information.ble_mac:
-            connections.append(
-                (dr.CONNECTION_BLUETOOTH, hs_device.device_information.ble_mac)
-            )
         return dev_reg.async_get_or_create(
-            config_entry_id=entry.entry_id,
-            identifiers={(DOMAIN, hs_device.device_information.parent_id)},
-            name=hs_device.device_information.name,
-            model=hs_device.device_information.model
-            or hs_device.device_information.default_name,
-            manufacturer=hs_device.device_information.manufacturer,
-            connections=connections,
+            config_entry_id=entry.entry_id, **registration
         )
 
     @callback
@@ -60,27 +123,52 @@ async def async_setup_devices(bridge: HubspaceBridge):
         """Handle event from Device controller."""
         if evt_type == EventType.RESOURCE_DELETED:
             with contextlib.suppress(KeyError, AttributeError):
+                bridge.device_contexts.pop(hs_device.device_information.parent_id, None)
                 remove_device(hs_device.device_information.parent_id)
         elif evt_type == EventType.RESOURCE_ADDED:
-            add_device(hs_device)
-
-    # create/update all current devices found in controllers
-    known_devices = [add_device(hs_device) for hs_device in dev_controller]
+            async_get_device_context(bridge, hs_device)
+            add_device(device_registration(hs_device))
 
+    # Registry entries of the account by their Hubspace identifier
+    registered: dict[str, dr.DeviceEntry] = {
+        identifier: device
+        for device in dr.async_entries_for_config_entry(dev_reg, entry.entry_id)
+        for domain, identifier in device.identifiers
+        if domain == DOMAIN
+    }
+    registrations = {}
+    for hs_device in dev_controller:
+        async_get_device_context(bridge, hs_device)
+        registrations[hs_device.device_information.parent_id] = device_registration(
+            hs_device
+        )
     # Create the hub device
-    hub_device = dev_reg.async_get_or_create(
-        config_entry_id=entry.entry_id,
-        identifiers={(DOMAIN, bridge.config_entry.data[CONF_USERNAME])},
-        name=f"Hubspace API - {bridge.config_entry.data[CONF_USERNAME]}",
-        model="cloud",
-        manufacturer="Hubspace",
-    )
-    known_devices.append(hub_device)
+    username = bridge.config_entry.data[CONF_USERNAME]
+    registrations[username] = {
+        "identifiers": {(DOMAIN, username)},
+        "name": f"Hubspace API - {username}",
+        "model": "cloud",
+        "manufacturer": "Hubspace",
+    }
+
+    # create/update the devices that are new or changed
+    known_devices: set[str] = set()
+    for parent_id, registration in registrations.items():
+        device = registered.get(parent_id)
+        if device is None or registration_changed(
+            device, entry.entry_id, registration
+        ):
+            device = add_device(registration)
+        known_devices.add(device.id)
 
     # Check for nodes that no longer exist and remove them
-    for device in dr.async_entries_for_config_entry(dev_reg, entry.entry_id):
-        if device not in known_devices:
-            dev_reg.async_remove_device(device.id)
+    removed = {
+        device.id
+        for device in dr.async_entries_for_config_entry(dev_reg, entry.entry_id)
+        if device.id not in known_devices
+    }
+    for device_id in removed:
+        dev_reg.async_remove_device(device_id)
 
     # add listener for updates on Hubspace controllers
     entry.async_on_unload(dev_controller.subscribe(handle_device_event))
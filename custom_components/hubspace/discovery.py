@@ -0,0 +1,161 @@
+"""Discover the entities provided by the Hubspace resources."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, Final, NamedTuple
+
+from aioafero import EventType
+from aioafero.v1 import AferoBridgeV1, AferoController, AferoModelResource
+from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE, callback
+
+# Platform of every resource of a controller, by the controller attribute
+CONTROLLER_PLATFORMS: Final[dict[str, Platform]] = {
+    "fans": Platform.FAN,
+    "lights": Platform.LIGHT,
+    "locks": Platform.LOCK,
+    "portable_acs": Platform.CLIMATE,
+    "switches": Platform.SWITCH,
+    "thermostats": Platform.CLIMATE,
+    "valves": Platform.VALVE,
+}
+# Platform of every key within the resource attribute
+FEATURE_PLATFORMS: Final[dict[str, Platform]] = {
+    "binary_sensors": Platform.BINARY_SENSOR,
+    "numbers": Platform.NUMBER,
+    "selects": Platform.SELECT,
+    "sensors": Platform.SENSOR,
+}
+
+
+class DiscoveredEntity(NamedTuple):
+    """An entity that a platform can create."""
+
+    controller: AferoController
+    resource: AferoModelResource
+    # Key within the resource feature, or None for the resource itself
+    key: Any
+
+
+DiscoveryListener = Callable[[Platform, list[DiscoveredEntity]], None]
+
+
+class EntityDiscovery:
+    """Index of the entities of every platform.
+
+    Every resource is inspected once when it is added and the entities it
+    provides are grouped by platform. Platforms read the index during their
+    setup and listen for the entities of resources added afterwards.
+    """
+
+    def __init__(self, api: AferoBridgeV1) -> None:
+        """Initialize the index for the controllers of the API."""
+        self._api = api
+        # Platform -> resource id -> entities
+        self._index: dict[Platform, dict[str, list[DiscoveredEntity]]] = {}
+        self._listeners: dict[Platform | None, list[DiscoveryListener]] = {}
+
+    @property
+    def platforms(self) -> set[Platform]:
+        """Platforms that have at least one entity."""
+        return {platform for platform, resources in self._index.items() if resources}
+
+    def entities(self, platform: Platform) -> list[DiscoveredEntity]:
+        """Get the entities of the platform."""
+        return [
+            entity
+            for entities in self._index.get(platform, {}).values()
+            for entity in entities
+        ]
+
+    @callback
+    def async_setup(self) -> list[CALLBACK_TYPE]:
+        """Index the current resources and follow the controllers.
+
+        :return: Callbacks that stop following the controllers
+        """
+        controller_platforms = {
+            id(getattr(self._api, attr)): platform
+            for attr, platform in CONTROLLER_PLATFORMS.items()
+            if hasattr(self._api, attr)
+        }
+        unsubscribes = []
+        for controller in self._api.controllers:
+            platform = controller_platforms.get(id(controller))
+
+            @callback
+            def async_handle_event(
+                event_type: EventType,
+                resource: AferoModelResource,
+                controller: AferoController = controller,
+                platform: Platform | None = platform,
+            ) -> None:
+                if event_type == EventType.RESOURCE_DELETED:
+                    self._async_remove(resource)
+                else:
+                    self._async_notify(self._async_add(controller, platform, resource))
+
+            for resource in controller:
+                self._async_add(controller, platform, resource)
+            unsubscribes.append(
+                controller.subscribe(
+                    async_handle_event,
+                    event_filter=(EventType.RESOURCE_ADDED, EventType.RESOURCE_DELETED),
+                )
+            )
+        return unsubscribes
+
+    @callback
+    def _async_add(
+        self,
+        controller: AferoController,
+        platform: Platform | None,
+        resource: AferoModelResource,
+    ) -> dict[Platform, list[DiscoveredEntity]]:
+        """Index the entities of a resource."""
+        added: dict[Platform, list[DiscoveredEntity]] = {}
+        if platform is not None:
+            added[platform] = [DiscoveredEntity(controller, resource, None)]
+        for feature, feature_platform in FEATURE_PLATFORMS.items():
+            if keys := getattr(resource, feature, None):
+                added.setdefault(feature_platform, []).extend(
+                    DiscoveredEntity(controller, resource, key) for key in keys
+                )
+        for added_platform, entities in added.items():
+            self._index.setdefault(added_platform, {})[resource.id] = entities
+        return added
+
+    @callback
+    def _async_remove(self, resource: AferoModelResource) -> None:
+        """Remove the entities of a resource."""
+        for resources in self._index.values():
+            resources.pop(resource.id, None)
+
+    @callback
+    def async_add_listener(
+        self, listener: DiscoveryListener, platform: Platform | None = None
+    ) -> CALLBACK_TYPE:
+        """Listen for the entities of new resources.
+
+        :param listener: Called with the platform and its new entities
+        :param platform: Platform to listen for, or None for every platform
+        """
+        listeners = self._listeners.setdefault(platform, [])
+        listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(listener)
+
+        return remove_listener
+
+    @callback
+    def _async_notify(self, added: dict[Platform, list[DiscoveredEntity]]) -> None:
+        """Notify the listeners of the new entities."""
+        for platform, entities in added.items():
+            for listener in (
+                *self._listeners.get(None, ()),
+                *self._listeners.get(platform, ()),
+            ):
+                listener(platform, entities)
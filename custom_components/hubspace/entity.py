@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 from functools import wraps
+from typing import Any
 
 from aioafero.v1 import AferoController, AferoModelResource
 from aioafero.v1.controllers.event import EventType
 from homeassistant.core import callback
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
 
 from .bridge import HubspaceBridge
-from .const import DOMAIN
+from .const import EVENT_OPTIMISTIC_STATE_REVERTED
+from .device import async_get_device_context
+from .entity_index import async_index_entity
 
 
 class HubspaceBaseEntity(Entity):  # pylint: disable=hass-enforce-class-module
@@ -31,11 +33,13 @@ class HubspaceBaseEntity(Entity):  # pylint: disable=hass-enforce-class-module
         self.controller = controller
         self.resource = resource
         self.logger = bridge.logger.getChild(resource.type.value)
+        # Shared by every entity of the device
+        context = async_get_device_context(bridge, resource)
 
         # Entity class attributes
         unique_id = f"{resource.id}.{instance}" if instance else resource.id
         self._attr_unique_id = unique_id or resource.id
-        self._attr_has_entity_name = bool(self.resource.device_information.name)
+        self._attr_has_entity_name = context.name is not None
 
         if instance is not False:
             self._attr_name = instance if instance else type(self.resource).__name__
@@ -46,19 +50,33 @@ class HubspaceBaseEntity(Entity):  # pylint: disable=hass-enforce-class-module
         else:
             self._attr_name = type(self.resource).__name__
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self.resource.device_information.parent_id)},
-        )
+        self._attr_device_info = context.device_info
+        # Values requested by a command that the cloud has not confirmed yet
+        self._optimistic_state: dict[str, Any] = {}
 
     async def async_added_to_hass(self) -> None:
         """Call when an entity is added."""
         self.async_on_remove(
-            self.controller.subscribe(
-                self.handle_event,
-                id_filter=self.resource.id,
-                event_filter=EventType.RESOURCE_UPDATED,
+            self.bridge.router.async_register(
+                self.controller, self.resource.id, self.handle_event
             )
         )
+        self.async_on_remove(
+            lambda: self.bridge.write_coalescer.async_discard(self)
+        )
+        self.async_on_remove(
+            lambda: self.bridge.optimistic_tracker.async_untrack(self)
+        )
+        if self.resource is not None:
+            self.async_on_remove(
+                async_index_entity(
+                    self.hass,
+                    self.platform.domain,
+                    self.unique_id,
+                    self.bridge,
+                    self.resource.id,
+                )
+            )
 
     @property
     def available(self) -> bool:
@@ -66,6 +84,9 @@ class HubspaceBaseEntity(Entity):  # pylint: disable=hass-enforce-class-module
         # entities without a device attached should be always available
         if self.resource is None:
             return True
+        # Restored from the snapshot and not confirmed by the cloud
+        if self.bridge.awaiting_cloud:
+            return False
         return self.resource.available
 
     @callback
@@ -79,22 +100,107 @@ class HubspaceBaseEntity(Entity):  # pylint: disable=hass-enforce-class-module
         """Handle status event for this resource (or it's parent)."""
         self.logger.debug("Received status update for %s", self.entity_id)
         self.on_update()
+        self._async_reconcile_optimistic_state()
+        self.bridge.write_coalescer.async_schedule(self)
+
+    def optimistic(self, key: str, value: Any) -> Any:
+        """Get the optimistic value for the attribute, if one is pending.
+
+        :param key: Name of the entity attribute
+        :param value: Value reported by the resource
+        """
+        return self._optimistic_state.get(key, value)
+
+    @callback
+    def async_set_optimistic_state(self, **values: Any) -> None:
+        """Show the requested values right away.
+
+        The values are kept until a poll confirms them, the command fails,
+        or the optimistic timeout expires.
+        """
+        self._optimistic_state.update(values)
         self.async_write_ha_state()
 
+    @callback
+    def async_revert_optimistic_state(self) -> None:
+        """Drop all optimistic values and show the resource state."""
+        self.bridge.optimistic_tracker.async_untrack(self)
+        if not self._optimistic_state:
+            return
+        self._optimistic_state = {}
+        self.async_write_ha_state()
+
+    @callback
+    def async_command_sent(self) -> None:
+        """Start waiting for the cloud to confirm the optimistic values."""
+        if self._optimistic_state:
+            self.bridge.optimistic_tracker.async_track(
+                self, self.bridge.optimistic_state_timeout
+            )
+        # aioafero applies the command to the resource, so pick up any
+        # attribute that was not set optimistically
+        self.on_update()
+        self.bridge.write_coalescer.async_schedule(self)
+
+    def optimistic_state_confirmed(self, key: str, expected: Any, actual: Any) -> bool:
+        """Determine if the resource confirms the optimistic value."""
+        return expected == actual
+
+    @callback
+    def _async_reconcile_optimistic_state(self) -> None:
+        """Drop optimistic values that the resource now reports."""
+        if not self._optimistic_state:
+            return
+        pending = self._optimistic_state
+        # Attributes must be read without the optimistic values applied
+        self._optimistic_state = {}
+        self._optimistic_state = {
+            key: expected
+            for key, expected in pending.items()
+            if not self.optimistic_state_confirmed(key, expected, getattr(self, key))
+        }
+        if not self._optimistic_state:
+            self.bridge.optimistic_tracker.async_untrack(self)
+
+    @callback
+    def async_optimistic_state_expired(self) -> None:
+        """Revert optimistic values the cloud did not confirm in time."""
+        if not self._optimistic_state:
+            return
+        self.logger.info(
+            "Reverting %s as the attributes %s were not confirmed",
+            self.entity_id,
+            ", ".join(self._optimistic_state),
+        )
+        self.hass.bus.async_fire(
+            EVENT_OPTIMISTIC_STATE_REVERTED,
+            {
+                "entity_id": self.entity_id,
+                "attributes": list(self._optimistic_state),
+            },
+        )
+        self.async_revert_optimistic_state()
+
 
 def update_decorator(method):
-    """Force HA to automatically update.
+    """Manage the optimistic state of a command.
 
     Hubspace can be slow to update, which causes a delay between HA UI
-    and what the user just did. Force it to take the new states right
-    away.
+    and what the user just did. The command sets the values it expects
+    with ``async_set_optimistic_state`` so they are shown right away. They
+    are reverted if the command fails, otherwise they are reconciled with
+    the next poll.
     """
 
     @wraps(method)
     async def _impl(*args, **kwargs):
-        res = await method(*args, **kwargs)
         ha_entity: HubspaceBaseEntity = args[0]
-        ha_entity.handle_event(EventType.RESOURCE_UPDATED, None)
+        try:
+            res = await method(*args, **kwargs)
+        except Exception:
+            ha_entity.async_revert_optimistic_state()
+            raise
+        ha_entity.async_command_sent()
         return res
 
     return _impl
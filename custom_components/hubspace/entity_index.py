@@ -0,0 +1,59 @@
+"""Index of the Hubspace entities loaded within Home Assistant."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DATA_ENTITY_INDEX
+
+if TYPE_CHECKING:
+    from .bridge import HubspaceBridge
+
+
+@dataclass(frozen=True)
+class IndexedEntity:
+    """Location of an entity within the Hubspace API."""
+
+    bridge: HubspaceBridge
+    device_id: str
+
+
+@callback
+def async_get_entity_index(
+    hass: HomeAssistant,
+) -> dict[tuple[str, str], IndexedEntity]:
+    """Get the index keyed by the entity domain and unique_id."""
+    return hass.data.setdefault(DATA_ENTITY_INDEX, {})
+
+
+@callback
+def async_index_entity(
+    hass: HomeAssistant,
+    domain: str,
+    unique_id: str,
+    bridge: HubspaceBridge,
+    device_id: str,
+) -> CALLBACK_TYPE:
+    """Add an entity to the index.
+
+    :param hass: Home Assistant instance
+    :param domain: Domain of the entity, such as light
+    :param unique_id: Unique ID of the entity
+    :param bridge: Bridge that manages the entity
+    :param device_id: Afero device id used for requests
+    :return: Callback that removes the entity from the index
+    """
+    index = async_get_entity_index(hass)
+    key = (domain, unique_id)
+    indexed = index[key] = IndexedEntity(bridge, device_id)
+
+    @callback
+    def remove() -> None:
+        # The entity may have been re-added by a reload
+        if index.get(key) is indexed:
+            del index[key]
+
+    return remove
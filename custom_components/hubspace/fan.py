@@ -49,36 +49,42 @@ class HubspaceFan(HubspaceBaseEntity, FanEntity):
     @property
     def is_on(self) -> bool | None:
         """Return true if fan is spinning."""
-        return (
+        return self.optimistic(
+            "is_on",
             self.resource.is_on
             if self._supported_features & FanEntityFeature.TURN_ON
-            else None
+            else None,
         )
 
     @property
     def current_direction(self) -> str:
         """Returns the current direction of the fan."""
-        return "forward" if self.resource.current_direction else "reverse"
+        return self.optimistic(
+            "current_direction",
+            "forward" if self.resource.current_direction else "reverse",
+        )
 
     @property
     def percentage(self) -> int | None:
         """Current percentage of spinning."""
-        return (
+        return self.optimistic(
+            "percentage",
             self.resource.speed.speed
             if self.supported_features & FanEntityFeature.SET_SPEED
-            else None
+            else None,
         )
 
     @property
     def preset_mode(self) -> str | None:
         """Current preset for the fan."""
-        return (
+        return self.optimistic(
+            "preset_mode",
             "breeze"
             if (
                 self.supported_features & FanEntityFeature.PRESET_MODE
                 and self.resource.preset.enabled
             )
-            else None
+            else None,
         )
 
     @property
@@ -99,6 +105,22 @@ class HubspaceFan(HubspaceBaseEntity, FanEntity):
             else None
         )
 
+    def _set_optimistic_state(self, **values: Any) -> None:
+        """Set the optimistic state for attributes the fan supports."""
+        feature_map = {
+            "is_on": FanEntityFeature.TURN_ON,
+            "percentage": FanEntityFeature.SET_SPEED,
+            "preset_mode": FanEntityFeature.PRESET_MODE,
+            "current_direction": FanEntityFeature.DIRECTION,
+        }
+        self.async_set_optimistic_state(
+            **{
+                key: val
+                for key, val in values.items()
+                if self._supported_features & feature_map[key]
+            }
+        )
+
     @update_decorator
     async def async_turn_on(
         self,
@@ -107,6 +129,12 @@ class HubspaceFan(HubspaceBaseEntity, FanEntity):
         **kwargs: Any,
     ) -> None:
         """Turn on the entity."""
+        optimistic_state = {"is_on": True}
+        if preset_mode:
+            optimistic_state["preset_mode"] = preset_mode
+        if percentage is not None:
+            optimistic_state["percentage"] = percentage
+        self._set_optimistic_state(**optimistic_state)
         await self.bridge.async_request_call(
             self.controller.set_state,
             device_id=self.resource.id,
@@ -121,6 +149,7 @@ class HubspaceFan(HubspaceBaseEntity, FanEntity):
         **kwargs: Any,
     ) -> None:
         """Turn off the fan."""
+        self._set_optimistic_state(is_on=False)
         await self.bridge.async_request_call(
             self.controller.set_state,
             device_id=self.resource.id,
@@ -130,6 +159,7 @@ class HubspaceFan(HubspaceBaseEntity, FanEntity):
     @update_decorator
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the speed percentage of the fan."""
+        self._set_optimistic_state(is_on=True, percentage=percentage)
         await self.bridge.async_request_call(
             self.controller.set_state,
             device_id=self.resource.id,
@@ -140,6 +170,7 @@ class HubspaceFan(HubspaceBaseEntity, FanEntity):
     @update_decorator
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the preset mode of the fan."""
+        self._set_optimistic_state(is_on=True, preset_mode=preset_mode or None)
         await self.bridge.async_request_call(
             self.controller.set_state,
             device_id=self.resource.id,
@@ -150,6 +181,7 @@ class HubspaceFan(HubspaceBaseEntity, FanEntity):
     @update_decorator
     async def async_set_direction(self, direction: str) -> None:
         """Set the direction of the fan."""
+        self._set_optimistic_state(is_on=True, current_direction=direction)
         await self.bridge.async_request_call(
             self.controller.set_state,
             device_id=self.resource.id,
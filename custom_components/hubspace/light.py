@@ -13,6 +13,7 @@ from homeassistant.components.light import (
     ColorMode,
     LightEntity,
     LightEntityFeature,
+    brightness_supported,
     filter_supported_color_modes,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -37,7 +38,6 @@ class HubspaceLight(HubspaceBaseEntity, LightEntity):
         """Initialize an Afero light."""
 
         super().__init__(bridge, controller, resource)
-        self._supported_features: LightEntityFeature = LightEntityFeature(0)
         supported_color_modes = {ColorMode.ONOFF}
         if self.resource.supports_color:
             supported_color_modes.add(ColorMode.RGB)
@@ -48,95 +48,85 @@ class HubspaceLight(HubspaceBaseEntity, LightEntity):
         self._attr_supported_color_modes = filter_supported_color_modes(
             supported_color_modes
         )
+        self.on_update()
+
+    @callback
+    def on_update(self) -> None:
+        """Compute the attributes derived from the resource.
+
+        Home Assistant reads them on every state write, so they are only
+        computed when the resource changes.
+        """
+        self._attr_color_mode = get_color_mode(
+            self.resource, self._attr_supported_color_modes
+        )
+        if self.resource.color_temperature:
+            supported = self.resource.color_temperature.supported
+            self._attr_min_color_temp_kelvin = min(supported)
+            self._attr_max_color_temp_kelvin = max(supported)
+        else:
+            self._attr_min_color_temp_kelvin = None
+            self._attr_max_color_temp_kelvin = None
+        if self.resource.effect:
+            self._attr_effect_list = [
+                effect
+                for effects in self.resource.effect.effects.values()
+                for effect in effects
+            ] or None
+            self._attr_supported_features = LightEntityFeature.EFFECT
+        else:
+            self._attr_effect_list = None
+            self._attr_supported_features = LightEntityFeature(0)
 
     @property
     def brightness(self) -> int | None:
         """The brightness of this light between 1..255."""
-        return (
+        return self.optimistic(
+            "brightness",
             value_to_brightness((1, 100), self.resource.brightness)
             if self.resource.dimming
-            else None
+            else None,
         )
 
-    @property
-    def color_mode(self) -> ColorMode:
-        """Get the current color mode for the light."""
-        return get_color_mode(self.resource, self._attr_supported_color_modes)
-
     @property
     def color_temp_kelvin(self) -> int | None:
         """Get the current color temperature for the light."""
-        return (
+        return self.optimistic(
+            "color_temp_kelvin",
             self.resource.color_temperature.temperature
             if self.resource.color_temperature
-            else None
+            else None,
         )
 
     @property
     def effect(self) -> str | None:
         """Get the current effect for the light."""
-        return (
+        return self.optimistic(
+            "effect",
             self.resource.effect.effect
             if (self.resource.effect and self.resource.color_mode.mode == "sequence")
-            else None
+            else None,
         )
 
-    @property
-    def effect_list(self) -> list[str] | None:
-        """Get all available effects for the light."""
-        all_effects = []
-        for effects in self.resource.effect.effects.values() or []:
-            all_effects.extend(effects)
-        return all_effects or None
-
     @property
     def is_on(self) -> bool | None:
         """Determine if the light is currently on."""
-        return self.resource.is_on
-
-    @property
-    def max_color_temp_kelvin(self) -> int | None:
-        """Get the lights maximum temperature color."""
-        return (
-            max(self.resource.color_temperature.supported)
-            if self.resource.color_temperature
-            else None
-        )
-
-    @property
-    def min_color_temp_kelvin(self) -> int | None:
-        """Get the lights minimum temperature color."""
-        return (
-            min(self.resource.color_temperature.supported)
-            if self.resource.color_temperature
-            else None
-        )
+        return self.optimistic("is_on", self.resource.is_on)
 
     @property
     def rgb_color(self) -> tuple[int, int, int] | None:
         """Get the lights current RGB colors."""
-        return (
+        return self.optimistic(
+            "rgb_color",
             (
                 self.resource.color.red,
                 self.resource.color.green,
                 self.resource.color.blue,
             )
             if self.resource.color
-            else None
+            else None,
         )
 
-    @property
-    def supported_color_modes(self) -> set[ColorMode]:
-        """Get all supported color modes."""
-        return self._attr_supported_color_modes
-
-    @property
-    def supported_features(self) -> LightEntityFeature:
-        """Get all supported light features."""
-        if self.resource.effect:
-            return LightEntityFeature(0) | LightEntityFeature.EFFECT
-        return LightEntityFeature(0)
-
     @update_decorator
     async def async_turn_on(self, **kwargs) -> None:
         """Turn device on."""
@@ -153,6 +143,18 @@ class HubspaceLight(HubspaceBaseEntity, LightEntity):
             color_mode = "color"
         elif effect:
             color_mode = "sequence"
+        optimistic_state = {"is_on": True}
+        if brightness is not None and brightness_supported(
+            self._attr_supported_color_modes
+        ):
+            optimistic_state["brightness"] = value_to_brightness((1, 100), brightness)
+        if temperature:
+            optimistic_state["color_temp_kelvin"] = temperature
+        if color:
+            optimistic_state["rgb_color"] = tuple(color)
+        if effect:
+            optimistic_state["effect"] = effect
+        self.async_set_optimistic_state(**optimistic_state)
         await self.bridge.async_request_call(
             self.controller.set_state,
             device_id=self.resource.id,
@@ -167,6 +169,7 @@ class HubspaceLight(HubspaceBaseEntity, LightEntity):
     @update_decorator
     async def async_turn_off(self, **kwargs) -> None:
         """Turn device off."""
+        self.async_set_optimistic_state(is_on=False)
         await self.bridge.async_request_call(
             self.controller.set_state,
             device_id=self.resource.id,
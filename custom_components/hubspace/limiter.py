@@ -0,0 +1,171 @@
+"""Limit the requests sent to the Hubspace API."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+import heapq
+import itertools
+import time
+
+from homeassistant.core import HomeAssistant, callback
+
+# Requests with a lower priority are sent first
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+
+
+class RequestLimiter:
+    """Bound the concurrency and the rate of the requests of an account.
+
+    Requests wait for a free slot and a token from a bucket that refills
+    at the configured rate. Waiting requests are released by priority so
+    user commands are not stuck behind polls.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_in_flight: int,
+        rate: float,
+        on_wait: Callable[[float], None] | None = None,
+    ) -> None:
+        """Initialize the limiter.
+
+        :param hass: Home Assistant instance
+        :param max_in_flight: Maximum number of requests sent at once
+        :param rate: Maximum number of requests per second
+        :param on_wait: Called with the time in milliseconds a request waited
+        """
+        self._hass = hass
+        self.max_in_flight = max_in_flight
+        self.rate = rate
+        # Allow a burst of up to one second of requests
+        self._capacity = max(1.0, rate)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._in_flight = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+        self._refill_handle: asyncio.TimerHandle | None = None
+        self._on_wait = on_wait
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently sent."""
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        """Number of requests waiting to be sent."""
+        return sum(not future.done() for _, _, future in self._waiters)
+
+    @asynccontextmanager
+    async def async_slot(self, priority: int = PRIORITY_COMMAND) -> AsyncIterator[None]:
+        """Wait until the request can be sent.
+
+        :param priority: PRIORITY_COMMAND or PRIORITY_POLL
+        """
+        start = time.perf_counter()
+        await self._async_acquire(priority)
+        if self._on_wait:
+            self._on_wait((time.perf_counter() - start) * 1000)
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._async_dispatch()
+
+    async def _async_acquire(self, priority: int) -> None:
+        """Take a slot and a token, waiting on other requests if needed."""
+        self._async_refill()
+        if not self._waiters and self._async_take():
+            return
+        future: asyncio.Future[None] = self._hass.loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        self._async_dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over before the cancellation
+                self._in_flight -= 1
+                self._async_dispatch()
+            raise
+
+    @callback
+    def _async_refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    @callback
+    def _async_take(self) -> bool:
+        """Take a slot and a token if both are available."""
+        if self._in_flight >= self.max_in_flight or self._tokens < 1:
+            return False
+        self._in_flight += 1
+        self._tokens -= 1
+        return True
+
+    @callback
+    def _async_dispatch(self) -> None:
+        """Release the waiting requests that can be sent."""
+        self._async_refill()
+        while self._waiters:
+            future = self._waiters[0][2]
+            if future.done():
+                # Cancelled while waiting
+                heapq.heappop(self._waiters)
+                continue
+            if not self._async_take():
+                break
+            heapq.heappop(self._waiters)
+            future.set_result(None)
+        if (
+            self._waiters
+            and self._tokens < 1
+            and self._in_flight < self.max_in_flight
+            and self._refill_handle is None
+        ):
+            self._refill_handle = self._hass.loop.call_later(
+                (1 - self._tokens) / self.rate, self._async_refill_elapsed
+            )
+
+    @callback
+    def _async_refill_elapsed(self) -> None:
+        """Release the requests waiting on a token."""
+        self._refill_handle = None
+        self._async_dispatch()
+
+    @callback
+    def async_configure(self, max_in_flight: int, rate: float) -> None:
+        """Change the limits while requests are sent.
+
+        :param max_in_flight: Maximum number of requests sent at once
+        :param rate: Maximum number of requests per second
+        """
+        self._async_refill()
+        self.max_in_flight = max_in_flight
+        self.rate = rate
+        self._capacity = max(1.0, rate)
+        self._tokens = min(self._tokens, self._capacity)
+        if self._refill_handle is not None:
+            # The next token may arrive at a different time
+            self._refill_handle.cancel()
+            self._refill_handle = None
+        self._async_dispatch()
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel every waiting request."""
+        if self._refill_handle is not None:
+            self._refill_handle.cancel()
+            self._refill_handle = None
+        for _, _, future in self._waiters:
+            future.cancel()
+        self._waiters.clear()
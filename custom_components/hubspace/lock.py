@@ -1,6 +1,7 @@
 """Home Assistant entity for interacting with Afero lock."""
 
 from functools import partial
+from typing import Any
 
 from aioafero.v1 import AferoBridgeV1
 from aioafero.v1.controllers.event import EventType
@@ -16,6 +17,18 @@ from .const import DOMAIN
 from .entity import HubspaceBaseEntity, update_decorator
 
 
+LOCK_TRANSITIONS: dict[features.CurrentPositionEnum, tuple] = {
+    features.CurrentPositionEnum.LOCKING: (
+        features.CurrentPositionEnum.LOCKING,
+        features.CurrentPositionEnum.LOCKED,
+    ),
+    features.CurrentPositionEnum.UNLOCKING: (
+        features.CurrentPositionEnum.UNLOCKING,
+        features.CurrentPositionEnum.UNLOCKED,
+    ),
+}
+
+
 class HubspaceLock(HubspaceBaseEntity, LockEntity):
     """Representation of an Afero lock."""
 
@@ -37,35 +50,53 @@ class HubspaceLock(HubspaceBaseEntity, LockEntity):
         """States what features are supported by the lock."""
         return self._supported_features
 
+    @property
+    def lock_position(self) -> features.CurrentPositionEnum:
+        """Current position of the lock."""
+        return self.optimistic("lock_position", self.resource.position.position)
+
+    def optimistic_state_confirmed(self, key: str, expected: Any, actual: Any) -> bool:
+        """Determine if the resource confirms the optimistic value.
+
+        The lock may finish moving before the next poll, so the final
+        position also confirms the transition that was requested.
+        """
+        if key == "lock_position":
+            return actual in LOCK_TRANSITIONS.get(expected, (expected,))
+        return super().optimistic_state_confirmed(key, expected, actual)
+
     @property
     def is_locked(self) -> bool:
         """Indication of whether the lock is currently locked."""
-        return self.resource.position.position == features.CurrentPositionEnum.LOCKED
+        return self.lock_position == features.CurrentPositionEnum.LOCKED
 
     @property
     def is_locking(self) -> bool:
         """Indication of whether the lock is currently locking."""
-        return self.resource.position.position == features.CurrentPositionEnum.LOCKING
+        return self.lock_position == features.CurrentPositionEnum.LOCKING
 
     @property
     def is_unlocking(self) -> bool:
         """Indication of whether the lock is currently unlocking."""
-        return self.resource.position.position == features.CurrentPositionEnum.UNLOCKING
+        return self.lock_position == features.CurrentPositionEnum.UNLOCKING
 
     @property
     def is_opening(self) -> bool:
         """Indication of whether the lock is currently opening."""
-        return self.resource.position.position == features.CurrentPositionEnum.UNLOCKING
+        return self.lock_position == features.CurrentPositionEnum.UNLOCKING
 
     @property
     def is_open(self) -> bool:
         """Indication of whether the lock is currently open."""
-        return self.resource.position.position == features.CurrentPositionEnum.UNLOCKED
+        return self.lock_position == features.CurrentPositionEnum.UNLOCKED
 
     @update_decorator
     async def async_unlock(self, **kwargs) -> None:
         """Unlock all or specified locks."""
         self.logger.info("Unlocking %s [%s]", self.name, self.resource.id)
+        self.async_set_optimistic_state(
+            lock_position=features.CurrentPositionEnum.UNLOCKING
+        )
         await self.bridge.async_request_call(
             self.controller.set_state,
             device_id=self.resource.id,
@@ -76,6 +107,9 @@ class HubspaceLock(HubspaceBaseEntity, LockEntity):
     async def async_lock(self, **kwargs) -> None:
         """Lock all or specified locks."""
         self.logger.info("Unlocking %s [%s]", self.name, self.resource.id)
+        self.async_set_optimistic_state(
+            lock_position=features.CurrentPositionEnum.LOCKING
+        )
         await self.bridge.async_request_call(
             self.controller.set_state,
             device_id=self.resource.id,
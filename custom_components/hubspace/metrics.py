@@ -0,0 +1,185 @@
+"""Collect metrics about the communication with the Hubspace API."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Callable, Sequence
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .const import (
+    METRICS_LATENCY_BUCKETS_MS,
+    METRICS_QUEUE_WAIT_BUCKETS_MS,
+    METRICS_WINDOW,
+)
+
+
+class RollingHistogram:
+    """Histogram of the most recent samples using fixed buckets.
+
+    Only the bucket of each sample within the window is kept so memory
+    does not grow with the number of samples.
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = METRICS_LATENCY_BUCKETS_MS,
+        window: int = METRICS_WINDOW,
+    ) -> None:
+        """Initialize the histogram.
+
+        :param buckets: Upper bound of each bucket in ascending order
+        :param window: Number of samples kept
+        """
+        self.buckets = tuple(buckets)
+        # Last bucket holds any value above the largest upper bound
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._samples: deque[int] = deque(maxlen=window)
+        self.last: float | None = None
+
+    def __len__(self) -> int:
+        """Number of samples within the window."""
+        return len(self._samples)
+
+    def add(self, value: float) -> None:
+        """Add a sample to the histogram."""
+        if len(self._samples) == self._samples.maxlen:
+            self._counts[self._samples[0]] -= 1
+        bucket = bisect_left(self.buckets, value)
+        self._samples.append(bucket)
+        self._counts[bucket] += 1
+        self.last = value
+
+    def percentile(self, percent: float) -> float | None:
+        """Upper bound of the bucket that contains the percentile."""
+        if not self._samples:
+            return None
+        threshold = len(self._samples) * percent / 100
+        total = 0
+        for bucket, count in enumerate(self._counts):
+            total += count
+            if total >= threshold:
+                break
+        # Samples above the largest upper bound are reported as that bound
+        return self.buckets[min(bucket, len(self.buckets) - 1)]
+
+
+class BridgeMetrics:
+    """Metrics of a single Hubspace account."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.poll_latency = RollingHistogram()
+        self.command_latency = RollingHistogram()
+        self.queue_wait = RollingHistogram(METRICS_QUEUE_WAIT_BUCKETS_MS)
+        self.poll_delay = RollingHistogram(METRICS_QUEUE_WAIT_BUCKETS_MS)
+        self.payload_bytes: int | None = None
+        self.devices_per_poll: int | None = None
+        self.events_per_poll: int | None = None
+        self.retries: int = 0
+        self.reauths: int = 0
+        self._events: int = 0
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._payload_trackers: int = 0
+
+    @property
+    def measure_payload(self) -> bool:
+        """Whether the size of the polls is measured."""
+        return self._payload_trackers > 0
+
+    @callback
+    def async_track_payload(self) -> Callable[[], None]:
+        """Measure the size of the polls until the callback is called.
+
+        Measuring serializes the whole poll, so it only runs while a sensor
+        reports the size.
+        """
+        self._payload_trackers += 1
+
+        @callback
+        def untrack() -> None:
+            self._payload_trackers -= 1
+
+        return untrack
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> Callable[[], None]:
+        """Listen for metric updates."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify every listener."""
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def async_event_emitted(self, *args, **kwargs) -> None:
+        """Count an event sent to the controllers."""
+        self._events += 1
+
+    @callback
+    def async_poll_started(self, devices: int) -> None:
+        """Record the start of the event generation for a poll."""
+        self.devices_per_poll = devices
+        self._events = 0
+
+    @callback
+    def async_poll_completed(self, latency: float) -> None:
+        """Record the latency and the events of a poll.
+
+        :param latency: Time in milliseconds to fetch and process the poll
+        """
+        self.poll_latency.add(latency)
+        self.events_per_poll = self._events
+        self.async_update_listeners()
+
+    @callback
+    def async_payload_measured(self, size: int) -> None:
+        """Record the size of a poll.
+
+        The size is measured after the poll completed so it is reported
+        along with the next poll.
+        """
+        self.payload_bytes = size
+
+    @callback
+    def async_command_completed(self, latency: float) -> None:
+        """Record the latency of a command in milliseconds.
+
+        The latency is reported along with the next poll so commands do not
+        write the metric sensors.
+        """
+        self.command_latency.add(latency)
+
+    @callback
+    def async_queue_waited(self, wait: float) -> None:
+        """Record the time in milliseconds a request waited on the limiter.
+
+        The wait is reported along with the request that follows it.
+        """
+        self.queue_wait.add(wait)
+
+    @callback
+    def async_poll_delayed(self, delay: float) -> None:
+        """Record the time in milliseconds a poll waited on the other accounts."""
+        self.poll_delay.add(delay)
+
+    @callback
+    def async_retry(self) -> None:
+        """Count a retry."""
+        self.retries += 1
+        self.async_update_listeners()
+
+    @callback
+    def async_reauth(self, *args, **kwargs) -> None:
+        """Count a reauthentication."""
+        self.reauths += 1
+        self.async_update_listeners()
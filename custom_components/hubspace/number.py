@@ -1,16 +1,15 @@
 """Home Assistant entity for interacting with Afero Number."""
 
-from dataclasses import fields
-
 from aioafero.v1 import AferoController, AferoModelResource
-from aioafero.v1.controllers.event import EventType
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .bridge import HubspaceBridge
 from .const import DOMAIN
+from .discovery import DiscoveredEntity
 from .entity import HubspaceBaseEntity, update_decorator
 
 
@@ -47,7 +46,9 @@ class AferoNumberEntity(HubspaceBaseEntity, NumberEntity):
     @property
     def native_value(self) -> float:
         """The value of the number in the number's native_unit_of_measurement."""
-        return self.resource.numbers[self._identifier].value
+        return self.optimistic(
+            "native_value", self.resource.numbers[self._identifier].value
+        )
 
     @property
     def native_unit_of_measurement(self) -> str:
@@ -57,6 +58,7 @@ class AferoNumberEntity(HubspaceBaseEntity, NumberEntity):
     @update_decorator
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
+        self.async_set_optimistic_state(native_value=value)
         await self.bridge.async_request_call(
             self.controller.set_state,
             device_id=self.resource.id,
@@ -74,51 +76,17 @@ async def async_setup_entry(
     """Set up entities."""
     bridge: HubspaceBridge = hass.data[DOMAIN][config_entry.entry_id]
 
-    # add all current items in controller
-    entities = []
-    for controller in bridge.api.controllers:
-        if "numbers" not in [x.name for x in fields(controller.ITEM_CLS)]:
-            continue
-        # Listen for new devices
-        config_entry.async_on_unload(
-            controller.subscribe(
-                await generate_callback(bridge, controller, async_add_entities),
-                event_filter=EventType.RESOURCE_ADDED,
-            )
-        )
-        # Add any currently tracked entities
-        entities.extend(
-            [
-                AferoNumberEntity(bridge, controller, resource, number)
-                for resource in controller
-                for number in resource.numbers
-            ]
-        )
-    async_add_entities(entities)
-
-
-async def generate_callback(bridge, controller, async_add_entities: callback):
-    """Generate a callback function for handling new number entities.
-
-    Args:
-        bridge: HubspaceBridge instance for managing device communication
-        controller: AferoController instance managing the device
-        async_add_entities: Callback function to register new entities
-
-    Returns:
-        Callback function that adds new number entities when resources are added
-
-    """
-
-    async def add_entity_controller(
-        event_type: EventType, resource: AferoModelResource
-    ) -> None:
-        """Add an entity."""
+    @callback
+    def async_add_entity(platform: Platform, entities: list[DiscoveredEntity]) -> None:
+        """Add the numbers of a new resource."""
         async_add_entities(
-            [
-                AferoNumberEntity(bridge, controller, resource, number)
-                for number in resource.numbers
-            ]
+            AferoNumberEntity(bridge, controller, resource, number)
+            for controller, resource, number in entities
         )
 
-    return add_entity_controller
+    # Add any currently tracked entities
+    async_add_entity(Platform.NUMBER, bridge.discovery.entities(Platform.NUMBER))
+    # Listen for new devices
+    config_entry.async_on_unload(
+        bridge.discovery.async_add_listener(async_add_entity, Platform.NUMBER)
+    )
@@ -0,0 +1,77 @@
+"""Track optimistic states waiting for confirmation from the Hubspace cloud."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+
+if TYPE_CHECKING:
+    from .entity import HubspaceBaseEntity
+
+
+class OptimisticStateTracker:
+    """Expire optimistic states for every entity of a single bridge.
+
+    A single timer is used for the whole bridge. It fires at the earliest
+    deadline and notifies every entity whose deadline has passed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the tracker."""
+        self._hass = hass
+        self._deadlines: dict[HubspaceBaseEntity, float] = {}
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of entities waiting for confirmation."""
+        return len(self._deadlines)
+
+    @callback
+    def async_track(self, entity: HubspaceBaseEntity, timeout: float) -> None:
+        """Expire the optimistic state of the entity after the timeout."""
+        self._deadlines[entity] = self._hass.loop.time() + timeout
+        self._async_schedule()
+
+    @callback
+    def async_untrack(self, entity: HubspaceBaseEntity) -> None:
+        """Stop tracking the entity."""
+        if self._deadlines.pop(entity, None) is not None and not self._deadlines:
+            self._async_cancel_timer()
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop tracking all entities."""
+        self._async_cancel_timer()
+        self._deadlines.clear()
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Schedule the timer for the earliest deadline."""
+        self._async_cancel_timer()
+        if self._deadlines:
+            self._timer = self._hass.loop.call_at(
+                min(self._deadlines.values()), self._async_expire
+            )
+
+    @callback
+    def _async_expire(self) -> None:
+        """Notify all entities whose deadline has passed."""
+        self._timer = None
+        now = self._hass.loop.time()
+        expired = [
+            entity for entity, deadline in self._deadlines.items() if deadline <= now
+        ]
+        for entity in expired:
+            del self._deadlines[entity]
+            entity.async_optimistic_state_expired()
+        self._async_schedule()
+
+    @callback
+    def _async_cancel_timer(self) -> None:
+        """Cancel the timer if it is running."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
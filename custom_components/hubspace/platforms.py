@@ -0,0 +1,91 @@
+"""Set up the platforms that have Hubspace resources."""
+
+from __future__ import annotations
+
+import logging
+from typing import Final
+
+from homeassistant.config_entries import ConfigEntry, OperationNotAllowed
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+
+from .discovery import DiscoveredEntity, EntityDiscovery
+
+_LOGGER = logging.getLogger(__name__)
+
+# Platforms that always have entities on the hub device
+ALWAYS_LOADED_PLATFORMS: Final[tuple[Platform, ...]] = (
+    Platform.BUTTON,
+    Platform.SENSOR,
+)
+
+
+class PlatformLoader:
+    """Forward only the platforms with resources of the account.
+
+    Platforms are forwarded during setup for the resources already known
+    and later, on demand, once a new resource requires them.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        discovery: EntityDiscovery,
+    ) -> None:
+        """Initialize the loader."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._discovery = discovery
+        # Platforms that were set up
+        self.loaded: set[Platform] = set()
+        # Platforms that were set up or are being set up
+        self._requested: set[Platform] = set()
+
+    async def async_setup(self) -> None:
+        """Forward the platforms of the current resources."""
+        platforms = set(ALWAYS_LOADED_PLATFORMS) | self._discovery.platforms
+        self._config_entry.async_on_unload(
+            self._discovery.async_add_listener(self._async_entities_discovered)
+        )
+        _LOGGER.debug("Setting up platforms %s", sorted(platforms))
+        self._requested |= platforms
+        await self._hass.config_entries.async_forward_entry_setups(
+            self._config_entry, platforms
+        )
+        self.loaded |= platforms
+
+    @callback
+    def _async_entities_discovered(
+        self, platform: Platform, entities: list[DiscoveredEntity]
+    ) -> None:
+        """Forward the platform of a new resource if required."""
+        if platform in self._requested:
+            return
+        self._requested.add(platform)
+        self._hass.async_create_task(
+            self._async_forward({platform}), "hubspace-forward-platforms"
+        )
+
+    async def _async_forward(self, platforms: set[Platform]) -> None:
+        """Set up the platforms once the entry is loaded."""
+        _LOGGER.debug("Setting up platforms %s", sorted(platforms))
+        try:
+            await self._hass.config_entries.async_forward_entry_setups(
+                self._config_entry, platforms
+            )
+        except OperationNotAllowed:
+            # The entry was unloaded before the platforms were set up
+            self._requested -= platforms
+            return
+        self.loaded |= platforms
+
+    async def async_unload(self) -> bool:
+        """Unload the platforms that were set up."""
+        unloaded = await self._hass.config_entries.async_unload_platforms(
+            self._config_entry, self.loaded
+        )
+        if unloaded:
+            self.loaded.clear()
+            self._requested.clear()
+        return unloaded
@@ -0,0 +1,161 @@
+"""Adaptive polling of the Hubspace API."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import ADAPTIVE_POLLING_BURST_POLLS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AdaptivePollingScheduler:
+    """Adjust the polling interval based on account activity.
+
+    After a command or a detected change, the account is polled at the
+    minimum interval for a short burst. While nothing changes, the interval
+    doubles after every poll until it reaches the maximum interval.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        set_interval: Callable[[int], None],
+        refresh: Callable[[], Awaitable[None]],
+        min_interval: int,
+        max_interval: int,
+        burst_polls: int = ADAPTIVE_POLLING_BURST_POLLS,
+    ) -> None:
+        """Initialize the scheduler.
+
+        :param hass: Home Assistant instance
+        :param set_interval: Sets the interval of the polling loop
+        :param refresh: Performs a poll outside the polling loop
+        :param min_interval: Interval used during a burst
+        :param max_interval: Upper bound when backing off
+        :param burst_polls: Number of polls in a burst
+        """
+        self._hass = hass
+        self._set_interval = set_interval
+        self._refresh = refresh
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self._burst_polls = burst_polls
+        self._burst_remaining = 0
+        self._changes = 0
+        self._interval = self.min_interval
+        # Interval the polling loop is currently sleeping for
+        self._loop_interval = self.min_interval
+        self._refreshing = False
+        self._refresh_handle: asyncio.TimerHandle | None = None
+        self._refresh_task: asyncio.Task | None = None
+
+    @property
+    def interval(self) -> int:
+        """Current polling interval."""
+        return self._interval
+
+    @callback
+    def async_start(self) -> None:
+        """Start polling with a burst to settle the state after startup."""
+        self._burst_remaining = self._burst_polls
+        self._async_apply_interval(self.min_interval)
+
+    @callback
+    def async_activity(self) -> None:
+        """Start a burst of fast polls after a command was sent."""
+        self._burst_remaining = self._burst_polls
+        self._async_apply_interval(self.min_interval)
+        if self._loop_interval > self.min_interval:
+            self._async_schedule_refresh()
+
+    @callback
+    def async_change_detected(self, *args, **kwargs) -> None:
+        """Record that a poll detected a change."""
+        self._changes += 1
+
+    @callback
+    def async_poll_completed(self) -> None:
+        """Determine the next interval after a poll."""
+        if self._changes:
+            self._changes = 0
+            self._burst_remaining = self._burst_polls
+        if self._burst_remaining > 0:
+            self._burst_remaining -= 1
+            self._async_apply_interval(self.min_interval)
+        else:
+            self._async_apply_interval(
+                min(self.max_interval, max(self.min_interval, self._interval * 2))
+            )
+        if not self._refreshing:
+            # The polling loop sleeps for the interval set after its poll
+            self._loop_interval = self._interval
+        elif self._burst_remaining and self._loop_interval > self.min_interval:
+            self._async_schedule_refresh()
+
+    @callback
+    def async_set_bounds(self, min_interval: int, max_interval: int) -> None:
+        """Change the bounds of the interval without resetting the burst."""
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self._async_apply_interval(
+            min(self.max_interval, max(self.min_interval, self._interval))
+        )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel any poll that was scheduled outside the polling loop."""
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    @callback
+    def _async_apply_interval(self, interval: int) -> None:
+        """Update the interval of the polling loop."""
+        if interval != self._interval:
+            _LOGGER.debug("Adjusting polling interval to %s seconds", interval)
+        self._interval = interval
+        self._set_interval(interval)
+
+    @callback
+    def _async_schedule_refresh(self) -> None:
+        """Poll after the minimum interval.
+
+        The polling loop may be sleeping for the maximum interval, so the
+        first polls of a burst are requested directly.
+        """
+        if self._refresh_handle is not None:
+            return
+        self._refresh_handle = self._hass.loop.call_later(
+            self.min_interval, self._async_refresh
+        )
+
+    @callback
+    def _async_refresh(self) -> None:
+        """Start the poll outside the polling loop."""
+        self._refresh_handle = None
+        if self._refresh_task is not None:
+            # The previous poll is still running
+            self._async_schedule_refresh()
+            return
+        self._refresh_task = self._hass.async_create_background_task(
+            self._async_run_refresh(), "hubspace-adaptive-poll"
+        )
+
+    async def _async_run_refresh(self) -> None:
+        """Poll the API and log any failure."""
+        self._refreshing = True
+        try:
+            await self._refresh()
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug("Unable to poll the Hubspace API", exc_info=True)
+        finally:
+            self._refreshing = False
+            self._refresh_task = None
@@ -0,0 +1,94 @@
+"""Profile the processing of polls from the Hubspace API."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import cProfile
+import logging
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PollProfiler:
+    """Capture a cProfile trace of the next polls of a bridge.
+
+    The profiler is only enabled while a poll is processed, which covers
+    the controllers, the entity updates and the state writes that follow.
+    The stats are written by an executor once every poll was captured.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        polls: int,
+        path: Path,
+        on_done: Callable[[], None],
+    ) -> None:
+        """Initialize the profiler.
+
+        :param hass: Home Assistant instance
+        :param polls: Number of polls to capture
+        :param path: Destination of the pstats file
+        :param on_done: Called once every poll was captured
+        """
+        self._hass = hass
+        self._remaining = polls
+        self.path = path
+        self._on_done = on_done
+        self._profile = cProfile.Profile()
+        self._enabled = False
+
+    @callback
+    def async_poll_started(self) -> None:
+        """Start profiling the poll."""
+        if self._enabled:
+            return
+        try:
+            self._profile.enable()
+        except ValueError as err:
+            # Another profiler is running on the event loop
+            _LOGGER.warning("Unable to profile the Hubspace polls: %s", err)
+            self.async_cancel()
+            return
+        self._enabled = True
+
+    @callback
+    def async_poll_completed(self) -> None:
+        """Stop profiling once the updates of the poll were written."""
+        if not self._enabled:
+            return
+        self._remaining -= 1
+        # State writes are scheduled on the loop by the poll
+        self._hass.loop.call_soon(self._async_stop)
+
+    @callback
+    def _async_stop(self) -> None:
+        """Pause profiling and write the stats after the last poll."""
+        self._async_disable()
+        if self._remaining > 0:
+            return
+        self._on_done()
+        self._hass.async_create_background_task(
+            self._async_write(), "hubspace-profile"
+        )
+
+    async def _async_write(self) -> None:
+        """Write the stats to disk."""
+        await self._hass.async_add_executor_job(self._profile.dump_stats, self.path)
+        _LOGGER.info("Wrote the profile of the Hubspace polls to %s", self.path)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop profiling without writing the stats."""
+        self._async_disable()
+        self._on_done()
+
+    @callback
+    def _async_disable(self) -> None:
+        """Disable the profiler if it is running."""
+        if self._enabled:
+            self._profile.disable()
+            self._enabled = False
@@ -0,0 +1,77 @@
+"""Route the updates of the Hubspace resources to their entities."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from aioafero import EventType
+from aioafero.v1 import AferoController
+from homeassistant.core import CALLBACK_TYPE, callback
+
+EventHandler = Callable[[EventType, Any], None]
+
+
+class EventRouter:
+    """Dispatch resource updates with a single subscription per controller.
+
+    Each controller only notifies the router, which looks up the entities
+    of the updated resource instead of every entity filtering the updates
+    through its own subscription.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the router."""
+        # Controller -> resource id -> handlers
+        self._routes: dict[int, dict[str, list[EventHandler]]] = {}
+        self._unsubscribes: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_register(
+        self, controller: AferoController, resource_id: str, handler: EventHandler
+    ) -> CALLBACK_TYPE:
+        """Send the updates of the resource to the handler.
+
+        :param controller: Controller that manages the resource
+        :param resource_id: ID of the resource
+        :param handler: Called with the event type and the resource
+        :return: Callback that stops sending the updates
+        """
+        if (routes := self._routes.get(id(controller))) is None:
+            routes = self._routes[id(controller)] = {}
+            self._unsubscribes.append(
+                controller.subscribe(
+                    _create_dispatcher(routes),
+                    event_filter=EventType.RESOURCE_UPDATED,
+                )
+            )
+        handlers = routes.setdefault(resource_id, [])
+        handlers.append(handler)
+
+        @callback
+        def unregister() -> None:
+            handlers.remove(handler)
+            if not handlers and routes.get(resource_id) is handlers:
+                del routes[resource_id]
+
+        return unregister
+
+    @callback
+    def async_clear(self) -> None:
+        """Stop following the controllers."""
+        while self._unsubscribes:
+            self._unsubscribes.pop()()
+        self._routes.clear()
+
+
+def _create_dispatcher(routes: dict[str, list[EventHandler]]) -> EventHandler:
+    """Create the subscriber of a controller that dispatches to the handlers."""
+
+    @callback
+    def async_dispatch(event_type: EventType, resource: Any) -> None:
+        if handlers := routes.get(resource.id):
+            # Handlers may unregister while the update is dispatched
+            for handler in tuple(handlers):
+                handler(event_type, resource)
+
+    return async_dispatch
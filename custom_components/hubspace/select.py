@@ -1,16 +1,15 @@
 """Home Assistant entity for interacting with Afero Select."""
 
-from dataclasses import fields
-
 from aioafero.v1 import AferoController, AferoModelResource
-from aioafero.v1.controllers.event import EventType
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .bridge import HubspaceBridge
 from .const import DOMAIN
+from .discovery import DiscoveredEntity
 from .entity import HubspaceBaseEntity, update_decorator
 
 
@@ -33,7 +32,9 @@ class AferoSelectEntitiy(HubspaceBaseEntity, SelectEntity):
     @property
     def current_option(self) -> str:
         """The current select option."""
-        return self.resource.selects[self._identifier].selected
+        return self.optimistic(
+            "current_option", self.resource.selects[self._identifier].selected
+        )
 
     @property
     def options(self) -> list:
@@ -43,6 +44,7 @@ class AferoSelectEntitiy(HubspaceBaseEntity, SelectEntity):
     @update_decorator
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
+        self.async_set_optimistic_state(current_option=option)
         await self.bridge.async_request_call(
             self.controller.set_state,
             device_id=self.resource.id,
@@ -60,51 +62,17 @@ async def async_setup_entry(
     """Set up entities."""
     bridge: HubspaceBridge = hass.data[DOMAIN][config_entry.entry_id]
 
-    # add all current items in the controller
-    entities = []
-    for controller in bridge.api.controllers:
-        if "selects" not in [x.name for x in fields(controller.ITEM_CLS)]:
-            continue
-        config_entry.async_on_unload(
-            controller.subscribe(
-                await generate_callback(bridge, controller, async_add_entities),
-                event_filter=EventType.RESOURCE_ADDED,
-            )
-        )
-        # Add any currently tracked entities
-        entities.extend(
-            [
-                AferoSelectEntitiy(bridge, controller, resource, select)
-                for resource in controller
-                for select in resource.selects
-            ]
-        )
-
-    async_add_entities(entities)
-
-
-async def generate_callback(bridge, controller, async_add_entities: callback):
-    """Generate a callback function for handling new select entities.
-
-    Args:
-        bridge: HubspaceBridge instance for managing device communication
-        controller: AferoController instance managing the device
-        async_add_entities: Callback function to register new entities
-
-    Returns:
-        Callback function that adds new select entities when resources are added
-
-    """
-
-    async def add_entity_controller(
-        event_type: EventType, resource: AferoModelResource
-    ) -> None:
+    @callback
+    def async_add_entity(platform: Platform, entities: list[DiscoveredEntity]) -> None:
         """Add one or more Selects."""
         async_add_entities(
-            [
-                AferoSelectEntitiy(bridge, controller, resource, select)
-                for select in resource.selects
-            ]
+            AferoSelectEntitiy(bridge, controller, resource, select)
+            for controller, resource, select in entities
         )
 
-    return add_entity_controller
+    # Add any currently tracked entities
+    async_add_entity(Platform.SELECT, bridge.discovery.entities(Platform.SELECT))
+    # Listen for new devices
+    config_entry.async_on_unload(
+        bridge.discovery.async_add_listener(async_add_entity, Platform.SELECT)
+    )
@@ -1,18 +1,35 @@
 """Home Assistant entity for getting state from Afero sensors."""
 
+from collections.abc import Callable
+from dataclasses import dataclass
 import logging
 from typing import Any
 
 from aioafero.v1 import AferoController, AferoModelResource
-from aioafero.v1.controllers.event import EventType
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    CONF_USERNAME,
+    EntityCategory,
+    Platform,
+    UnitOfInformation,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
 
 from .bridge import HubspaceBridge
 from .const import DOMAIN, SENSORS_GENERAL
+from .discovery import DiscoveredEntity
 from .entity import HubspaceBaseEntity
+from .metrics import BridgeMetrics
 
 LOGGER = logging.getLogger(__name__)
 
@@ -38,12 +55,157 @@ class AferoSensorEntity(HubspaceBaseEntity, SensorEntity):
         return self.resource.sensors[self._attr_name].value
 
 
+@dataclass(frozen=True, kw_only=True)
+class HubspaceMetricSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor reporting a metric of the bridge."""
+
+    value_fn: Callable[[BridgeMetrics], StateType]
+    measures_payload: bool = False
+
+
+METRIC_SENSORS: tuple[HubspaceMetricSensorEntityDescription, ...] = (
+    HubspaceMetricSensorEntityDescription(
+        key="poll_latency",
+        name="Poll latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda metrics: metrics.poll_latency.last,
+    ),
+    HubspaceMetricSensorEntityDescription(
+        key="poll_latency_p95",
+        name="Poll latency p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda metrics: metrics.poll_latency.percentile(95),
+    ),
+    HubspaceMetricSensorEntityDescription(
+        key="payload_size",
+        name="Poll payload size",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.payload_bytes,
+        measures_payload=True,
+    ),
+    HubspaceMetricSensorEntityDescription(
+        key="devices_per_poll",
+        name="Devices per poll",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.devices_per_poll,
+    ),
+    HubspaceMetricSensorEntityDescription(
+        key="events_per_poll",
+        name="Events per poll",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.events_per_poll,
+    ),
+    HubspaceMetricSensorEntityDescription(
+        key="command_latency",
+        name="Command latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda metrics: metrics.command_latency.last,
+    ),
+    HubspaceMetricSensorEntityDescription(
+        key="command_latency_p95",
+        name="Command latency p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda metrics: metrics.command_latency.percentile(95),
+    ),
+    HubspaceMetricSensorEntityDescription(
+        key="queue_wait_p95",
+        name="Request queue wait p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda metrics: metrics.queue_wait.percentile(95),
+    ),
+    HubspaceMetricSensorEntityDescription(
+        key="poll_delay_p95",
+        name="Poll stagger delay p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda metrics: metrics.poll_delay.percentile(95),
+    ),
+    HubspaceMetricSensorEntityDescription(
+        key="retries",
+        name="Retries",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.retries,
+    ),
+    HubspaceMetricSensorEntityDescription(
+        key="reauths",
+        name="Reauthentications",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.reauths,
+    ),
+)
+
+
+class HubspaceMetricSensor(SensorEntity):
+    """Representation of a metric of the bridge."""
+
+    entity_description: HubspaceMetricSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        bridge: HubspaceBridge,
+        description: HubspaceMetricSensorEntityDescription,
+    ) -> None:
+        """Initialize the metric sensor on the hub device."""
+        self.bridge = bridge
+        self.entity_description = description
+        self._attr_unique_id = (
+            f"{bridge.config_entry.data[CONF_USERNAME]}-{description.key}"
+        )
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, bridge.config_entry.data[CONF_USERNAME])},
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Call when an entity is added."""
+        self.async_on_remove(
+            self.bridge.metrics.async_add_listener(self._async_schedule_write)
+        )
+        self.async_on_remove(
+            lambda: self.bridge.write_coalescer.async_discard(self)
+        )
+        if self.entity_description.measures_payload:
+            self.async_on_remove(self.bridge.metrics.async_track_payload())
+
+    @callback
+    def _async_schedule_write(self) -> None:
+        """Write the metric along with the entities updated by the poll."""
+        self.bridge.write_coalescer.async_schedule(self)
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the current value."""
+        return self.entity_description.value_fn(self.bridge.metrics)
+
+
 def get_sensors(
-    bridge: HubspaceBridge, controller: AferoController, resource: AferoModelResource
+    bridge: HubspaceBridge, entities: list[DiscoveredEntity]
 ) -> list[AferoSensorEntity]:
-    """Get all sensors for a given resource."""
+    """Get all known sensors of the discovered entities."""
     sensor_entities: list[AferoSensorEntity] = []
-    for sensor in resource.sensors:
+    for controller, resource, sensor in entities:
         if sensor not in SENSORS_GENERAL:
             LOGGER.warning(
                 "Unknown sensor %s found in %s %s. Please open a bug report",
@@ -63,41 +225,19 @@ async def async_setup_entry(
 ) -> None:
     """Set up entities."""
     bridge: HubspaceBridge = hass.data[DOMAIN][config_entry.entry_id]
-
-    for controller in bridge.api.controllers:
-        # Listen for new devices
-        config_entry.async_on_unload(
-            controller.subscribe(
-                await generate_callback(bridge, controller, async_add_entities),
-                event_filter=EventType.RESOURCE_ADDED,
-            )
-        )
-        # Add any currently tracked entities
-        for resource in controller:
-            if not hasattr(resource, "sensors"):
-                continue
-            if sensors := get_sensors(bridge, controller, resource):
-                async_add_entities(sensors)
-
-
-async def generate_callback(bridge, controller, async_add_entities: callback):
-    """Generate a callback function for handling new sensor entities.
-
-    Args:
-        bridge: HubspaceBridge instance for managing device communication
-        controller: AferoController instance managing the device
-        async_add_entities: Callback function to register new entities
-
-    Returns:
-        Callback function that adds new sensor entities when resources are added
-
-    """
-
-    async def add_entity_controller(
-        event_type: EventType, resource: AferoModelResource
-    ) -> None:
-        """Add an entity."""
-        if sensors := get_sensors(bridge, controller, resource):
+    async_add_entities(
+        HubspaceMetricSensor(bridge, description) for description in METRIC_SENSORS
+    )
+
+    @callback
+    def async_add_entity(platform: Platform, entities: list[DiscoveredEntity]) -> None:
+        """Add the sensors of a new resource."""
+        if sensors := get_sensors(bridge, entities):
             async_add_entities(sensors)
 
-    return add_entity_controller
+    # Add any currently tracked entities
+    async_add_entities(get_sensors(bridge, bridge.discovery.entities(Platform.SENSOR)))
+    # Listen for new devices
+    config_entry.async_on_unload(
+        bridge.discovery.async_add_listener(async_add_entity, Platform.SENSOR)
+    )
@@ -2,70 +2,168 @@
 
 import asyncio
 import logging
-from typing import Final
+from typing import Any, Final
 
 from homeassistant.const import CONF_USERNAME
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 from homeassistant.helpers import entity_registry as er
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.service import verify_domain_control
 import voluptuous as vol
 
 from .bridge import HubspaceBridge
-from .const import DOMAIN
+from .const import DOMAIN, SEND_COMMAND_MAX_CONCURRENCY
+from .entity_index import async_get_entity_index
 
 SERVICE_SEND_COMMAND = "send_command"
+SERVICE_PROFILE = "profile"
 
 SERVICE_SEND_COMMAND_FUNC_CLASS: Final[str] = "function_class"
 SERVICE_SEND_COMMAND_FUNC_INSTANCE: Final[str] = "function_instance"
 SERVICE_SEND_COMMAND_VALUE: Final[str] = "value"
 SERVICE_SEND_COMMAND_ACCOUNT: Final[str] = "account"
+SERVICE_SEND_COMMAND_STATES: Final[str] = "states"
+SERVICE_SEND_COMMAND_CONCURRENCY: Final[str] = "concurrency"
+SERVICE_PROFILE_POLLS: Final[str] = "polls"
 
 LOGGER = logging.getLogger(__name__)
 
+STATE_SCHEMA = vol.Schema(
+    {
+        vol.Required(SERVICE_SEND_COMMAND_FUNC_CLASS): cv.string,
+        vol.Required(SERVICE_SEND_COMMAND_VALUE): vol.Any(dict, cv.string),
+        vol.Optional(SERVICE_SEND_COMMAND_FUNC_INSTANCE): vol.Any(None, cv.string),
+    }
+)
+
 
 def async_register_services(hass: HomeAssistant) -> None:
     """Register services for Hubspace integration.
 
     Registers the send_command service that allows sending commands to Hubspace devices.
-    The service accepts function class, instance, value and optional account parameters.
+    The service accepts function class, instance, value or a list of states, and
+    optional account and concurrency parameters.
+    Registers the profile service that captures a cProfile trace of the next polls.
 
     Args:
         hass: HomeAssistant instance to register services with
 
     """
 
-    async def send_command(call: ServiceCall, skip_reload=True) -> None:
+    async def send_command(
+        call: ServiceCall, skip_reload=True
+    ) -> ServiceResponse | None:
         """Send command to Hubspace device(s).
 
-        Sends a specified command with parameters to one or more Hubspace devices.
-        Commands are sent through the appropriate bridge based on account.
+        Sends one or more states to one or more Hubspace devices. Commands are
+        sent through the bridge that manages each entity. When an account is
+        provided, only entities of that account are targeted. Targets sharing
+        a device receive a single request and the requests are sent with a
+        bounded concurrency.
 
         Args:
             call: Service call containing command parameters
             skip_reload: Whether to skip reloading devices after command (default: True)
 
+        Returns:
+            The result of each target when a response is requested
+
         """
         states: list[dict] = []
-        states.append(
+        if SERVICE_SEND_COMMAND_FUNC_CLASS in call.data:
+            states.append(
+                {
+                    "value": call.data.get(SERVICE_SEND_COMMAND_VALUE),
+                    "functionClass": call.data.get(SERVICE_SEND_COMMAND_FUNC_CLASS),
+                    "functionInstance": call.data.get(
+                        SERVICE_SEND_COMMAND_FUNC_INSTANCE
+                    ),
+                }
+            )
+        states.extend(
             {
-                "value": call.data.get(SERVICE_SEND_COMMAND_VALUE),
-                "functionClass": call.data.get(SERVICE_SEND_COMMAND_FUNC_CLASS),
-                "functionInstance": call.data.get(SERVICE_SEND_COMMAND_FUNC_INSTANCE),
+                "value": state[SERVICE_SEND_COMMAND_VALUE],
+                "functionClass": state[SERVICE_SEND_COMMAND_FUNC_CLASS],
+                "functionInstance": state.get(SERVICE_SEND_COMMAND_FUNC_INSTANCE),
             }
+            for state in call.data.get(SERVICE_SEND_COMMAND_STATES, [])
         )
-        entity_reg = er.async_get(hass)
-        tasks = []
         account = call.data.get("account")
+        if account is not None and not await find_bridge(hass, account):
+            LOGGER.warning("No bridge using account %s", account)
+            return None
+        entity_reg = er.async_get(hass)
+        entity_index = async_get_entity_index(hass)
+        results: dict[str, dict] = {}
+        # Targets grouped by the device that receives the request
+        devices: dict[tuple[HubspaceBridge, str], list[str]] = {}
         for entity_name in call.data.get("entity_id", []):
-            entity = entity_reg.async_get(entity_name)
-            bridge = await find_bridge(hass, account)
-            if bridge:
-                tasks.append(bridge.api.send_service_request(entity.unique_id, states))
-            else:
-                LOGGER.warning("No bridge using account %s", account)
-                return
-        await asyncio.gather(*tasks)
+            entry = entity_reg.async_get(entity_name)
+            indexed = entry and entity_index.get((entry.domain, entry.unique_id))
+            if not indexed:
+                LOGGER.warning("%s is not a loaded Hubspace entity", entity_name)
+                results[entity_name] = command_result("Not a loaded Hubspace entity")
+                continue
+            if (
+                account is not None
+                and indexed.bridge.config_entry.data[CONF_USERNAME] != account
+            ):
+                LOGGER.warning("%s does not use account %s", entity_name, account)
+                results[entity_name] = command_result(f"Does not use {account}")
+                continue
+            devices.setdefault((indexed.bridge, indexed.device_id), []).append(
+                entity_name
+            )
+
+        semaphore = asyncio.Semaphore(call.data[SERVICE_SEND_COMMAND_CONCURRENCY])
+
+        async def send(bridge: HubspaceBridge, device_id: str) -> None:
+            async with semaphore:
+                await bridge.async_request_call(
+                    bridge.api.send_service_request, device_id, states
+                )
+
+        outcomes = await asyncio.gather(
+            *(send(bridge, device_id) for bridge, device_id in devices),
+            return_exceptions=True,
+        )
+        for entity_names, outcome in zip(devices.values(), outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                LOGGER.warning(
+                    "Unable to send the command to %s: %s",
+                    ", ".join(entity_names),
+                    outcome,
+                )
+            for entity_name in entity_names:
+                results[entity_name] = command_result(outcome)
+        if not call.return_response:
+            return None
+        return {"results": results}
+
+    async def profile(call: ServiceCall) -> None:
+        """Profile the next polls of a Hubspace account.
+
+        The stats are written next to the debug dumps once every poll
+        was captured.
+
+        Args:
+            call: Service call containing the number of polls and the account
+
+        """
+        account = call.data.get(SERVICE_SEND_COMMAND_ACCOUNT)
+        bridge = await find_bridge(hass, account)
+        if not bridge:
+            LOGGER.warning("No bridge using account %s", account)
+            return
+        path = bridge.async_start_profile(call.data[SERVICE_PROFILE_POLLS])
+        LOGGER.info(
+            "Profiling the next %s polls to %s", call.data[SERVICE_PROFILE_POLLS], path
+        )
 
     def optional(value):
         """Validate optional string values.
@@ -86,18 +184,63 @@ def async_register_services(hass: HomeAssistant) -> None:
             DOMAIN,
             SERVICE_SEND_COMMAND,
             verify_domain_control(hass, DOMAIN)(send_command),
+            schema=vol.Schema(
+                vol.All(
+                    {
+                        vol.Required("entity_id"): cv.entity_ids,
+                        vol.Inclusive(
+                            SERVICE_SEND_COMMAND_FUNC_CLASS, "state"
+                        ): cv.string,
+                        vol.Inclusive(SERVICE_SEND_COMMAND_VALUE, "state"): cv.string,
+                        vol.Optional(SERVICE_SEND_COMMAND_FUNC_INSTANCE): optional,
+                        vol.Optional(SERVICE_SEND_COMMAND_STATES): vol.All(
+                            cv.ensure_list, [STATE_SCHEMA]
+                        ),
+                        vol.Optional(SERVICE_SEND_COMMAND_ACCOUNT): optional,
+                        vol.Optional(
+                            SERVICE_SEND_COMMAND_CONCURRENCY,
+                            default=SEND_COMMAND_MAX_CONCURRENCY,
+                        ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    },
+                    cv.has_at_least_one_key(
+                        SERVICE_SEND_COMMAND_FUNC_CLASS, SERVICE_SEND_COMMAND_STATES
+                    ),
+                )
+            ),
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_PROFILE):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_PROFILE,
+            verify_domain_control(hass, DOMAIN)(profile),
             schema=vol.Schema(
                 {
-                    vol.Required("entity_id"): cv.entity_ids,
-                    vol.Required(SERVICE_SEND_COMMAND_FUNC_CLASS): cv.string,
-                    vol.Required(SERVICE_SEND_COMMAND_VALUE): cv.string,
-                    vol.Optional(SERVICE_SEND_COMMAND_FUNC_INSTANCE): optional,
+                    vol.Optional(SERVICE_PROFILE_POLLS, default=5): vol.All(
+                        vol.Coerce(int), vol.Range(min=1, max=100)
+                    ),
                     vol.Optional(SERVICE_SEND_COMMAND_ACCOUNT): optional,
                 }
             ),
         )
 
 
+def command_result(outcome: Exception | str | None) -> dict[str, Any]:
+    """Generate the result of a target.
+
+    Args:
+        outcome: Error that occurred, or None if the command was sent
+
+    Returns:
+        Dictionary describing the success or failure of the command
+
+    """
+    if outcome is None:
+        return {"success": True}
+    return {"success": False, "error": str(outcome)}
+
+
 async def find_bridge(hass: HomeAssistant, username: str) -> HubspaceBridge | None:
     """Find the bridge for the given username.
 
@@ -0,0 +1,48 @@
+"""Persist the devices of an account between restarts."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, SNAPSHOT_SAVE_DELAY_SEC, SNAPSHOT_STORAGE_VERSION
+
+
+class DeviceSnapshotStore:
+    """Store the last payload received from the Hubspace API.
+
+    The payload is saved with a delay so frequent polls result in a
+    single write.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store for the config entry."""
+        self._store: Store[list[dict]] = Store(
+            hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot"
+        )
+        self._data: list[dict] | None = None
+
+    async def async_load(self) -> list[dict] | None:
+        """Load the payload of the previous run."""
+        return await self._store.async_load()
+
+    @callback
+    def async_schedule_save(self, data: list[dict]) -> None:
+        """Save the payload after the delay."""
+        self._data = data
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY_SEC)
+
+    @callback
+    def _data_to_save(self) -> list[dict] | None:
+        """Return the payload to save."""
+        return self._data
+
+    async def async_flush(self) -> None:
+        """Save the pending payload immediately."""
+        if self._data is not None:
+            await self._store.async_save(self._data)
+            self._data = None
+
+    async def async_remove(self) -> None:
+        """Remove the stored payload."""
+        await self._store.async_remove()
@@ -35,9 +35,7 @@ class HubspaceSwitch(HubspaceBaseEntity, SwitchEntity):
     def is_on(self) -> bool | None:
         """Determines if the switch is on."""
         feature = self.resource.on.get(self.instance, None)
-        if feature:
-            return feature.on
-        return None
+        return self.optimistic("is_on", feature.on if feature else None)
 
     @update_decorator
     async def async_turn_on(
@@ -46,6 +44,7 @@ class HubspaceSwitch(HubspaceBaseEntity, SwitchEntity):
     ) -> None:
         """Turn on the entity."""
         self.logger.debug("Adjusting entity %s with %s", self.resource.id, kwargs)
+        self.async_set_optimistic_state(is_on=True)
         await self.bridge.async_request_call(
             self.controller.set_state,
             device_id=self.resource.id,
@@ -60,6 +59,7 @@ class HubspaceSwitch(HubspaceBaseEntity, SwitchEntity):
     ) -> None:
         """Turn off the entity."""
         self.logger.debug("Adjusting entity %s with %s", self.resource.id, kwargs)
+        self.async_set_optimistic_state(is_on=False)
         await self.bridge.async_request_call(
             self.controller.set_state,
             device_id=self.resource.id,
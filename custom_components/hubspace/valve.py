@@ -55,14 +55,16 @@ class HubspaceValve(HubspaceBaseEntity, ValveEntity):
         Afero only reports Open / Close so default to 100 or 0
         """
         feature = self.resource.open.get(self.instance)
-        if feature:
-            return 100 if feature.open else 0
-        return None
+        return self.optimistic(
+            "current_valve_position",
+            (100 if feature.open else 0) if feature else None,
+        )
 
     @update_decorator
     async def async_open_valve(self, **kwargs) -> None:
         """Open the valve."""
         self.logger.info("Opening valve on %s", self._attr_name)
+        self.async_set_optimistic_state(current_valve_position=100)
         await self.bridge.async_request_call(
             self.controller.set_state,
             device_id=self.resource.id,
@@ -74,6 +76,7 @@ class HubspaceValve(HubspaceBaseEntity, ValveEntity):
     async def async_close_valve(self, **kwargs) -> None:
         """Close valve."""
         self.logger.info("Closing valve on %s", self._attr_name)
+        self.async_set_optimistic_state(current_valve_position=0)
         await self.bridge.async_request_call(
             self.controller.set_state,
             device_id=self.resource.id,
@@ -0,0 +1,117 @@
+"""Helpers for benchmarking the Hubspace integration.
+
+Benchmarks only run when HUBSPACE_BENCHMARK is set. The results are shown
+in the terminal summary and, when HUBSPACE_BENCHMARK_OUTPUT is set, written
+to that path as JSON so they can be compared between releases.
+"""
+
+import json
+import os
+from pathlib import Path
+import platform
+import time
+
+from homeassistant.const import __version__ as ha_version
+import pytest
+
+from ..utils import clone_devices, create_devices_from_data, hs_raw_from_device
+
+BENCHMARK_DUMPS = [
+    "light-a21.json",
+    "fan-ZandraFan.json",
+    "freezer.json",
+    "door-lock-TBD.json",
+    "portable-ac.json",
+    "switch-HPDA311CWB.json",
+    "thermostat.json",
+    "water-timer.json",
+]
+manifest = json.loads(
+    (
+        Path(__file__).parents[2] / "custom_components" / "hubspace" / "manifest.json"
+    ).read_text()
+)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the benchmarks unless requested."""
+    if os.environ.get("HUBSPACE_BENCHMARK"):
+        return
+    skip = pytest.mark.skip(reason="HUBSPACE_BENCHMARK is not set")
+    benchmark_dir = Path(__file__).parent
+    for item in items:
+        if benchmark_dir in Path(item.fspath).parents:
+            item.add_marker(skip)
+
+
+def generate_account(count: int) -> list[dict]:
+    """Generate the raw payload of an account with the given number of devices.
+
+    :param count: Number of devices within the account
+    """
+    devices = [
+        device
+        for dump in BENCHMARK_DUMPS
+        for device in create_devices_from_data(dump)
+    ]
+    return [hs_raw_from_device(device) for device in clone_devices(devices, count)]
+
+
+class BenchmarkResults:
+    """Collect the results of every benchmark in the session."""
+
+    def __init__(self) -> None:
+        """Initialize the results."""
+        self.results: list[dict] = []
+
+    def record(self, name: str, devices: int, value: float, unit: str) -> None:
+        """Record the result of a benchmark.
+
+        :param name: Name of the measurement
+        :param devices: Number of devices within the account
+        :param value: Measured value
+        :param unit: Unit of the value
+        """
+        self.results.append(
+            {"name": name, "devices": devices, "value": round(value, 4), "unit": unit}
+        )
+
+    def dump(self, path: Path) -> None:
+        """Write the results as JSON."""
+        path.write_text(
+            json.dumps(
+                {
+                    "integration_version": manifest["version"],
+                    "aioafero": manifest["requirements"][0],
+                    "homeassistant": ha_version,
+                    "python": platform.python_version(),
+                    "timestamp": int(time.time()),
+                    "results": self.results,
+                },
+                indent=4,
+            )
+        )
+
+
+results_key = pytest.StashKey[BenchmarkResults]()
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(pytestconfig):
+    """Collect the benchmark results and write them at the end of the session."""
+    results = pytestconfig.stash.setdefault(results_key, BenchmarkResults())
+    yield results
+    if results.results and (output := os.environ.get("HUBSPACE_BENCHMARK_OUTPUT")):
+        results.dump(Path(output))
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Show the benchmark results after the tests."""
+    if not (results := config.stash.get(results_key, None)) or not results.results:
+        return
+    terminalreporter.write_sep("-", "hubspace benchmarks")
+    for result in results.results:
+        terminalreporter.write_line(
+            f"{result['name']} [{result['devices']} devices]: "
+            f"{result['value']:.4f} {result['unit']}"
+        )
@@ -0,0 +1,39 @@
+"""Benchmark the CPU time of a poll with and without the delta filter."""
+
+import time
+
+import pytest
+
+from custom_components.hubspace.delta import DeviceDeltaFilter
+
+from .conftest import generate_account
+
+POLLS = 5
+
+
+async def measure_poll(bridge, raw: list[dict]) -> float:
+    """Measure the average CPU time of a poll in milliseconds."""
+    start = time.process_time()
+    for _ in range(POLLS):
+        await bridge.events.generate_events_from_data(raw)
+        await bridge.async_block_until_done()
+    return (time.process_time() - start) / POLLS * 1000
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", [10, 100, 1000])
+async def test_poll_cpu(mocked_bridge, benchmark_results, count):
+    """Compare the CPU time of an unchanged poll with and without the filter."""
+    raw = generate_account(count)
+    await mocked_bridge.events.generate_events_from_data(raw)
+    await mocked_bridge.async_block_until_done()
+    unfiltered = await measure_poll(mocked_bridge, raw)
+    delta = DeviceDeltaFilter()
+    detach = delta.async_attach(mocked_bridge.events)
+    # Record the fingerprints
+    await measure_poll(mocked_bridge, raw)
+    filtered = await measure_poll(mocked_bridge, raw)
+    detach()
+    benchmark_results.record("poll_cpu_unfiltered", count, unfiltered, "ms")
+    benchmark_results.record("poll_cpu_filtered", count, filtered, "ms")
+    assert delta.suppressed == delta.forwarded * (POLLS * 2 - 1)
@@ -0,0 +1,46 @@
+"""Benchmark the attributes read from a light on every state write."""
+
+import time
+
+import pytest
+
+from custom_components.hubspace.const import DOMAIN
+from custom_components.hubspace.light import HubspaceLight
+
+from ..utils import create_devices_from_data
+
+WRITES = 10000
+
+
+def compute_state(light: HubspaceLight) -> tuple:
+    """Read the state and attributes Home Assistant reads on a state write."""
+    return (
+        light.available,
+        light.state,
+        light.capability_attributes,
+        light.state_attributes,
+        light.extra_state_attributes,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("dump", ["light-rgb_temp.json", "rgbw-led-strip.json"])
+async def test_state_write_cpu(mocked_entry, benchmark_results, dump):
+    """Measure the CPU time to compute the state and attributes of a light."""
+    hass, entry, bridge = mocked_entry
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    devices = create_devices_from_data(dump)
+    await bridge.generate_devices_from_data(devices)
+    hs_bridge = hass.data[DOMAIN][entry.entry_id]
+    lights = [
+        HubspaceLight(hs_bridge, bridge.lights, resource) for resource in bridge.lights
+    ]
+    start = time.process_time()
+    for _ in range(WRITES):
+        for light in lights:
+            compute_state(light)
+    elapsed = (time.process_time() - start) / WRITES * 1e6
+    benchmark_results.record(f"light_state_write_{dump}", len(lights), elapsed, "us")
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,72 @@
+"""Benchmark the memory used by the entities of a large account."""
+
+import tracemalloc
+
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+import pytest
+
+from custom_components.hubspace.const import DOMAIN
+from custom_components.hubspace.device import DeviceContext
+
+from .conftest import generate_account
+
+DEVICES = 2000
+
+
+def unshared_device_context(bridge, resource) -> DeviceContext:
+    """Create a context for every entity, as before contexts were shared."""
+    parent_id = resource.device_information.parent_id
+    return DeviceContext(
+        parent_id=parent_id,
+        device_info=dr.DeviceInfo(identifiers={(DOMAIN, parent_id)}),
+        name=resource.device_information.name or None,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("shared", [False, True], ids=["unshared", "shared"])
+async def test_entity_memory(mocked_entry, mocker, benchmark_results, shared):
+    """Measure the memory allocated to set up every entity of the account.
+
+    The setup is measured with and without the device contexts shared
+    between the entities of a device, and the saving is recorded once both
+    have run.
+    """
+    hass, entry, bridge = mocked_entry
+    raw = generate_account(DEVICES)
+    mocker.patch(
+        "aioafero.v1.controllers.event.EventStream.gather_data",
+        return_value=raw,
+    )
+    if not shared:
+        mocker.patch(
+            "custom_components.hubspace.entity.async_get_device_context",
+            new=unshared_device_context,
+        )
+    await bridge.events.generate_events_from_data(raw)
+    await bridge.async_block_until_done()
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    entities = er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+    name = "entity_memory_shared" if shared else "entity_memory_unshared"
+    benchmark_results.record(name, DEVICES, after - before, "bytes")
+    benchmark_results.record(
+        f"{name}_per_entity", DEVICES, (after - before) / len(entities), "bytes/entity"
+    )
+    recorded = {result["name"]: result["value"] for result in benchmark_results.results}
+    if {"entity_memory_shared", "entity_memory_unshared"} <= recorded.keys():
+        benchmark_results.record(
+            "entity_memory_saving",
+            DEVICES,
+            recorded["entity_memory_unshared"] - recorded["entity_memory_shared"],
+            "bytes",
+        )
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
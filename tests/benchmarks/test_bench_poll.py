@@ -0,0 +1,125 @@
+"""Benchmark discovery, polling, entity creation and state writes."""
+
+import copy
+import importlib
+import time
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import callback
+import pytest
+
+from custom_components.hubspace.const import DOMAIN, PLATFORMS
+
+from .conftest import generate_account
+
+ACCOUNT_SIZES = [10, 100, 1000, 5000]
+
+
+def toggle_power(raw: list[dict]) -> list[dict]:
+    """Generate a poll where every device with a power state changed."""
+    updated = copy.deepcopy(raw)
+    for device in updated:
+        for state in device["state"]["values"]:
+            if state["functionClass"] == "power":
+                state["value"] = "off" if state["value"] == "on" else "on"
+    return updated
+
+
+def timed_setup_entry(
+    platform: str, setup_entry, platform_setups: dict[str, tuple[float, list]]
+):
+    """Wrap the setup of a platform to record its duration and its entities."""
+
+    async def async_setup_entry(hass, entry, async_add_entities):
+        created = []
+
+        def add_entities(new_entities, *args, **kwargs):
+            new_entities = list(new_entities)
+            created.extend(new_entities)
+            async_add_entities(new_entities, *args, **kwargs)
+
+        start = time.process_time()
+        await setup_entry(hass, entry, add_entities)
+        platform_setups[platform] = ((time.process_time() - start) * 1000, created)
+
+    return async_setup_entry
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", ACCOUNT_SIZES)
+async def test_discovery(mocked_bridge, benchmark_results, count):
+    """Measure the time to discover every device of the account."""
+    raw = generate_account(count)
+    start = time.perf_counter()
+    await mocked_bridge.events.generate_events_from_data(raw)
+    await mocked_bridge.async_block_until_done()
+    benchmark_results.record(
+        "discovery", count, (time.perf_counter() - start) * 1000, "ms"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", ACCOUNT_SIZES)
+async def test_setup_and_poll(mocked_entry, mocker, benchmark_results, count):
+    """Measure the setup of every platform and the polls that follow."""
+    hass, entry, bridge = mocked_entry
+    raw = generate_account(count)
+    mocker.patch(
+        "aioafero.v1.controllers.event.EventStream.gather_data",
+        return_value=raw,
+    )
+    await bridge.events.generate_events_from_data(raw)
+    await bridge.async_block_until_done()
+
+    # Entity creation within each platform, timed during the setup
+    platform_setups: dict[str, tuple[float, list]] = {}
+    for platform in PLATFORMS:
+        module = importlib.import_module(f"custom_components.hubspace.{platform}")
+        mocker.patch.object(
+            module,
+            "async_setup_entry",
+            timed_setup_entry(platform, module.async_setup_entry, platform_setups),
+        )
+
+    start = time.perf_counter()
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    benchmark_results.record("setup", count, (time.perf_counter() - start) * 1000, "ms")
+    for platform, (elapsed, created) in platform_setups.items():
+        benchmark_results.record(f"setup_entry_{platform}", count, elapsed, "ms")
+        benchmark_results.record(
+            f"setup_entry_{platform}_entities", count, len(created), "entities"
+        )
+
+    # Poll where nothing changed
+    start = time.process_time()
+    await bridge.events.generate_events_from_data(raw)
+    await bridge.async_block_until_done()
+    await hass.async_block_till_done()
+    benchmark_results.record(
+        "poll_unchanged", count, (time.process_time() - start) * 1000, "ms"
+    )
+
+    # Poll where every device with a power state changed
+    writes = []
+
+    @callback
+    def state_changed(event):
+        writes.append(event)
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, state_changed)
+    start = time.perf_counter()
+    await bridge.events.generate_events_from_data(toggle_power(raw))
+    await bridge.async_block_until_done()
+    await hass.async_block_till_done()
+    elapsed = time.perf_counter() - start
+    unsub()
+    benchmark_results.record("poll_changed", count, elapsed * 1000, "ms")
+    benchmark_results.record("state_writes", count, len(writes), "writes")
+    benchmark_results.record(
+        "state_write_throughput", count, len(writes) / elapsed, "writes/s"
+    )
+
+    assert entry.entry_id in hass.data[DOMAIN]
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,41 @@
+"""Benchmark polls of the real client against the simulated Afero API."""
+
+import asyncio
+import time
+
+from aioafero.v1 import AferoBridgeV1
+import pytest
+
+from ..simulator import (
+    REFRESH_TOKEN,
+    AferoSimulator,
+    SimulatorConfig,
+    create_simulator_session,
+    start_simulator_server,
+)
+from .conftest import generate_account
+
+ACCOUNT_SIZES = [100, 1000, 5000]
+POLLS = 20
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", ACCOUNT_SIZES)
+async def test_poll_throughput(benchmark_results, count):
+    """Measure the polls per second of an account over a jittery link."""
+    simulator = AferoSimulator(SimulatorConfig(latency=0.05, jitter=0.05, seed=1))
+    simulator.add_devices(generate_account(count))
+    server = await start_simulator_server(simulator)
+    session = create_simulator_session(server)
+    api = AferoBridgeV1(
+        "username", "password", refresh_token=REFRESH_TOKEN, session=session
+    )
+    try:
+        await api.get_account_id()
+        start = time.perf_counter()
+        await asyncio.gather(*(api.fetch_data() for _ in range(POLLS)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await session.close()
+        await server.close()
+    benchmark_results.record("simulated_polls_per_sec", count, POLLS / elapsed, "1/s")
@@ -0,0 +1,296 @@
+"""Local stand-in for the Afero API used to exercise the bridge without a network.
+
+The simulator serves the token, account and metadevice endpoints used by
+aioafero from an in-memory account. Devices are loaded from the
+``device_dumps`` and ``sample_data`` payloads, and state writes are applied
+to the account so the following polls return them. Latency, jitter, errors,
+rate limiting and token expiry are configurable to reproduce a degraded
+cloud. The account is served over HTTPS on a local port, and the sessions
+resolve every Afero host to it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+import functools
+import itertools
+import json
+from pathlib import Path
+import random
+import socket
+import ssl
+import tempfile
+import time
+from typing import Any
+
+from aiohttp import ClientSession, TCPConnector, web
+from aiohttp.abc import AbstractResolver, ResolveResult
+from aiohttp.test_utils import TestServer
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from .utils import hs_raw_from_dump
+
+SAMPLE_DATA_DIR: Path = Path(__file__).parents[1] / "sample_data"
+ACCOUNT_ID = "simulated-account"
+REFRESH_TOKEN = "simulated-refresh-token"
+TOKEN_PATH = "/auth/realms/thd/protocol/openid-connect/token"
+
+
+@dataclass
+class SimulatorConfig:
+    """Behavior of the simulated cloud."""
+
+    # Seconds added to every response
+    latency: float = 0
+    # Random seconds added on top of the latency
+    jitter: float = 0
+    # Share of the API requests answered with a server error
+    error_rate: float = 0
+    # Share of the API requests answered with 429 Too Many Requests
+    rate_limit_rate: float = 0
+    # Seconds sent in Retry-After along with a 429
+    retry_after: int = 1
+    # Seconds an access token is valid for
+    token_lifetime: int = 120
+    # Seed of the random failures so a run can be repeated
+    seed: int | None = None
+
+
+@dataclass
+class SimulatorStats:
+    """Requests received by the simulator."""
+
+    requests: Counter[str] = field(default_factory=Counter)
+    errors: int = 0
+    rate_limited: int = 0
+    unauthorized: int = 0
+    token_refreshes: int = 0
+
+
+class AferoSimulator:
+    """In-memory Afero account served over HTTP."""
+
+    def __init__(self, config: SimulatorConfig | None = None) -> None:
+        """Initialize an empty account."""
+        self.config = config or SimulatorConfig()
+        self.stats = SimulatorStats()
+        self.devices: dict[str, dict] = {}
+        self._random = random.Random(self.config.seed)
+        self._counter = itertools.count()
+        # Access token -> expiration
+        self._access_tokens: dict[str, float] = {}
+        self._refresh_tokens: set[str] = {REFRESH_TOKEN}
+
+    def add_devices(self, devices: list[dict]) -> None:
+        """Add raw metadevices to the account."""
+        for device in devices:
+            self.devices[device["id"]] = json.loads(json.dumps(device))
+
+    def load_dump(self, file_name: str) -> None:
+        """Add the devices of a file from ``tests/device_dumps``."""
+        self.add_devices(hs_raw_from_dump(file_name))
+
+    def load_sample(self, file_name: str) -> None:
+        """Add the devices of a file from ``sample_data``."""
+        with (SAMPLE_DATA_DIR / file_name).open() as fh:
+            self.add_devices(json.load(fh))
+
+    def get_state(
+        self, device_id: str, function_class: str, instance: str | None = None
+    ) -> Any:
+        """Get the value of a state of a device."""
+        for state in self.devices[device_id].get("state", {}).get("values", []):
+            if (
+                state["functionClass"] == function_class
+                and state.get("functionInstance") == instance
+            ):
+                return state["value"]
+        raise KeyError(function_class)
+
+    def expire_tokens(self) -> None:
+        """Expire every access token so the client must refresh."""
+        for token in self._access_tokens:
+            self._access_tokens[token] = 0
+
+    def revoke_refresh_tokens(self) -> None:
+        """Reject the refresh tokens so the client must log in again."""
+        self._refresh_tokens.clear()
+
+    def create_app(self) -> web.Application:
+        """Create the application that serves the account."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_post(TOKEN_PATH, self._handle_token)
+        app.router.add_get("/v1/users/me", self._handle_user)
+        app.router.add_get(
+            "/v1/accounts/{account_id}/metadevices", self._handle_metadevices
+        )
+        app.router.add_put(
+            "/v1/accounts/{account_id}/metadevices/{device_id}/state",
+            self._handle_set_state,
+        )
+        return app
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Apply the latency, the failures and the authentication."""
+        route = request.match_info.route.resource
+        self.stats.requests[route.canonical if route else request.path] += 1
+        delay = self.config.latency + self._random.uniform(0, self.config.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if request.path == TOKEN_PATH:
+            return await handler(request)
+        if self._random.random() < self.config.rate_limit_rate:
+            self.stats.rate_limited += 1
+            return web.Response(
+                status=429, headers={"Retry-After": str(self.config.retry_after)}
+            )
+        if self._random.random() < self.config.error_rate:
+            self.stats.errors += 1
+            return web.Response(status=503, text="Simulated failure")
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        if self._access_tokens.get(token, 0) < time.monotonic():
+            self.stats.unauthorized += 1
+            return web.Response(status=401)
+        return await handler(request)
+
+    async def _handle_token(self, request: web.Request) -> web.Response:
+        """Issue new tokens for a valid refresh token or authorization code."""
+        data = await request.post()
+        grant_type = data.get("grant_type")
+        if grant_type == "refresh_token" and (
+            data.get("refresh_token") not in self._refresh_tokens
+        ):
+            return web.json_response({"error": "invalid_grant"}, status=400)
+        if grant_type not in ("refresh_token", "authorization_code"):
+            return web.json_response({"error": "unsupported_grant_type"}, status=400)
+        self.stats.token_refreshes += 1
+        count = next(self._counter)
+        access_token = f"simulated-access-token-{count}"
+        refresh_token = f"simulated-refresh-token-{count}"
+        self._access_tokens[access_token] = (
+            time.monotonic() + self.config.token_lifetime
+        )
+        self._refresh_tokens.add(refresh_token)
+        return web.json_response(
+            {
+                "access_token": access_token,
+                "id_token": access_token,
+                "refresh_token": refresh_token,
+                "expires_in": self.config.token_lifetime,
+                "token_type": "Bearer",
+            }
+        )
+
+    async def _handle_user(self, request: web.Request) -> web.Response:
+        """Describe the account of the user."""
+        return web.json_response(
+            {"accountAccess": [{"account": {"accountId": ACCOUNT_ID}}]}
+        )
+
+    async def _handle_metadevices(self, request: web.Request) -> web.Response:
+        """List the devices of the account."""
+        if request.match_info["account_id"] != ACCOUNT_ID:
+            return web.Response(status=404)
+        return web.json_response(list(self.devices.values()))
+
+    async def _handle_set_state(self, request: web.Request) -> web.Response:
+        """Apply the states sent to a device."""
+        device = self.devices.get(request.match_info["device_id"])
+        if request.match_info["account_id"] != ACCOUNT_ID or device is None:
+            return web.Response(status=404)
+        payload = await request.json()
+        current = device.setdefault("state", {}).setdefault("values", [])
+        now = int(time.time() * 1000)
+        for update in payload.get("values", []):
+            key = (update["functionClass"], update.get("functionInstance"))
+            for state in current:
+                if (state["functionClass"], state.get("functionInstance")) == key:
+                    state["value"] = update["value"]
+                    state["lastUpdateTime"] = now
+                    break
+            else:
+                current.append({**update, "lastUpdateTime": now})
+        return web.json_response({"metadeviceId": device["id"], "values": current})
+
+
+@functools.cache
+def create_server_ssl_context() -> ssl.SSLContext:
+    """Create the TLS context of the server from a self-signed certificate."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "afero-simulator")])
+    now = datetime.now(UTC)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(days=1))
+        .not_valid_after(now + timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    with tempfile.TemporaryDirectory() as directory:
+        cert_path = Path(directory) / "cert.pem"
+        key_path = Path(directory) / "key.pem"
+        cert_path.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+        key_path.write_bytes(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+        context.load_cert_chain(cert_path, key_path)
+    return context
+
+
+async def start_simulator_server(simulator: AferoSimulator) -> TestServer:
+    """Serve the account over HTTPS on a local port."""
+    server = TestServer(simulator.create_app())
+    await server.start_server(ssl=create_server_ssl_context())
+    return server
+
+
+class SimulatorResolver(AbstractResolver):
+    """Resolve every host to the simulator."""
+
+    def __init__(self, port: int) -> None:
+        """Initialize the resolver with the port of the server."""
+        self._port = port
+
+    async def resolve(
+        self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET
+    ) -> list[ResolveResult]:
+        """Get the address of the server for any host."""
+        return [
+            ResolveResult(
+                hostname=host,
+                host="127.0.0.1",
+                port=self._port,
+                family=socket.AF_INET,
+                proto=0,
+                flags=socket.AI_NUMERICHOST,
+            )
+        ]
+
+    async def close(self) -> None:
+        """Close the resolver."""
+
+
+def create_simulator_session(server: TestServer) -> ClientSession:
+    """Create a session that sends every request to the simulator.
+
+    aioafero builds absolute URLs to the Afero hosts, so every host resolves
+    to the server. The certificate of the server is self-signed and is not
+    verified.
+    """
+    connector = TCPConnector(resolver=SimulatorResolver(server.port), ssl=False)
+    return ClientSession(connector=connector)
@@ -1,10 +1,38 @@
 """Test the bridge between Home Assistant and Afero."""
 
+from aioafero import EventType
 from aiohttp import ClientError
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_TOKEN,
+    EVENT_HOMEASSISTANT_CLOSE,
+    Platform,
+)
 from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
+from homeassistant.helpers import device_registry as dr
 import pytest
 
-from custom_components.hubspace.bridge import HubspaceBridge, InvalidAuth
+from custom_components.hubspace.bridge import (
+    HubspaceBridge,
+    InvalidAuth,
+    split_identifier,
+)
+from custom_components.hubspace.const import (
+    DEDICATED_SESSION_STR,
+    DOMAIN,
+    MAX_IN_FLIGHT_STR,
+    POLLING_MODE_ADAPTIVE,
+    POLLING_MODE_STR,
+    POLLING_TIME_STR,
+)
+
+from .utils import create_devices_from_data, hs_raw_from_device
+
+light_a21 = create_devices_from_data("light-a21.json")[0]
+light_a21_id = "light.friendly_device_53_light"
+fan_zandra = create_devices_from_data("fan-ZandraFan.json")
+fan_zandra_id = "fan.friendly_device_2_fan"
 
 
 @pytest.mark.asyncio
@@ -67,3 +95,312 @@ async def test_request_call(result, side_effect, msg, caplog, mocker, mocked_ent
             await bridge.async_request_call(task)
     else:
         await bridge.async_request_call(task)
+
+
+@pytest.mark.asyncio
+async def test_initialize_bridge_from_snapshot(mocked_entry, mocker, hass_storage):
+    """Ensure a slow cloud does not block the setup when a snapshot exists."""
+    hass, entry, mocked_bridge = mocked_entry
+    key = f"{DOMAIN}.{entry.entry_id}.snapshot"
+    hass_storage[key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": key,
+        "data": [hs_raw_from_device(light_a21)],
+    }
+    mocker.patch.object(
+        mocked_bridge,
+        "initialize",
+        side_effect=mocker.AsyncMock(side_effect=TimeoutError),
+    )
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.LOADED
+    hs_bridge = hass.data[DOMAIN][entry.entry_id]
+    assert hs_bridge.awaiting_cloud is True
+    assert hass.states.get(light_a21_id).state == "unavailable"
+    # The first poll from the cloud confirms the device
+    await mocked_bridge.generate_devices_from_data([light_a21])
+    await hass.async_block_till_done()
+    assert hs_bridge.awaiting_cloud is False
+    assert hass.states.get(light_a21_id).state != "unavailable"
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass_storage[key]["data"] == [hs_raw_from_device(light_a21)]
+
+
+@pytest.mark.asyncio
+async def test_dedicated_session(mocked_entry, mocker):
+    """Ensure the dedicated session is sized to the limiter and closed."""
+    hass, entry, mocked_bridge = mocked_entry
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, DEDICATED_SESSION_STR: True}
+    )
+    afero_bridge = mocker.patch(
+        "custom_components.hubspace.bridge.AferoBridgeV1", return_value=mocked_bridge
+    )
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    hs_bridge = hass.data[DOMAIN][entry.entry_id]
+    session = hs_bridge.session
+    assert afero_bridge.call_args.kwargs["session"] is session
+    assert session.connector.limit == hs_bridge.limiter.max_in_flight
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert session.closed
+    assert hs_bridge.session is None
+
+
+@pytest.mark.asyncio
+async def test_dedicated_session_closed_on_shutdown(mocked_entry):
+    """Ensure the dedicated session is closed when Home Assistant shuts down."""
+    hass, entry, _ = mocked_entry
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, DEDICATED_SESSION_STR: True}
+    )
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    hs_bridge = hass.data[DOMAIN][entry.entry_id]
+    session = hs_bridge.session
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+    assert session.closed
+    assert hs_bridge.session is None
+
+
+@pytest.mark.asyncio
+async def test_platforms_loaded_on_demand(mocked_entry):
+    """Ensure only platforms with resources are set up."""
+    hass, entry, mocked_bridge = mocked_entry
+    await mocked_bridge.generate_devices_from_data([light_a21])
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    hs_bridge = hass.data[DOMAIN][entry.entry_id]
+    assert {Platform.BUTTON, Platform.LIGHT, Platform.SENSOR} <= (
+        hs_bridge.platforms.loaded
+    )
+    assert Platform.FAN not in hs_bridge.platforms.loaded
+    assert hass.states.get(light_a21_id) is not None
+    # A new type of device sets up its platform
+    await mocked_bridge.generate_devices_from_data([light_a21, *fan_zandra])
+    await hass.async_block_till_done()
+    assert Platform.FAN in hs_bridge.platforms.loaded
+    assert hass.states.get(fan_zandra_id) is not None
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert not hs_bridge.platforms.loaded
+
+
+@pytest.mark.asyncio
+async def test_device_registry_reconcile(mocked_entry, mocker):
+    """Ensure only new or changed devices are written to the registry."""
+    hass, entry, mocked_bridge = mocked_entry
+    dev_reg = dr.async_get(hass)
+    stale = dev_reg.async_get_or_create(
+        config_entry_id=entry.entry_id, identifiers={(DOMAIN, "stale")}
+    )
+    await mocked_bridge.generate_devices_from_data([light_a21])
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert dev_reg.async_get(stale.id) is None
+    parent_id = light_a21.device_information.parent_id
+    assert dev_reg.async_get_device(identifiers={(DOMAIN, parent_id)}) is not None
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    # Unchanged devices are not written again
+    get_or_create = mocker.spy(dev_reg, "async_get_or_create")
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    get_or_create.assert_not_called()
+    assert dev_reg.async_get_device(identifiers={(DOMAIN, parent_id)}) is not None
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.asyncio
+async def test_auth_refreshed_in_background(mocked_entry, mocker):
+    """Ensure a failed authentication keeps the entities while refreshing."""
+    hass, entry, mocked_bridge = mocked_entry
+    # The bridge wraps fetch_data once it is set up
+    fetch_data = mocked_bridge.fetch_data
+    mocker.patch("custom_components.hubspace.bridge.AUTH_REFRESH_RETRY_MIN_SEC", 0)
+    await mocked_bridge.generate_devices_from_data([light_a21])
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    start_reauth = mocker.patch.object(entry, "async_start_reauth")
+    reload = mocker.patch.object(hass.config_entries, "async_reload")
+    mocker.patch.object(
+        type(mocked_bridge),
+        "refresh_token",
+        new_callable=mocker.PropertyMock,
+        return_value="rotated-token",
+    )
+    fetch_data.side_effect = [InvalidAuth, []]
+    mocked_bridge.events.emit(EventType.INVALID_AUTH)
+    mocked_bridge.events.emit(EventType.INVALID_AUTH)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    start_reauth.assert_not_called()
+    reload.assert_not_called()
+    assert entry.data[CONF_TOKEN] == "rotated-token"
+    assert hass.states.get(light_a21_id) is not None
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.asyncio
+async def test_auth_refresh_escalates(mocked_entry, mocker):
+    """Ensure the user is asked to log in after repeated failures."""
+    hass, entry, mocked_bridge = mocked_entry
+    # The bridge wraps fetch_data once it is set up
+    fetch_data = mocked_bridge.fetch_data
+    mocker.patch("custom_components.hubspace.bridge.AUTH_REFRESH_RETRY_MIN_SEC", 0)
+    mocker.patch("custom_components.hubspace.bridge.AUTH_REFRESH_ATTEMPTS", 2)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    start_reauth = mocker.patch.object(entry, "async_start_reauth")
+    fetch_data.side_effect = InvalidAuth
+    mocked_bridge.events.emit(EventType.INVALID_AUTH)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    start_reauth.assert_called_once_with(hass)
+    assert hass.data[DOMAIN][entry.entry_id].metrics.reauths == 1
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.asyncio
+async def test_auth_refresh_unknown_error(mocked_entry, mocker, caplog):
+    """Ensure an unexpected error is logged and the refresh is retried."""
+    hass, entry, mocked_bridge = mocked_entry
+    # The bridge wraps fetch_data once it is set up
+    fetch_data = mocked_bridge.fetch_data
+    mocker.patch("custom_components.hubspace.bridge.AUTH_REFRESH_RETRY_MIN_SEC", 0)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    hs_bridge = hass.data[DOMAIN][entry.entry_id]
+    start_reauth = mocker.patch.object(entry, "async_start_reauth")
+    fetch_data.reset_mock()
+    fetch_data.side_effect = [ValueError("kaboom"), []]
+    mocked_bridge.events.emit(EventType.INVALID_AUTH)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert "Unknown error refreshing the token" in caplog.text
+    assert fetch_data.call_count == 2
+    start_reauth.assert_not_called()
+    assert hs_bridge._auth_refresh_task is None
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.asyncio
+async def test_only_polling_loop_staggered(mocked_entry, mocker):
+    """Ensure only the polls of the polling loop are staggered."""
+    hass, entry, mocked_bridge = mocked_entry
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    hs_bridge = hass.data[DOMAIN][entry.entry_id]
+    poll = mocker.spy(hs_bridge.poll_coordinator, "async_poll")
+    await hs_bridge.async_fetch_data()
+    assert poll.call_args.args[1] is False
+    # aioafero calls fetch_data from its polling loop
+    await mocked_bridge.fetch_data()
+    assert poll.call_args.args[1] is True
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.asyncio
+async def test_split_identifier(mocked_bridge):
+    """Ensure the split identifier is only read from controller resources."""
+    await mocked_bridge.generate_devices_from_data(fan_zandra)
+    fan_id = fan_zandra[0].id
+    controllers = mocked_bridge.controllers
+    set_state = mocked_bridge.fans.set_state
+    assert split_identifier(set_state, fan_id, controllers) is None
+    assert split_identifier(set_state, "missing", controllers) is None
+    assert split_identifier(mocked_bridge.request, fan_id, controllers) is None
+
+
+@pytest.mark.asyncio
+async def test_options_applied_live(mocked_entry, mocker):
+    """Ensure updated options are applied without reloading the entry."""
+    hass, entry, mocked_bridge = mocked_entry
+    await mocked_bridge.generate_devices_from_data([light_a21])
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    hs_bridge = hass.data[DOMAIN][entry.entry_id]
+    reload = mocker.spy(hass.config_entries, "async_reload")
+    set_interval = mocker.spy(mocked_bridge, "set_polling_interval")
+    hass.config_entries.async_update_entry(
+        entry,
+        options={**entry.options, POLLING_TIME_STR: 45, MAX_IN_FLIGHT_STR: 2},
+    )
+    await hass.async_block_till_done()
+    reload.assert_not_called()
+    set_interval.assert_called_with(45)
+    assert hs_bridge.polling_interval == 45
+    assert hs_bridge.limiter.max_in_flight == 2
+    assert hass.data[DOMAIN][entry.entry_id] is hs_bridge
+    # Switching the polling mode keeps the entry loaded
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, POLLING_MODE_STR: POLLING_MODE_ADAPTIVE}
+    )
+    await hass.async_block_till_done()
+    reload.assert_not_called()
+    assert hs_bridge.adaptive_polling is not None
+    # Credentials require a reload
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, CONF_PASSWORD: "new-password"}
+    )
+    await hass.async_block_till_done()
+    reload.assert_called_once_with(entry.entry_id)
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.asyncio
+async def test_options_unchanged(mocked_entry, mocker):
+    """Ensure a stored token does not apply the options again."""
+    hass, entry, mocked_bridge = mocked_entry
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    hs_bridge = hass.data[DOMAIN][entry.entry_id]
+    reload = mocker.patch.object(hass.config_entries, "async_reload")
+    configure = mocker.spy(hs_bridge.limiter, "async_configure")
+    set_interval = mocker.spy(mocked_bridge, "set_polling_interval")
+    mocker.patch.object(
+        type(mocked_bridge),
+        "refresh_token",
+        new_callable=mocker.PropertyMock,
+        return_value="rotated-token",
+    )
+    hs_bridge._async_store_token()
+    await hass.async_block_till_done()
+    assert entry.data[CONF_TOKEN] == "rotated-token"
+    reload.assert_not_called()
+    configure.assert_not_called()
+    set_interval.assert_not_called()
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.asyncio
+async def test_options_dedicated_session_reload(mocked_entry, mocker):
+    """Ensure the dedicated session is resized by a reload."""
+    hass, entry, _ = mocked_entry
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, DEDICATED_SESSION_STR: True}
+    )
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    reload = mocker.patch.object(hass.config_entries, "async_reload")
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, POLLING_TIME_STR: 45}
+    )
+    await hass.async_block_till_done()
+    reload.assert_not_called()
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, MAX_IN_FLIGHT_STR: 2}
+    )
+    await hass.async_block_till_done()
+    reload.assert_called_once_with(entry.entry_id)
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
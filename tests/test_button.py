@@ -1,6 +1,8 @@
 """Test the integration for buttons correctly creates the debug files."""
 
 import contextlib
+import gzip
+import json
 import os
 from pathlib import Path
 from unittest.mock import AsyncMock
@@ -10,6 +12,8 @@ import pytest
 
 from custom_components.hubspace import button
 
+from .utils import create_devices_from_data, hs_raw_from_device
+
 EXPECTED_DIR: Path = Path(button.__file__.rsplit(os.sep, 1)[0])
 
 gen_debug = "button.hubspace_api_username_generate_debug"
@@ -59,3 +63,41 @@ async def test_press_button(entity_id, expected_file, mocked_entry, mocker):
     finally:
         with contextlib.suppress(Exception):
             Path(expected_path).unlink()
+
+
+@pytest.mark.parametrize(
+    "devices",
+    [[], [{"id": "cool", "states": [{"value": "on"}]}, {"id": "beans"}]],
+)
+@pytest.mark.parametrize("compress", [False, True])
+def test_write_dump(devices, compress, tmp_path):
+    """Ensure the streamed dump matches a regular JSON dump."""
+    path = button.dump_path(tmp_path / "_dump_raw.json", compress)
+    button.write_dump(path, devices, compress)
+    if compress:
+        assert path.name == "_dump_raw.json.gz"
+        with gzip.open(path, "rt") as fh:
+            contents = fh.read()
+    else:
+        contents = path.read_text()
+    assert contents == json.dumps(devices, indent=4)
+
+
+def test_anonymize_each_device():
+    """Ensure devices anonymized one at a time keep their relationships."""
+    devices = create_devices_from_data("fan-ZandraFan.json")
+    data = [hs_raw_from_device(device) for device in devices]
+    anonymized = list(button.anonymize_each_device(data))
+    assert len(anonymized) == len(devices)
+    original_ids = {device.id for device in devices} | {devices[0].device_id}
+    ids = {device["id"] for device in anonymized}
+    assert not ids & original_ids
+    # Every device keeps the same parent and the children point to the devices
+    assert len({device["device_id"] for device in anonymized}) == 1
+    fan, light, ceiling_fan = anonymized
+    assert set(ceiling_fan["children"]) == {fan["id"], light["id"]}
+    assert [device["friendly_name"] for device in anonymized] == [
+        "friendly-device-0",
+        "friendly-device-1",
+        "friendly-device-2",
+    ]
@@ -12,9 +12,13 @@ from homeassistant.components.climate import (
     HVACAction,
     HVACMode,
 )
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import callback
 from homeassistant.helpers import entity_registry as er
 import pytest
 
+from custom_components.hubspace import climate
+
 from .utils import create_devices_from_data, hs_raw_from_dump, modify_state
 
 thermostat = create_devices_from_data("thermostat.json")[0]
@@ -650,3 +654,43 @@ async def test_set_temperature_portable_ac(mocked_portable_ac_entity):
     assert entity is not None
     assert entity.state == HVACMode.DRY
     assert entity.attributes[ATTR_TEMPERATURE] == 25
+
+
+@pytest.mark.asyncio
+async def test_set_temperature_single_write(mocked_entity):
+    """Ensure set_temperature writes the state once."""
+    hass, _, _ = mocked_entity
+    writes = []
+
+    @callback
+    def state_changed(event):
+        if event.data["entity_id"] == thermostat_id:
+            writes.append(event)
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, state_changed)
+    await hass.services.async_call(
+        "climate",
+        "set_temperature",
+        {
+            "entity_id": thermostat_id,
+            ATTR_TEMPERATURE: 12,
+            ATTR_HVAC_MODE: HVACMode.COOL,
+        },
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    unsub()
+    assert len(writes) == 1
+
+
+def test_get_profile():
+    """Ensure thermostats with the same capabilities share a profile."""
+    profile = climate.get_profile(
+        frozenset({"heat", "off", "dehumidify"}), ("on", "auto"), 4, 30, 0.5
+    )
+    assert profile.hvac_modes == (HVACMode.HEAT, HVACMode.OFF, HVACMode.DRY)
+    assert profile.fan_modes == ("on", "auto")
+    assert profile is climate.get_profile(
+        frozenset({"off", "heat", "dehumidify"}), ("on", "auto"), 4, 30, 0.5
+    )
+    assert climate.HVAC_MODE_TO_HUBSPACE[HVACMode.HEAT_COOL] == "auto"
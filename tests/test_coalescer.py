@@ -0,0 +1,66 @@
+"""Test the state write coalescer."""
+
+from homeassistant.const import EVENT_STATE_CHANGED
+import pytest
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from custom_components.hubspace.coalescer import StateWriteCoalescer
+
+from .utils import create_devices_from_data
+
+light_a21 = create_devices_from_data("light-a21.json")[0]
+light_a21_id = "light.friendly_device_53_light"
+
+
+@pytest.mark.asyncio
+async def test_schedule_writes_once(hass, mocker):
+    """Ensure multiple updates for an entity result in a single write."""
+    coalescer = StateWriteCoalescer(hass)
+    entity = mocker.Mock()
+    coalescer.async_schedule(entity)
+    coalescer.async_schedule(entity)
+    assert coalescer.pending == 1
+    await hass.async_block_till_done()
+    entity.async_write_ha_state.assert_called_once()
+    assert coalescer.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_schedule_removed_entity(hass, mocker):
+    """Ensure entities removed from Home Assistant are not written."""
+    coalescer = StateWriteCoalescer(hass)
+    removed = mocker.Mock()
+    removed.hass = None
+    discarded = mocker.Mock()
+    coalescer.async_schedule(removed)
+    coalescer.async_schedule(discarded)
+    coalescer.async_discard(discarded)
+    await hass.async_block_till_done()
+    removed.async_write_ha_state.assert_not_called()
+    discarded.async_write_ha_state.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cancel(hass, mocker):
+    """Ensure pending writes are dropped when cancelled."""
+    coalescer = StateWriteCoalescer(hass)
+    entity = mocker.Mock()
+    coalescer.async_schedule(entity)
+    coalescer.async_cancel()
+    await hass.async_block_till_done()
+    entity.async_write_ha_state.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_state_skipped(mocked_entry):
+    """Ensure a poll without changes does not change the state."""
+    hass, entry, bridge = mocked_entry
+    await bridge.generate_devices_from_data([light_a21])
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    changes = async_capture_events(hass, EVENT_STATE_CHANGED)
+    await bridge.generate_devices_from_data([light_a21])
+    await hass.async_block_till_done()
+    assert [
+        event for event in changes if event.data["entity_id"] == light_a21_id
+    ] == []
@@ -0,0 +1,168 @@
+"""Test batching of commands sent to the Hubspace API."""
+
+import asyncio
+
+import pytest
+
+from custom_components.hubspace import commands
+
+
+class FakeController:
+    """Controller that records set_state calls."""
+
+    def __init__(self, side_effect=None, release=None):
+        """Initialize the controller."""
+        self.calls: list[dict] = []
+        self.side_effect = side_effect
+        # Keeps the requests in flight until set
+        self.release = release
+
+    async def set_state(self, **kwargs):
+        """Record the call."""
+        self.calls.append(kwargs)
+        if self.release:
+            await self.release.wait()
+        if self.side_effect:
+            raise self.side_effect
+        return len(self.calls)
+
+
+controller = FakeController()
+
+
+@pytest.mark.parametrize(
+    ("task", "args", "kwargs", "expected"),
+    [
+        (controller.set_state, (), {"device_id": "1"}, True),
+        # Positional arguments cannot be merged
+        (controller.set_state, ("1",), {}, False),
+        # Not targeting a device
+        (controller.set_state, (), {}, False),
+        # Not a controller of the API
+        (FakeController().set_state, (), {"device_id": "1"}, False),
+        (asyncio.sleep, (), {"device_id": "1"}, False),
+    ],
+)
+def test_is_batchable(task, args, kwargs, expected):
+    """Ensure only controller set_state calls are batched."""
+    assert commands.is_batchable(task, args, kwargs, [controller]) is expected
+
+
+def test_is_batchable_mocked(mocker):
+    """Ensure a mocked set_state is batched."""
+    mocked = FakeController()
+    mocker.patch.object(mocked, "set_state")
+    assert commands.is_batchable(mocked.set_state, (), {"device_id": "1"}, [mocked])
+
+
+def test_merge():
+    """Ensure later values override earlier ones."""
+    command = commands.PendingCommand(FakeController().set_state)
+    command.merge({"device_id": "1", "on": True, "brightness": 50, "numbers": {"a": 1}})
+    command.merge({"device_id": "1", "on": False, "brightness": None, "numbers": {"b": 2}})
+    assert command.kwargs == {
+        "device_id": "1",
+        "on": False,
+        "brightness": 50,
+        "numbers": {"a": 1, "b": 2},
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_set_state_merged(hass):
+    """Ensure calls sent while the device has a request in flight are merged."""
+    release = asyncio.Event()
+    controller = FakeController(release=release)
+    scheduler = commands.CommandScheduler(hass)
+    tasks = [
+        asyncio.create_task(scheduler.async_set_state(controller.set_state, **kwargs))
+        for kwargs in (
+            {"device_id": "1", "on": True},
+            {"device_id": "1", "brightness": 5},
+            {"device_id": "1", "on": False},
+            {"device_id": "2", "on": False},
+        )
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.pending == 1
+    release.set()
+    results = await asyncio.gather(*tasks)
+    assert results[1] == results[2]
+    assert len(set(results)) == 3
+    assert controller.calls == [
+        {"device_id": "1", "on": True},
+        {"device_id": "2", "on": False},
+        {"device_id": "1", "brightness": 5, "on": False},
+    ]
+    assert scheduler.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_async_set_state_immediate(hass):
+    """Ensure a call is sent without waiting when nothing is in flight."""
+    controller = FakeController()
+    scheduler = commands.CommandScheduler(hass)
+    assert await scheduler.async_set_state(controller.set_state, device_id="1") == 1
+    assert await scheduler.async_set_state(controller.set_state, device_id="1") == 2
+
+
+@pytest.mark.asyncio
+async def test_async_set_state_instances(hass):
+    """Ensure different instances of a device are not merged."""
+    release = asyncio.Event()
+    controller = FakeController(release=release)
+    scheduler = commands.CommandScheduler(hass)
+    tasks = [
+        asyncio.create_task(
+            scheduler.async_set_state(
+                controller.set_state, device_id="1", on=True, instance=instance
+            )
+        )
+        for instance in ("zone-1", "zone-2")
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.pending == 0
+    release.set()
+    await asyncio.gather(*tasks)
+    assert len(controller.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_set_state_error(hass):
+    """Ensure every merged caller receives the error."""
+    release = asyncio.Event()
+    controller = FakeController(side_effect=IndexError, release=release)
+    scheduler = commands.CommandScheduler(hass)
+    tasks = [
+        asyncio.create_task(
+            scheduler.async_set_state(controller.set_state, device_id="1", on=on)
+        )
+        for on in (True, False, True)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert len(controller.calls) == 2
+    assert all(isinstance(res, IndexError) for res in results)
+
+
+@pytest.mark.asyncio
+async def test_async_cancel(hass):
+    """Ensure commands queued behind a request are cancelled."""
+    release = asyncio.Event()
+    controller = FakeController(release=release)
+    scheduler = commands.CommandScheduler(hass)
+    sent = asyncio.create_task(
+        scheduler.async_set_state(controller.set_state, device_id="1", on=True)
+    )
+    queued = asyncio.create_task(
+        scheduler.async_set_state(controller.set_state, device_id="1", on=False)
+    )
+    await asyncio.sleep(0)
+    assert scheduler.pending == 1
+    scheduler.async_cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    release.set()
+    await sent
+    assert controller.calls == [{"device_id": "1", "on": True}]
@@ -345,6 +345,27 @@ async def test_HubspaceConfigFlow_async_step_user_reauth(
             },
             "polling_too_short",
         ),
+        # No requests allowed
+        (
+            {
+                "data": {CONF_USERNAME: "cool", CONF_PASSWORD: "beans"},
+                "options": {
+                    POLLING_TIME_STR: const.DEFAULT_POLLING_INTERVAL_SEC,
+                    CONF_TIMEOUT: const.DEFAULT_TIMEOUT,
+                },
+                "unique_id": "cool",
+            },
+            {
+                POLLING_TIME_STR: const.DEFAULT_POLLING_INTERVAL_SEC,
+                CONF_TIMEOUT: const.DEFAULT_TIMEOUT,
+                const.MAX_IN_FLIGHT_STR: 0,
+            },
+            {
+                POLLING_TIME_STR: const.DEFAULT_POLLING_INTERVAL_SEC,
+                CONF_TIMEOUT: const.DEFAULT_TIMEOUT,
+            },
+            "request_limit_invalid",
+        ),
     ],
 )
 async def test_HubspaceConfigFlow_async_step_options(
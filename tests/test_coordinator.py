@@ -0,0 +1,87 @@
+"""Test the coordination of the polls of every account."""
+
+import asyncio
+
+import pytest
+
+from custom_components.hubspace.const import DATA_POLL_COORDINATOR
+from custom_components.hubspace.coordinator import (
+    PollCoordinator,
+    async_get_poll_coordinator,
+)
+
+
+async def poll(coordinator, interval, starts, release, stagger=True):
+    """Poll and keep the slot until released."""
+    async with coordinator.async_poll(interval, stagger) as delay:
+        starts.append(delay)
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_polls_staggered(hass):
+    """Ensure polls of the accounts are spread over the interval."""
+    coordinator = PollCoordinator(hass, max_concurrent=2, max_delay=1)
+    unregister = coordinator.async_register("first")
+    coordinator.async_register("second")
+    assert coordinator.accounts == 2
+    starts = []
+    release = asyncio.Event()
+    release.set()
+    await asyncio.gather(
+        poll(coordinator, 0.2, starts, release),
+        poll(coordinator, 0.2, starts, release),
+    )
+    assert starts[0] < 50
+    assert starts[1] >= 90
+    unregister()
+    assert coordinator.accounts == 1
+
+
+@pytest.mark.asyncio
+async def test_polls_not_staggered(hass):
+    """Ensure a single account and polls outside the loop are not delayed."""
+    coordinator = PollCoordinator(hass, max_concurrent=2, max_delay=1)
+    coordinator.async_register("first")
+    starts = []
+    release = asyncio.Event()
+    release.set()
+    await asyncio.gather(
+        poll(coordinator, 0.2, starts, release),
+        poll(coordinator, 0.2, starts, release),
+    )
+    coordinator.async_register("second")
+    await asyncio.gather(
+        poll(coordinator, 0.2, starts, release, stagger=False),
+        poll(coordinator, 0.2, starts, release, stagger=False),
+    )
+    assert all(start < 50 for start in starts)
+
+
+@pytest.mark.asyncio
+async def test_polls_bounded(hass):
+    """Ensure polls above the concurrency wait on a free slot."""
+    coordinator = PollCoordinator(hass, max_concurrent=1, max_delay=0)
+    starts = []
+    release = asyncio.Event()
+    first = hass.async_create_task(poll(coordinator, 30, starts, release))
+    second = hass.async_create_task(poll(coordinator, 30, starts, release))
+    await asyncio.sleep(0.01)
+    assert len(starts) == 1
+    release.set()
+    await asyncio.wait_for(asyncio.gather(first, second), 1)
+    assert len(starts) == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_coordinator(hass):
+    """Ensure every account uses the same coordinator."""
+    coordinator = async_get_poll_coordinator(hass)
+    assert coordinator is async_get_poll_coordinator(hass)
+    unregister_first = coordinator.async_register("first")
+    unregister_second = coordinator.async_register("second")
+    unregister_first()
+    assert async_get_poll_coordinator(hass) is coordinator
+    # The coordinator is removed along with the last account
+    unregister_second()
+    assert DATA_POLL_COORDINATOR not in hass.data
@@ -0,0 +1,106 @@
+"""Test the device delta filter."""
+
+from aioafero import AferoState, EventType
+import pytest
+
+from custom_components.hubspace.delta import DeviceDeltaFilter, device_fingerprint
+
+from .utils import create_devices_from_data, modify_state
+
+light_a21_id = "light.friendly_device_53_light"
+
+
+def get_light(power: str = "on", update_time: int | None = None):
+    """Generate a light-a21 device with the given power state."""
+    light = create_devices_from_data("light-a21.json")[0]
+    modify_state(
+        light,
+        AferoState(
+            functionClass="power",
+            functionInstance=None,
+            value=power,
+            lastUpdateTime=update_time,
+        ),
+    )
+    return light
+
+
+def event_data(device) -> dict:
+    """Generate the data of an event for the device."""
+    return {"device_id": device.id, "device": device}
+
+
+def test_device_fingerprint():
+    """Ensure only the values of the states are fingerprinted."""
+    assert device_fingerprint(get_light("on", 1)) == device_fingerprint(
+        get_light("on", 2)
+    )
+    assert device_fingerprint(get_light("on")) != device_fingerprint(
+        get_light("off")
+    )
+
+
+@pytest.mark.parametrize(
+    ("first", "second", "expected"),
+    [
+        # Unchanged
+        (get_light("on"), get_light("on"), False),
+        # Only the update time changed
+        (get_light("on", 1), get_light("on", 2), False),
+        # Changed
+        (get_light("on"), get_light("off"), True),
+    ],
+)
+def test_should_forward(first, second, expected):
+    """Ensure unchanged updates are suppressed."""
+    delta = DeviceDeltaFilter()
+    assert delta.should_forward(EventType.RESOURCE_ADDED, event_data(first))
+    assert (
+        delta.should_forward(EventType.RESOURCE_UPDATED, event_data(second)) is expected
+    )
+    assert delta.suppressed == int(not expected)
+
+
+def test_should_forward_other_events():
+    """Ensure events without a device are always forwarded."""
+    delta = DeviceDeltaFilter()
+    assert delta.should_forward(EventType.INVALID_AUTH, None)
+    assert delta.should_forward(EventType.RESOURCE_UPDATED, {"device_id": "cool"})
+
+
+def test_deleted_and_invalidated():
+    """Ensure deleted and invalidated devices are forwarded again."""
+    delta = DeviceDeltaFilter()
+    light = get_light()
+    delta.should_forward(EventType.RESOURCE_UPDATED, event_data(light))
+    # Another device whose ID starts with the ID of the light
+    delta.async_invalidate(f"{light.id}-other")
+    assert not delta.should_forward(EventType.RESOURCE_UPDATED, event_data(light))
+    delta.async_invalidate(f"{light.id}-light-1", "light")
+    assert delta.should_forward(EventType.RESOURCE_UPDATED, event_data(light))
+    delta.async_invalidate(light.id)
+    assert delta.should_forward(EventType.RESOURCE_UPDATED, event_data(light))
+    assert delta.should_forward(EventType.RESOURCE_DELETED, event_data(light))
+    assert delta.should_forward(EventType.RESOURCE_UPDATED, event_data(light))
+
+
+@pytest.mark.asyncio
+async def test_unchanged_poll_not_forwarded(mocked_entry, mocker):
+    """Ensure entities are not updated when a poll did not change anything."""
+    hass, entry, bridge = mocked_entry
+    await bridge.generate_devices_from_data([get_light()])
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    hs_bridge = hass.data["hubspace"][entry.entry_id]
+    entity = hass.data["light"].get_entity(light_a21_id)
+    on_update = mocker.spy(entity, "on_update")
+    await bridge.generate_devices_from_data([get_light()])
+    await hass.async_block_till_done()
+    await bridge.generate_devices_from_data([get_light()])
+    await hass.async_block_till_done()
+    assert on_update.call_count == 1
+    assert hs_bridge.delta_filter.suppressed == 1
+    await bridge.generate_devices_from_data([get_light("off")])
+    await hass.async_block_till_done()
+    assert hass.states.get(light_a21_id).state == "off"
+    await bridge.close()
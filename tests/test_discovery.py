@@ -0,0 +1,42 @@
+"""Test the discovery of the entities of each platform."""
+
+from homeassistant.const import Platform
+import pytest
+
+from custom_components.hubspace.discovery import EntityDiscovery
+
+from .utils import create_devices_from_data
+
+fan_zandra = create_devices_from_data("fan-ZandraFan.json")
+transformer = create_devices_from_data("transformer.json")
+
+
+@pytest.mark.asyncio
+async def test_discovery(mocked_bridge, mocker):
+    """Ensure current and new resources are indexed by platform."""
+    await mocked_bridge.generate_devices_from_data(fan_zandra)
+    discovery = EntityDiscovery(mocked_bridge)
+    unsubscribes = discovery.async_setup()
+    assert {Platform.FAN, Platform.LIGHT} <= discovery.platforms
+    assert Platform.SWITCH not in discovery.platforms
+    fan = discovery.entities(Platform.FAN)[0]
+    assert fan.controller is mocked_bridge.fans
+    assert fan.resource.id == fan_zandra[0].id
+    assert fan.key is None
+
+    listener = mocker.Mock()
+    switch_listener = mocker.Mock()
+    discovery.async_add_listener(listener)
+    discovery.async_add_listener(switch_listener, Platform.SWITCH)
+    await mocked_bridge.generate_devices_from_data([*fan_zandra, *transformer])
+    assert Platform.SWITCH in discovery.platforms
+    assert {call.args[0] for call in listener.call_args_list} >= {
+        Platform.SWITCH,
+        Platform.SENSOR,
+    }
+    switch_listener.assert_called_once()
+    assert switch_listener.call_args.args[1] == discovery.entities(Platform.SWITCH)
+    sensors = discovery.entities(Platform.SENSOR)
+    assert {sensor.key for sensor in sensors} >= {"watts"}
+    for unsubscribe in unsubscribes:
+        unsubscribe()
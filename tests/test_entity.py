@@ -0,0 +1,129 @@
+"""Test the generic Hubspace entity."""
+
+from aioafero import AferoState
+from homeassistant.components.light import ATTR_BRIGHTNESS
+from homeassistant.exceptions import HomeAssistantError
+import pytest
+
+from custom_components.hubspace.const import EVENT_OPTIMISTIC_STATE_REVERTED
+from custom_components.hubspace.fan import HubspaceFan
+from custom_components.hubspace.light import HubspaceLight
+
+from .utils import create_devices_from_data, modify_state
+
+light_a21 = create_devices_from_data("light-a21.json")[0]
+light_a21_id = "light.friendly_device_53_light"
+
+
+@pytest.fixture
+async def mocked_entity(mocked_entry):
+    """Initialize a mocked Light and register it within Home Assistant."""
+    hass, entry, bridge = mocked_entry
+    await bridge.generate_devices_from_data([light_a21])
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    yield hass, entry, bridge
+    await bridge.close()
+
+
+def get_light_update(power: str) -> list:
+    """Generate a light-a21 poll with the given power state."""
+    light_update = create_devices_from_data("light-a21.json")[0]
+    modify_state(
+        light_update,
+        AferoState(functionClass="power", functionInstance=None, value=power),
+    )
+    return [light_update]
+
+
+@pytest.mark.asyncio
+async def test_optimistic_state_confirmed(mocked_entity):
+    """Ensure the optimistic state is shown and dropped once confirmed."""
+    hass, entry, bridge = mocked_entity
+    hs_bridge = hass.data["hubspace"][entry.entry_id]
+    await bridge.generate_devices_from_data(get_light_update("off"))
+    await hass.async_block_till_done()
+    assert hass.states.get(light_a21_id).state == "off"
+    await hass.services.async_call(
+        "light",
+        "turn_on",
+        {"entity_id": light_a21_id, ATTR_BRIGHTNESS: 64},
+        blocking=True,
+    )
+    assert hass.states.get(light_a21_id).state == "on"
+    assert hs_bridge.optimistic_tracker.pending == 1
+    await bridge.generate_devices_from_data(get_light_update("on"))
+    await hass.async_block_till_done()
+    assert hass.states.get(light_a21_id).state == "on"
+    assert hs_bridge.optimistic_tracker.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_optimistic_state_failed_command(mocked_entity, mocker):
+    """Ensure the optimistic state is reverted when the command fails."""
+    hass, _, bridge = mocked_entity
+    await bridge.generate_devices_from_data(get_light_update("off"))
+    await hass.async_block_till_done()
+    mocker.patch.object(bridge.lights, "set_state", side_effect=IndexError)
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            "light",
+            "turn_on",
+            {"entity_id": light_a21_id},
+            blocking=True,
+        )
+    await hass.async_block_till_done()
+    assert hass.states.get(light_a21_id).state == "off"
+
+
+@pytest.mark.asyncio
+async def test_optimistic_state_expired(mocked_entity, mocker):
+    """Ensure the optimistic state is reverted when it is not confirmed."""
+    hass, entry, bridge = mocked_entity
+    hs_bridge = hass.data["hubspace"][entry.entry_id]
+    await bridge.generate_devices_from_data(get_light_update("off"))
+    await hass.async_block_till_done()
+    mocker.patch.object(bridge.lights, "set_state")
+    reverted = []
+    hass.bus.async_listen(EVENT_OPTIMISTIC_STATE_REVERTED, reverted.append)
+    await hass.services.async_call(
+        "light",
+        "turn_on",
+        {"entity_id": light_a21_id},
+        blocking=True,
+    )
+    assert hass.states.get(light_a21_id).state == "on"
+    # The cloud disagrees but the optimistic value is kept until the timeout
+    await bridge.generate_devices_from_data(get_light_update("off"))
+    await hass.async_block_till_done()
+    assert hass.states.get(light_a21_id).state == "on"
+    entity = hass.data["light"].get_entity(light_a21_id)
+    hs_bridge.optimistic_tracker.async_untrack(entity)
+    entity.async_optimistic_state_expired()
+    await hass.async_block_till_done()
+    assert hass.states.get(light_a21_id).state == "off"
+    assert len(reverted) == 1
+    assert reverted[0].data == {"entity_id": light_a21_id, "attributes": ["is_on"]}
+
+
+@pytest.mark.asyncio
+async def test_device_context_shared(mocked_entry):
+    """Ensure the entities of a device share its context."""
+    hass, entry, bridge = mocked_entry
+    fan_zandra = create_devices_from_data("fan-ZandraFan.json")
+    await bridge.generate_devices_from_data(fan_zandra)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    hs_bridge = hass.data["hubspace"][entry.entry_id]
+    fan = HubspaceFan(hs_bridge, bridge.fans, bridge.fans[fan_zandra[0].id])
+    light = HubspaceLight(hs_bridge, bridge.lights, bridge.lights[fan_zandra[1].id])
+    assert fan.device_info is light.device_info
+    context = hs_bridge.device_contexts[fan_zandra[0].device_information.parent_id]
+    assert fan.device_info is context.device_info
+    assert context.identifiers == {("hubspace", context.parent_id)}
+    assert context.name == fan_zandra[0].device_information.name
+    assert fan.has_entity_name
+    resource_type = bridge.fans[fan_zandra[0].id].type.value
+    assert fan.logger is hs_bridge.logger.getChild(resource_type)
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -80,6 +80,22 @@ async def test_turn_on(mocked_entity):
     assert entity.attributes[ATTR_PRESET_MODE] is None
 
 
+@pytest.mark.asyncio
+async def test_turn_on_keeps_preset(mocked_entity, mocker):
+    """Ensure a plain turn_on does not show an optimistic preset."""
+    hass, _, bridge = mocked_entity
+    bridge.fans[fan_zandra_instance.id].on.on = False
+    entity = hass.data["fan"].get_entity(fan_zandra_entity_id)
+    set_optimistic = mocker.spy(entity, "async_set_optimistic_state")
+    await hass.services.async_call(
+        "fan",
+        "turn_on",
+        {"entity_id": fan_zandra_entity_id},
+        blocking=True,
+    )
+    set_optimistic.assert_called_once_with(is_on=True)
+
+
 @pytest.mark.asyncio
 async def test_turn_on_preset(mocked_entity):
     """Ensure the service call turn_on works as expected."""
@@ -0,0 +1,100 @@
+"""Test the limiter of the requests sent to the Hubspace API."""
+
+import asyncio
+
+import pytest
+
+from custom_components.hubspace.limiter import (
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    RequestLimiter,
+)
+
+
+async def hold_slot(limiter, priority, order, release):
+    """Take a slot and keep it until released."""
+    async with limiter.async_slot(priority):
+        order.append(priority)
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_commands_before_polls(hass, mocker):
+    """Ensure waiting commands are sent ahead of waiting polls."""
+    on_wait = mocker.Mock()
+    limiter = RequestLimiter(hass, 1, 100, on_wait)
+    order = []
+    release = asyncio.Event()
+    first = hass.async_create_task(hold_slot(limiter, PRIORITY_POLL, order, release))
+    await asyncio.sleep(0)
+    poll = hass.async_create_task(hold_slot(limiter, PRIORITY_POLL, order, release))
+    command = hass.async_create_task(
+        hold_slot(limiter, PRIORITY_COMMAND, order, release)
+    )
+    await asyncio.sleep(0)
+    assert limiter.in_flight == 1
+    assert limiter.waiting == 2
+    release.set()
+    await asyncio.wait_for(asyncio.gather(first, poll, command), 1)
+    assert order == [PRIORITY_POLL, PRIORITY_COMMAND, PRIORITY_POLL]
+    assert limiter.in_flight == 0
+    assert on_wait.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_rate_limit(hass):
+    """Ensure requests above the rate wait on the bucket."""
+    limiter = RequestLimiter(hass, 10, 20)
+    order = []
+    release = asyncio.Event()
+    release.set()
+    for _ in range(20):
+        await hold_slot(limiter, PRIORITY_COMMAND, order, release)
+    waiting = hass.async_create_task(
+        hold_slot(limiter, PRIORITY_COMMAND, order, release)
+    )
+    await asyncio.sleep(0)
+    assert limiter.waiting == 1
+    await asyncio.wait_for(waiting, 1)
+    assert len(order) == 21
+
+
+@pytest.mark.asyncio
+async def test_cancel(hass):
+    """Ensure cancelling releases the waiting requests and the timer."""
+    limiter = RequestLimiter(hass, 10, 1)
+    order = []
+    release = asyncio.Event()
+    release.set()
+    await hold_slot(limiter, PRIORITY_COMMAND, order, release)
+    waiting = hass.async_create_task(
+        hold_slot(limiter, PRIORITY_COMMAND, order, release)
+    )
+    await asyncio.sleep(0)
+    limiter.async_cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert limiter.waiting == 0
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_configure(hass):
+    """Ensure raising the limits releases the waiting requests."""
+    limiter = RequestLimiter(hass, 1, 10)
+    order = []
+    release = asyncio.Event()
+    first = hass.async_create_task(
+        hold_slot(limiter, PRIORITY_COMMAND, order, release)
+    )
+    second = hass.async_create_task(
+        hold_slot(limiter, PRIORITY_COMMAND, order, release)
+    )
+    await asyncio.sleep(0)
+    assert limiter.waiting == 1
+    limiter.async_configure(2, 10)
+    await asyncio.sleep(0)
+    assert limiter.in_flight == 2
+    assert limiter.waiting == 0
+    release.set()
+    await asyncio.wait_for(asyncio.gather(first, second), 1)
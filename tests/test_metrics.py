@@ -0,0 +1,108 @@
+"""Test the metrics collected by the bridge."""
+
+from homeassistant.helpers import entity_registry as er
+import pytest
+
+from custom_components.hubspace.const import DOMAIN
+from custom_components.hubspace.metrics import BridgeMetrics, RollingHistogram
+
+from .utils import create_devices_from_data
+
+light_a21 = create_devices_from_data("light-a21.json")[0]
+devices_per_poll = "sensor.hubspace_api_username_devices_per_poll"
+poll_latency = "sensor.hubspace_api_username_poll_latency"
+reauths = "sensor.hubspace_api_username_reauthentications"
+
+
+def test_histogram_percentile():
+    """Ensure the percentile reports the upper bound of its bucket."""
+    histogram = RollingHistogram(buckets=(10, 100, 1000), window=20)
+    assert histogram.percentile(95) is None
+    for _ in range(18):
+        histogram.add(5)
+    histogram.add(50)
+    histogram.add(500)
+    assert len(histogram) == 20
+    assert histogram.last == 500
+    assert histogram.percentile(50) == 10
+    assert histogram.percentile(95) == 100
+    assert histogram.percentile(100) == 1000
+
+
+def test_histogram_window():
+    """Ensure samples outside the window are dropped."""
+    histogram = RollingHistogram(buckets=(10, 100), window=3)
+    for value in (500, 500, 500, 5, 5, 5):
+        histogram.add(value)
+    assert len(histogram) == 3
+    assert histogram.percentile(100) == 10
+
+
+def test_histogram_overflow():
+    """Ensure samples above the largest bucket use that bucket."""
+    histogram = RollingHistogram(buckets=(10, 100), window=3)
+    histogram.add(1000)
+    assert histogram.percentile(95) == 100
+
+
+def test_bridge_metrics_poll(mocker):
+    """Ensure a poll records its events and notifies the listeners."""
+    metrics = BridgeMetrics()
+    listener = mocker.Mock()
+    remove = metrics.async_add_listener(listener)
+    metrics.async_poll_started(3)
+    metrics.async_event_emitted()
+    metrics.async_event_emitted()
+    metrics.async_poll_completed(42)
+    assert metrics.devices_per_poll == 3
+    assert metrics.events_per_poll == 2
+    assert metrics.poll_latency.last == 42
+    listener.assert_called_once()
+    # Commands are reported along with the next poll
+    metrics.async_command_completed(10)
+    listener.assert_called_once()
+    remove()
+    metrics.async_retry()
+    listener.assert_called_once()
+    assert metrics.retries == 1
+
+
+@pytest.mark.asyncio
+async def test_metric_sensors(mocked_entry):
+    """Ensure the metric sensors are attached to the hub and updated."""
+    hass, entry, bridge = mocked_entry
+    # The metric sensors are disabled by default
+    entity_reg = er.async_get(hass)
+    for key, entity_id in (
+        ("devices_per_poll", devices_per_poll),
+        ("poll_latency", poll_latency),
+        ("reauths", reauths),
+    ):
+        entity_reg.async_get_or_create(
+            "sensor",
+            DOMAIN,
+            f"username-{key}",
+            suggested_object_id=entity_id.removeprefix("sensor."),
+            config_entry=entry,
+        )
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entity_reg.async_get(
+        "sensor.hubspace_api_username_events_per_poll"
+    ).disabled
+    assert hass.states.get("sensor.hubspace_api_username_events_per_poll") is None
+    assert hass.states.get(reauths).state == "0"
+    await bridge.generate_devices_from_data([light_a21])
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert hass.states.get(devices_per_poll).state == "1"
+    assert float(hass.states.get(poll_latency).state) >= 0
+    hs_bridge = hass.data["hubspace"][entry.entry_id]
+    # The size is only measured while the payload sensor is enabled
+    assert hs_bridge.metrics.payload_bytes is None
+    untrack = hs_bridge.metrics.async_track_payload()
+    await bridge.generate_devices_from_data([light_a21])
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert hs_bridge.metrics.payload_bytes > 0
+    untrack()
+    assert not hs_bridge.metrics.measure_payload
+    await bridge.close()
@@ -0,0 +1,84 @@
+"""Test the adaptive polling scheduler."""
+
+import pytest
+
+from custom_components.hubspace.polling import AdaptivePollingScheduler
+
+
+@pytest.fixture
+def scheduler(hass, mocker):
+    """Create a scheduler with a 5 to 60 second interval."""
+    set_interval = mocker.Mock()
+    refresh = mocker.AsyncMock()
+    polling = AdaptivePollingScheduler(
+        hass, set_interval, refresh, 5, 60, burst_polls=2
+    )
+    yield polling, set_interval, refresh
+    polling.async_cancel()
+
+
+@pytest.mark.asyncio
+async def test_back_off_while_idle(scheduler):
+    """Ensure the interval doubles after the burst up to the maximum."""
+    polling, set_interval, _ = scheduler
+    polling.async_start()
+    intervals = []
+    for _ in range(8):
+        polling.async_poll_completed()
+        intervals.append(polling.interval)
+    assert intervals == [5, 5, 10, 20, 40, 60, 60, 60]
+    assert set_interval.call_args[0][0] == 60
+
+
+@pytest.mark.asyncio
+async def test_change_restarts_burst(scheduler):
+    """Ensure a detected change returns to the minimum interval."""
+    polling, _, refresh = scheduler
+    for _ in range(5):
+        polling.async_poll_completed()
+    assert polling.interval == 60
+    polling.async_change_detected()
+    polling.async_poll_completed()
+    assert polling.interval == 5
+    polling.async_poll_completed()
+    polling.async_poll_completed()
+    assert polling.interval == 10
+    # The polling loop picks up the new interval so no extra poll is needed
+    refresh.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_activity_polls_outside_loop(scheduler):
+    """Ensure a command requests a poll while the loop is backed off."""
+    polling, _, refresh = scheduler
+    for _ in range(5):
+        polling.async_poll_completed()
+    polling.async_activity()
+    assert polling.interval == 5
+    assert polling._refresh_handle is not None
+    polling._refresh_handle.cancel()
+    polling._async_refresh()
+    task = polling._refresh_task
+    await task
+    refresh.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_activity_at_minimum(scheduler):
+    """Ensure no extra poll is requested when the loop is already fast."""
+    polling, _, _ = scheduler
+    polling.async_start()
+    polling.async_poll_completed()
+    polling.async_activity()
+    assert polling._refresh_handle is None
+
+
+@pytest.mark.asyncio
+async def test_refresh_failure(scheduler):
+    """Ensure a failed poll outside the loop is logged and not raised."""
+    polling, _, refresh = scheduler
+    refresh.side_effect = ValueError("boom")
+    polling._async_refresh()
+    task = polling._refresh_task
+    await task
+    assert polling._refresh_task is None
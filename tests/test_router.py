@@ -0,0 +1,38 @@
+"""Test the routing of resource updates to the entities."""
+
+from aioafero import EventType
+
+from custom_components.hubspace.router import EventRouter
+
+
+def test_router(mocker):
+    """Ensure updates reach the handlers of the resource only."""
+    controller = mocker.Mock()
+    router = EventRouter()
+    first = mocker.Mock()
+    second = mocker.Mock()
+    other = mocker.Mock()
+    unregister_first = router.async_register(controller, "resource", first)
+    router.async_register(controller, "resource", second)
+    router.async_register(controller, "other", other)
+    controller.subscribe.assert_called_once()
+    dispatch = controller.subscribe.call_args.args[0]
+    assert controller.subscribe.call_args.kwargs == {
+        "event_filter": EventType.RESOURCE_UPDATED
+    }
+
+    resource = mocker.Mock(id="resource")
+    dispatch(EventType.RESOURCE_UPDATED, resource)
+    first.assert_called_once_with(EventType.RESOURCE_UPDATED, resource)
+    second.assert_called_once_with(EventType.RESOURCE_UPDATED, resource)
+    other.assert_not_called()
+
+    unregister_first()
+    dispatch(EventType.RESOURCE_UPDATED, resource)
+    assert first.call_count == 1
+    assert second.call_count == 2
+    # Unknown resources are ignored
+    dispatch(EventType.RESOURCE_UPDATED, mocker.Mock(id="unknown"))
+
+    router.async_clear()
+    controller.subscribe.return_value.assert_called_once()
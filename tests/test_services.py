@@ -1,16 +1,25 @@
 """Test the integration between Home Assistant Services and Afero devices."""
 
+import contextlib
+
 from aioafero import AferoState
+from homeassistant.exceptions import HomeAssistantError
 import pytest
 import voluptuous as vol
 
 from custom_components.hubspace import const, services
+from custom_components.hubspace.entity_index import async_get_entity_index
 
 from .utils import create_devices_from_data, modify_state
 
 fan_zandra = create_devices_from_data("fan-ZandraFan.json")
 fan_zandra_light = fan_zandra[1]
 fan_zandra_light_id = "light.friendly_device_2_light"
+fan_zandra_id = "fan.friendly_device_2_fan"
+debug_button_id = "button.hubspace_api_username_generate_debug"
+transformer = create_devices_from_data("transformer.json")
+transformer_zone_1_id = "switch.friendly_device_6_zone_1"
+transformer_zone_2_id = "switch.friendly_device_6_zone_2"
 
 
 @pytest.fixture
@@ -132,3 +141,207 @@ async def test_service_valid_no_username(
             await hass.async_block_till_done()
             if error_bridge:
                 assert f"No bridge using account {account}" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_service_profile(mocked_entity):
+    """Ensure the profile is written after the requested number of polls."""
+    hass, entry, bridge = mocked_entity
+    hs_bridge = hass.data[const.DOMAIN][entry.entry_id]
+    await hass.services.async_call(
+        const.DOMAIN,
+        services.SERVICE_PROFILE,
+        service_data={"polls": 2},
+        blocking=True,
+    )
+    profile_path = hs_bridge.profiler.path
+    with contextlib.suppress(FileNotFoundError):
+        profile_path.unlink()
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            const.DOMAIN,
+            services.SERVICE_PROFILE,
+            service_data={"polls": 2},
+            blocking=True,
+        )
+    try:
+        await bridge.generate_devices_from_data(fan_zandra)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert hs_bridge.profiler is not None
+        await bridge.generate_devices_from_data(fan_zandra)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert hs_bridge.profiler is None
+        assert profile_path.exists()
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            profile_path.unlink()
+
+
+@pytest.mark.asyncio
+async def test_service_multiple_entities(mocked_entity, caplog):
+    """Ensure every Hubspace entity is sent a command and others are skipped."""
+    hass, entry, bridge = mocked_entity
+    await hass.services.async_call(
+        const.DOMAIN,
+        services.SERVICE_SEND_COMMAND,
+        service_data={
+            "entity_id": [debug_button_id, fan_zandra_light_id, fan_zandra_id],
+            "value": "off",
+            "function_class": "power",
+            "function_instance": "light-power",
+        },
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    assert f"{debug_button_id} is not a loaded Hubspace entity" in caplog.text
+    device_ids = {
+        call.kwargs["json"]["metadeviceId"] for call in bridge.request.call_args_list
+    }
+    assert device_ids == {fan_zandra_light.id, fan_zandra[0].id}
+    # Entities are removed from the index when unloaded
+    assert async_get_entity_index(hass)
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert not async_get_entity_index(hass)
+
+
+@pytest.mark.asyncio
+async def test_service_multiple_states(mocked_entity):
+    """Ensure the states are grouped into one request per device."""
+    hass, _, bridge = mocked_entity
+    response = await hass.services.async_call(
+        const.DOMAIN,
+        services.SERVICE_SEND_COMMAND,
+        service_data={
+            "entity_id": [fan_zandra_light_id, fan_zandra_id, debug_button_id],
+            "function_class": "power",
+            "function_instance": "light-power",
+            "value": "off",
+            "states": [
+                {
+                    "function_class": "brightness",
+                    "value": "50",
+                },
+                {
+                    "function_class": "fan-speed",
+                    "function_instance": "fan-speed",
+                    "value": "fan-speed-6-016",
+                },
+            ],
+            "concurrency": 1,
+        },
+        blocking=True,
+        return_response=True,
+    )
+    await hass.async_block_till_done()
+    payloads = {
+        call.kwargs["json"]["metadeviceId"]: call.kwargs["json"]["values"]
+        for call in bridge.request.call_args_list
+    }
+    assert len(bridge.request.call_args_list) == 2
+    assert payloads[fan_zandra_light.id] == [
+        {
+            "functionClass": "power",
+            "functionInstance": "light-power",
+            "value": "off",
+        },
+        {
+            "functionClass": "brightness",
+            "functionInstance": None,
+            "value": "50",
+        },
+        {
+            "functionClass": "fan-speed",
+            "functionInstance": "fan-speed",
+            "value": "fan-speed-6-016",
+        },
+    ]
+    assert payloads[fan_zandra[0].id] == payloads[fan_zandra_light.id]
+    assert response == {
+        "results": {
+            debug_button_id: {
+                "success": False,
+                "error": "Not a loaded Hubspace entity",
+            },
+            fan_zandra_light_id: {"success": True},
+            fan_zandra_id: {"success": True},
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_service_failed_target(mocked_entity, caplog):
+    """Ensure a failed request is reported without affecting the others."""
+    hass, _, bridge = mocked_entity
+    send_request = bridge.request.side_effect
+
+    async def request(*args, **kwargs):
+        if kwargs["json"]["metadeviceId"] == fan_zandra_light.id:
+            raise ValueError("kaboom")
+        return await send_request(*args, **kwargs)
+
+    bridge.request.side_effect = request
+    response = await hass.services.async_call(
+        const.DOMAIN,
+        services.SERVICE_SEND_COMMAND,
+        service_data={
+            "entity_id": [fan_zandra_light_id, fan_zandra_id],
+            "states": [{"function_class": "power", "value": "off"}],
+            "concurrency": 1,
+        },
+        blocking=True,
+        return_response=True,
+    )
+    await hass.async_block_till_done()
+    assert response["results"][fan_zandra_light_id]["success"] is False
+    assert "kaboom" in response["results"][fan_zandra_light_id]["error"]
+    assert response["results"][fan_zandra_id] == {"success": True}
+    assert "Unable to send the command" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_service_instance_entities(mocked_entry):
+    """Ensure entities of a device instance target the device."""
+    hass, entry, bridge = mocked_entry
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    await bridge.generate_devices_from_data(transformer)
+    await bridge.async_block_until_done()
+    await hass.async_block_till_done()
+    response = await hass.services.async_call(
+        const.DOMAIN,
+        services.SERVICE_SEND_COMMAND,
+        service_data={
+            "entity_id": [transformer_zone_1_id, transformer_zone_2_id],
+            "value": "on",
+            "function_class": "toggle",
+            "function_instance": "zone-1",
+        },
+        blocking=True,
+        return_response=True,
+    )
+    await hass.async_block_till_done()
+    # The unique ID of the entity contains the instance but the request is
+    # sent once to the device
+    assert len(bridge.request.call_args_list) == 1
+    payload = bridge.request.call_args_list[0].kwargs["json"]
+    assert payload["metadeviceId"] == transformer[0].id
+    assert response == {
+        "results": {
+            transformer_zone_1_id: {"success": True},
+            transformer_zone_2_id: {"success": True},
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_service_requires_state(mocked_entity):
+    """Ensure a state is required."""
+    hass, _, _ = mocked_entity
+    with pytest.raises(vol.error.MultipleInvalid):
+        await hass.services.async_call(
+            const.DOMAIN,
+            services.SERVICE_SEND_COMMAND,
+            service_data={"entity_id": [fan_zandra_light_id]},
+            blocking=True,
+        )
@@ -0,0 +1,171 @@
+"""Test the bridge against the simulated Afero API."""
+
+import asyncio
+
+from aioafero.v1 import AferoBridgeV1
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_PASSWORD, CONF_TIMEOUT, CONF_TOKEN, CONF_USERNAME
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hubspace.const import (
+    DEFAULT_POLLING_INTERVAL_SEC,
+    DOMAIN,
+    POLLING_TIME_STR,
+    VERSION_MAJOR,
+    VERSION_MINOR,
+)
+
+from .simulator import (
+    ACCOUNT_ID,
+    REFRESH_TOKEN,
+    TOKEN_PATH,
+    AferoSimulator,
+    SimulatorConfig,
+    create_simulator_session,
+    start_simulator_server,
+)
+
+light_a21_id = "light.friendly_device_53_light"
+set_state_route = "/v1/accounts/{account_id}/metadevices/{device_id}/state"
+
+
+@pytest.fixture
+async def simulator():
+    """Serve a simulated account with a light and outlets."""
+    simulator = AferoSimulator(SimulatorConfig(seed=42))
+    simulator.load_dump("light-a21.json")
+    simulator.load_sample("outlets.json")
+    server = await start_simulator_server(simulator)
+    session = create_simulator_session(server)
+    yield simulator, session
+    await session.close()
+    await server.close()
+
+
+async def get_token(session) -> str:
+    """Get an access token from the simulator."""
+    async with session.post(
+        f"https://accounts.example.com{TOKEN_PATH}",
+        data={"grant_type": "refresh_token", "refresh_token": REFRESH_TOKEN},
+    ) as response:
+        assert response.status == 200
+        return (await response.json())["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_simulator_state_writes(simulator):
+    """Ensure writes are applied to the account and tokens expire."""
+    simulator, session = simulator
+    headers = {"Authorization": f"Bearer {await get_token(session)}"}
+    devices_url = f"https://api.example.com/v1/accounts/{ACCOUNT_ID}/metadevices"
+    async with session.get(devices_url, headers=headers) as response:
+        assert response.status == 200
+        assert len(await response.json()) == len(simulator.devices)
+    device_id = next(
+        device["id"]
+        for device in simulator.devices.values()
+        if device.get("description", {}).get("device", {}).get("deviceClass")
+        == "light"
+    )
+    async with session.put(
+        f"{devices_url}/{device_id}/state",
+        headers=headers,
+        json={
+            "metadeviceId": device_id,
+            "values": [{"functionClass": "power", "value": "off"}],
+        },
+    ) as response:
+        assert response.status == 200
+    assert simulator.get_state(device_id, "power") == "off"
+    simulator.expire_tokens()
+    async with session.get(devices_url, headers=headers) as response:
+        assert response.status == 401
+    assert simulator.stats.unauthorized == 1
+
+
+@pytest.mark.asyncio
+async def test_simulator_failures(simulator):
+    """Ensure the configured failures are returned."""
+    simulator, session = simulator
+    headers = {"Authorization": f"Bearer {await get_token(session)}"}
+    simulator.config.rate_limit_rate = 1
+    async with session.get(
+        "https://api.example.com/v1/users/me", headers=headers
+    ) as response:
+        assert response.status == 429
+        assert response.headers["Retry-After"] == "1"
+    simulator.config.rate_limit_rate = 0
+    simulator.config.error_rate = 1
+    async with session.get(
+        "https://api.example.com/v1/users/me", headers=headers
+    ) as response:
+        assert response.status == 503
+    assert simulator.stats.rate_limited == 1
+    assert simulator.stats.errors == 1
+
+
+@pytest.mark.asyncio
+async def test_bridge_polls_simulator(simulator):
+    """Ensure aioafero refreshes the token and polls the simulated account."""
+    simulator, session = simulator
+    api = AferoBridgeV1(
+        "username", "password", refresh_token=REFRESH_TOKEN, session=session
+    )
+    assert await api.get_account_id() == ACCOUNT_ID
+    data = await api.fetch_data()
+    assert len(data) == len(simulator.devices)
+    assert simulator.stats.token_refreshes == 1
+    # The poll succeeds once the expired token is refreshed
+    simulator.expire_tokens()
+    assert len(await api.fetch_data()) == len(simulator.devices)
+    assert simulator.stats.token_refreshes == 2
+
+
+@pytest.mark.asyncio
+async def test_integration_against_simulator(hass, simulator, mocker):
+    """Ensure the integration polls, sends commands and asks to log in again."""
+    simulator, session = simulator
+    mocker.patch("custom_components.hubspace.bridge.AUTH_REFRESH_RETRY_MIN_SEC", 0)
+    mocker.patch("custom_components.hubspace.bridge.AUTH_REFRESH_ATTEMPTS", 1)
+    mocker.patch(
+        "homeassistant.helpers.aiohttp_client.async_get_clientsession",
+        return_value=session,
+    )
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_USERNAME: "username",
+            CONF_PASSWORD: "password",
+            CONF_TOKEN: REFRESH_TOKEN,
+        },
+        options={
+            CONF_TIMEOUT: 30,
+            POLLING_TIME_STR: DEFAULT_POLLING_INTERVAL_SEC,
+        },
+        version=VERSION_MAJOR,
+        minor_version=VERSION_MINOR,
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.LOADED
+    assert hass.states.get(light_a21_id) is not None
+    # Commands are sent to the simulated account
+    await hass.services.async_call(
+        "light", "turn_off", {"entity_id": light_a21_id}, blocking=True
+    )
+    await hass.async_block_till_done()
+    assert simulator.stats.requests[set_state_route] == 1
+    # A revoked refresh token asks the user to log in again
+    hs_bridge = hass.data[DOMAIN][entry.entry_id]
+    start_reauth = mocker.patch.object(entry, "async_start_reauth")
+    simulator.revoke_refresh_tokens()
+    simulator.expire_tokens()
+    hs_bridge._async_auth_failed()
+    await asyncio.wait_for(hs_bridge._auth_refresh_task, 5)
+    start_reauth.assert_called_once_with(hass)
+    assert hs_bridge.metrics.reauths == 1
+    assert hass.states.get(light_a21_id) is not None
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
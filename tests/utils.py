@@ -1,5 +1,6 @@
 """Assists in executing tests by making it easy to load data dumps."""
 
+from dataclasses import replace
 import json
 import os
 from pathlib import Path
@@ -149,3 +150,30 @@ def modify_state(device: AferoDevice, new_state: AferoState):
             continue
         device.states[ind] = new_state
         break
+
+
+def clone_devices(devices: list[AferoDevice], count: int) -> list[AferoDevice]:
+    """Generate an account of the given size by cloning devices.
+
+    The devices are copied until the account reaches the given size. Each
+    copy receives fresh ids, including the ids of the children, so it is
+    tracked separately from the original devices.
+
+    :param devices: Devices to clone
+    :param count: Number of devices to generate
+    """
+    clones = []
+    for ind in range(count):
+        device = devices[ind % len(devices)]
+        copy = ind // len(devices)
+        clones.append(
+            replace(
+                device,
+                id=f"{device.id}-{copy}",
+                device_id=f"{device.device_id}-{copy}",
+                friendly_name=f"{device.friendly_name} {copy}",
+                states=list(device.states),
+                children=[f"{child}-{copy}" for child in device.children],
+            )
+        )
+    return clones